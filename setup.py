@@ -61,6 +61,9 @@ setup(
         ],
         'system': [
             'psutil==5.4.6'
+        ],
+        'loop': [
+            'uvloop==0.12.2'
         ]
     },
     entry_points={
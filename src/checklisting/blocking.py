@@ -0,0 +1,108 @@
+import asyncio
+import os
+from abc import abstractmethod
+from concurrent.futures import BrokenExecutor, Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+from checklisting.result import BaseTaskResult
+from checklisting.task import BaseTask
+
+R = TypeVar('R')
+
+DEFAULT_MAX_WORKERS = 8
+
+
+class BlockingTaskExecutor(object):
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS, timeout: Optional[float] = None) -> None:
+        assert max_workers > 0
+        assert timeout is None or timeout > 0
+        self._max_workers = max_workers
+        self._timeout = timeout
+        self._pool: Optional[Executor] = None
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    @property
+    def timeout(self) -> Optional[float]:
+        return self._timeout
+
+    def _create_pool(self) -> Executor:
+        return ThreadPoolExecutor(self._max_workers, 'checklisting-blocking')
+
+    def _get_pool(self) -> Executor:
+        if self._pool is None:
+            self._pool = self._create_pool()
+        return self._pool
+
+    async def run(self, name: str, fn: Callable[..., R], *args: Any) -> R:
+        future = asyncio.get_event_loop().run_in_executor(self._get_pool(), fn, *args)
+        try:
+            if self._timeout is None:
+                return await future
+            return await asyncio.wait_for(future, self._timeout)
+        except asyncio.TimeoutError:
+            # running call cannot be interrupted, it is only abandoned and keeps its worker until it returns
+            raise RuntimeError(f'Blocking call of task [{name}] timed out after [{self._timeout}] seconds')
+        except BrokenExecutor:
+            # e.g. worker process was killed; following calls get a fresh pool
+            self._pool = None
+            raise
+
+    def shutdown(self, wait: bool = True) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait)
+            self._pool = None
+
+
+class ProcessPoolTaskExecutor(BlockingTaskExecutor):
+
+    # function and its arguments are pickled to reach worker process, so they have to be defined on module level
+    def __init__(self, max_workers: Optional[int] = None, timeout: Optional[float] = None) -> None:
+        super().__init__(max_workers or os.cpu_count() or 1, timeout)
+
+    def _create_pool(self) -> Executor:
+        return ProcessPoolExecutor(self._max_workers)
+
+
+_default_executor = BlockingTaskExecutor()
+_default_process_executor = ProcessPoolTaskExecutor()
+
+
+def get_default_blocking_executor() -> BlockingTaskExecutor:
+    return _default_executor
+
+
+def set_default_blocking_executor(executor: BlockingTaskExecutor) -> None:
+    global _default_executor
+    _default_executor.shutdown(False)
+    _default_executor = executor
+
+
+def get_default_process_executor() -> ProcessPoolTaskExecutor:
+    # worker processes are started on first use only
+    return _default_process_executor
+
+
+def set_process_blocking_executor(max_workers: Optional[int], timeout: Optional[float]) -> None:
+    set_default_blocking_executor(BlockingTaskExecutor(max_workers or DEFAULT_MAX_WORKERS, timeout or None))
+
+
+class BlockingTask(BaseTask):
+
+    # body of the task is run in a thread pool, so slow syscalls do not stall the event loop
+    def __init__(self, executor: Optional[BlockingTaskExecutor] = None) -> None:
+        super().__init__()
+        self._executor = executor
+
+    def _get_executor(self) -> BlockingTaskExecutor:
+        return self._executor or get_default_blocking_executor()
+
+    async def _execute(self) -> BaseTaskResult:
+        return await self._get_executor().run(self.__class__.__name__, self._execute_blocking)
+
+    @abstractmethod
+    def _execute_blocking(self) -> BaseTaskResult:
+        pass
@@ -0,0 +1,151 @@
+import asyncio
+import time
+from enum import Enum, auto
+from typing import Awaitable, Callable, Dict, Optional
+
+from checklisting.deadline import get_remaining_time
+from checklisting.result import BaseTaskResult, TaskResult
+from checklisting.result.status import TaskResultStatus
+
+DEFAULT_COOLDOWN = 30.0
+
+
+class CircuitState(Enum):
+    CLOSED = auto()
+    OPEN = auto()
+    HALF_OPEN = auto()
+
+
+class CircuitBreaker(object):
+
+    def __init__(self,
+                 failure_threshold: int,
+                 cooldown: float = DEFAULT_COOLDOWN,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        assert failure_threshold > 0
+        assert cooldown > 0
+        self._failure_threshold = failure_threshold
+        self._cooldown = cooldown
+        self._clock = clock
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+
+    @property
+    def state(self) -> CircuitState:
+        return self._state
+
+    @property
+    def failures(self) -> int:
+        return self._failures
+
+    def get_remaining_cooldown(self) -> float:
+        return max(self._opened_at + self._cooldown - self._clock(), 0.0)
+
+    def allow(self) -> bool:
+        if self._state is CircuitState.OPEN and self.get_remaining_cooldown() == 0:
+            self._state = CircuitState.HALF_OPEN
+        if self._state is CircuitState.CLOSED:
+            return True
+        # once cool-down passes a single call probes whether endpoint recovered
+        if self._state is CircuitState.HALF_OPEN and not self._probing:
+            self._probing = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._state is CircuitState.HALF_OPEN or self._failures >= self._failure_threshold:
+            self._state = CircuitState.OPEN
+            self._opened_at = self._clock()
+        self._probing = False
+
+    def record_cancellation(self) -> None:
+        # outcome of cancelled call is unknown, so let another call probe instead
+        self._probing = False
+
+
+class CircuitBreakerRegistry(object):
+
+    def __init__(self,
+                 failure_threshold: int = 5,
+                 cooldown: float = DEFAULT_COOLDOWN,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        assert failure_threshold > 0
+        assert cooldown > 0
+        self._failure_threshold = failure_threshold
+        self._cooldown = cooldown
+        self._clock = clock
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def get(self, key: str) -> CircuitBreaker:
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            breaker = CircuitBreaker(self._failure_threshold, self._cooldown, self._clock)
+            self._breakers[key] = breaker
+        return breaker
+
+    async def execute(self, key: str, attempt: Callable[[], Awaitable[BaseTaskResult]]) -> BaseTaskResult:
+        breaker = self.get(key)
+        if not breaker.allow():
+            return TaskResult(
+                TaskResultStatus.FAILURE, f'Circuit for [{key}] is open after [{breaker.failures}] failures, ' +
+                f'next probe in [{breaker.get_remaining_cooldown():.3f}] seconds')
+
+        # call hanging until the deadline is a failure of the endpoint, not a cancellation by the caller
+        timeout = get_remaining_time()
+        started = self._clock()
+        try:
+            result = await (attempt() if timeout is None else asyncio.wait_for(attempt(), timeout))
+        except asyncio.TimeoutError:
+            breaker.record_failure()
+            return TaskResult(TaskResultStatus.FAILURE,
+                              f'Call to [{key}] timed out after [{self._clock() - started:.3f}] seconds')
+        except asyncio.CancelledError:
+            if timeout is not None and get_remaining_time() == 0:
+                breaker.record_failure()
+            else:
+                breaker.record_cancellation()
+            raise
+        except Exception:
+            breaker.record_failure()
+            raise
+        # endpoint that answered is up, even if its answer was found to be a failure (e.g. a failing disk reported by
+        # an agent), which must not be hidden behind an open circuit; retryable ones are raised as TransientError
+        breaker.record_success()
+        return result
+
+
+_default_circuit_breakers: Optional[CircuitBreakerRegistry] = None
+
+
+def get_default_circuit_breakers() -> Optional[CircuitBreakerRegistry]:
+    return _default_circuit_breakers
+
+
+def set_default_circuit_breakers(circuit_breakers: Optional[CircuitBreakerRegistry]) -> None:
+    global _default_circuit_breakers
+    _default_circuit_breakers = circuit_breakers
+
+
+def set_process_circuit_breakers(failure_threshold: Optional[int], cooldown: Optional[float] = None) -> None:
+    if failure_threshold:
+        set_default_circuit_breakers(CircuitBreakerRegistry(failure_threshold, cooldown or DEFAULT_COOLDOWN))
+    else:
+        set_default_circuit_breakers(None)
+
+
+async def execute_guarded(key: str,
+                          attempt: Callable[[], Awaitable[BaseTaskResult]],
+                          circuit_breakers: Optional[CircuitBreakerRegistry] = None) -> BaseTaskResult:
+    # calls are guarded by process wide circuit breakers, unless given other ones; there are none by default
+    circuit_breakers = circuit_breakers or get_default_circuit_breakers()
+    if circuit_breakers is None:
+        return await attempt()
+    return await circuit_breakers.execute(key, attempt)
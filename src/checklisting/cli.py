@@ -1,10 +1,13 @@
 import argparse
 import logging
 import sys
-from typing import Dict
+from typing import Dict, Optional
 
-from checklisting.runner import BaseRunnerFactory
+from checklisting.loop import LOOP_IMPLEMENTATIONS
+from checklisting.profiling import PROFILERS, create_profiler
+from checklisting.runner import BaseRunner, BaseRunnerFactory
 from checklisting.runner.cli import CliRunnerFactory
+from checklisting.runner.diff import DiffRunnerFactory
 from checklisting.runner.external import ExternalChecklistRunnerFactory
 from checklisting.runner.webserver import WebserverRunnerFactory
 
@@ -32,22 +35,64 @@ class ChecklistingDispatcher(object):
         # TODO: possibly allow runner factories to add own options. For now this is fine.
         p.add_argument('--config', type=str, help='path to configuration file')
         p.add_argument('--debug', action='store_true', help='turn on debugging')
+        p.add_argument('--timeout', type=float, help='time limit (in seconds) for executing checklists')
+        p.add_argument('--workers', type=int, help='number of processes to spread checklists across (cli action only)')
         p.add_argument('-s', '--source', '--sources', dest='sources', type=str, nargs='*', action='append')
+        p.add_argument('--sources-file',
+                       type=str,
+                       help='file with external sources to checklist one by one, one or more per line; ' +
+                       '- for stdin')
+        p.add_argument('--max-concurrency',
+                       type=int,
+                       help='maximum number of external sources checked at once when reading them from file; ' +
+                       'actual number adapts to their latency')
+        p.add_argument('--hedge-delay',
+                       type=float,
+                       help='send second request to external source not responding within given time (in seconds); ' +
+                       'once enough responses are observed, their 95th percentile latency is used instead')
+        p.add_argument('--old', type=str, help='JSON file with results to compare from (diff action only)')
+        p.add_argument('--new', type=str, help='JSON file with results to compare to (diff action only)')
+        p.add_argument('--loop',
+                       type=str,
+                       choices=LOOP_IMPLEMENTATIONS,
+                       help='event loop implementation; auto uses uvloop when installed')
+        p.add_argument('--profile', type=str, choices=sorted(PROFILERS.keys()), help='profile the run')
+        p.add_argument('--profile-output',
+                       type=str,
+                       help='path to write profile to; pstats file for cprofile, collapsed stacks for sampling')
         return p
 
     def run(self) -> None:
         (args, remaining) = self.get_parser().parse_known_args()
         setup_logger(args.debug)
         try:
-            self._runner_factories[args.action].provide(args).run()
+            runner = self._runner_factories[args.action].provide(args)
         except KeyError:
             raise RuntimeError(f'Unknown action [{args.action}]')
 
+        if args.profile:
+            self._run_profiled(runner, args.profile, args.profile_output)
+        else:
+            runner.run()
+
+    def _run_profiled(self, runner: BaseRunner, profiler_name: str, output: Optional[str]) -> None:
+        profiler = create_profiler(profiler_name)
+        with profiler:
+            runner.run()
+
+        output = output or profiler.DEFAULT_OUTPUT
+        profiler.dump(output)
+        logger = logging.getLogger('checklisting.profiling')
+        for line in profiler.report().splitlines():
+            logger.info(line)
+        logger.info(f'Profile written to [{output}]')
+
 
 def main() -> None:
     dispatcher = ChecklistingDispatcher(
         WebserverRunnerFactory(),
         CliRunnerFactory(),
-        ExternalChecklistRunnerFactory()
+        ExternalChecklistRunnerFactory(),
+        DiffRunnerFactory()
     )
     dispatcher.run()
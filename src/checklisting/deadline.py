@@ -0,0 +1,33 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+_deadline: ContextVar[Optional[float]] = ContextVar('checklisting_deadline', default=None)
+
+
+def get_deadline() -> Optional[float]:
+    return _deadline.get()
+
+
+def get_remaining_time() -> Optional[float]:
+    deadline = get_deadline()
+    if deadline is None:
+        return None
+    return max(deadline - time.monotonic(), 0.0)
+
+
+@contextmanager
+def deadline_scope(timeout: Optional[float], detached: bool = False) -> Iterator[Optional[float]]:
+    # detached scope ignores deadline of the caller, e.g. for work done in background on behalf of many callers
+    deadline = None if detached else get_deadline()
+    if timeout is not None:
+        new_deadline = time.monotonic() + timeout
+        if deadline is None or new_deadline < deadline:
+            deadline = new_deadline
+
+    token = _deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _deadline.reset(token)
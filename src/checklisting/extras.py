@@ -8,6 +8,7 @@ _EXTRAS = {
     'aiohttp': 'web',
     'yarl': 'web',
     'psutil': 'system',
+    'uvloop': 'loop',
 }
 
 _MODULES: Dict[str, ModuleType] = {}
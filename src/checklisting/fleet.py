@@ -0,0 +1,128 @@
+import asyncio
+import time
+from collections import Counter
+from logging import getLogger
+from typing import AsyncIterator, Awaitable, Callable, Generic, Optional, Set, TypeVar
+
+from checklisting.hedging import LatencyTracker
+from checklisting.result import BaseTaskResult, TaskResult
+from checklisting.result.status import TaskResultStatus
+
+S = TypeVar('S')
+
+logger = getLogger(__name__)
+
+DEFAULT_INITIAL_CONCURRENCY = 16
+DEFAULT_MAX_CONCURRENCY = 256
+
+
+class AdaptiveConcurrencyLimit(object):
+
+    # limit grows by one per window of responses as long as latency stays within tolerance of the baseline (10th
+    # percentile of recent latencies); once it does not, the limit is cut by backoff, at most once per window
+    def __init__(self,
+                 initial: int = DEFAULT_INITIAL_CONCURRENCY,
+                 minimum: int = 1,
+                 maximum: int = DEFAULT_MAX_CONCURRENCY,
+                 tolerance: float = 2.0,
+                 backoff: float = 0.5,
+                 tracker: Optional[LatencyTracker] = None) -> None:
+        assert 0 < minimum <= initial <= maximum
+        assert tolerance > 1
+        assert 0 < backoff < 1
+        self._limit = float(initial)
+        self._minimum = minimum
+        self._maximum = maximum
+        self._tolerance = tolerance
+        self._backoff = backoff
+        self._tracker = tracker or LatencyTracker()
+        self._since_decrease = 0
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    def record(self, latency: float) -> None:
+        self._tracker.record('', latency)
+        baseline = self._tracker.get_percentile(0.1)
+        assert baseline is not None
+        self._since_decrease += 1
+        if latency > baseline * self._tolerance:
+            if self._since_decrease >= self._limit:
+                self._limit = max(float(self._minimum), self._limit * self._backoff)
+                self._since_decrease = 0
+        else:
+            self._limit = min(float(self._maximum), self._limit + 1 / self._limit)
+
+
+class FleetSummary(object):
+
+    def __init__(self) -> None:
+        self._statuses: Counter = Counter()
+
+    @property
+    def total(self) -> int:
+        return sum(self._statuses.values())
+
+    def record(self, result: BaseTaskResult) -> None:
+        self._statuses[result.status] += 1
+
+    def describe(self) -> str:
+        counts = ', '.join(f'{status}=[{count}]'
+                           for (status, count) in sorted(self._statuses.items(), key=lambda item: -item[0].value))
+        return f'[{self.total}] sources checked' + (f': {counts}' if counts else '')
+
+    def to_result(self) -> BaseTaskResult:
+        status = max(self._statuses, key=lambda status: status.value, default=TaskResultStatus.UNKNOWN)
+        return TaskResult(status, f'Fleet: {self.describe()}')
+
+
+class FleetExecutor(Generic[S]):
+
+    # only sources being checked are kept in memory; each result is handed over as soon as it is known and only
+    # counted afterwards, so memory does not grow with size of the fleet
+    def __init__(self,
+                 concurrency_limit: Optional[AdaptiveConcurrencyLimit] = None,
+                 progress_interval: float = 10.0,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        assert progress_interval > 0
+        self._concurrency_limit = concurrency_limit or AdaptiveConcurrencyLimit()
+        self._progress_interval = progress_interval
+        self._clock = clock
+
+    async def _execute(self, source: S, execute: Callable[[S], Awaitable[BaseTaskResult]]) -> BaseTaskResult:
+        started = self._clock()
+        result = await execute(source)
+        self._concurrency_limit.record(self._clock() - started)
+        return result
+
+    async def run(self,
+                  sources: AsyncIterator[S],
+                  execute: Callable[[S], Awaitable[BaseTaskResult]],
+                  on_result: Callable[[BaseTaskResult], None]) -> FleetSummary:
+        summary = FleetSummary()
+        pending: Set[asyncio.Future] = set()
+        reported_at = self._clock()
+
+        async def collect() -> None:
+            nonlocal pending, reported_at
+            (done, pending) = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                on_result(future.result())
+                summary.record(future.result())
+            if self._clock() - reported_at >= self._progress_interval:
+                reported_at = self._clock()
+                logger.info(f'{summary.describe()}; [{len(pending)}] in progress, ' +
+                            f'concurrency limit is [{self._concurrency_limit.limit}]')
+
+        try:
+            async for source in sources:
+                while len(pending) >= self._concurrency_limit.limit:
+                    await collect()
+                pending.add(asyncio.ensure_future(self._execute(source, execute)))
+            while pending:
+                await collect()
+        finally:
+            for future in pending:
+                future.cancel()
+        return summary
@@ -0,0 +1,106 @@
+import asyncio
+from collections import deque
+from typing import Callable, Dict, Iterable, List, Optional
+
+from checklisting.result import BaseTaskResult, TaskResult
+from checklisting.result.builder import MultiTaskResultBuilder
+from checklisting.result.status import TaskResultStatus
+from checklisting.task import BaseTask, BaseTaskScheduler, MultiTask, WrapperTask
+
+
+def is_prerequisite_satisfied(result: BaseTaskResult) -> bool:
+    return result.status not in (TaskResultStatus.FAILURE, TaskResultStatus.UNKNOWN)
+
+
+class DependentTask(WrapperTask):
+
+    # executed outside of TaskGraph prerequisites are simply ignored
+    def __init__(self, task: BaseTask, requires: Iterable[BaseTask]) -> None:
+        super().__init__(task)
+        self._requires = list(requires)
+
+    @property
+    def requires(self) -> List[BaseTask]:
+        return self._requires
+
+
+def _unwrap(task: BaseTask) -> BaseTask:
+    if isinstance(task, DependentTask):
+        return task.task
+    return task
+
+
+def _name(task: BaseTask) -> str:
+    return _unwrap(task).__class__.__name__
+
+
+class TaskGraph(MultiTask):
+
+    def __init__(self,
+                 tasks: Iterable[BaseTask],
+                 result_builder: Optional[MultiTaskResultBuilder] = None,
+                 scheduler: Optional[BaseTaskScheduler] = None,
+                 is_satisfied: Callable[[BaseTaskResult], bool] = is_prerequisite_satisfied) -> None:
+        self._graph_tasks = list(tasks)
+        super().__init__(self._graph_tasks, result_builder, scheduler)
+        self._is_satisfied = is_satisfied
+        self._prerequisites = self._resolve_prerequisites(self._graph_tasks)
+        self._order = self._sort(self._prerequisites)
+
+    @staticmethod
+    def _resolve_prerequisites(tasks: List[BaseTask]) -> List[List[int]]:
+        positions: Dict[int, int] = {}
+        for (idx, task) in enumerate(tasks):
+            positions[id(task)] = idx
+            positions[id(_unwrap(task))] = idx
+
+        prerequisites: List[List[int]] = []
+        for task in tasks:
+            requires = task.requires if isinstance(task, DependentTask) else []
+            try:
+                prerequisites.append([positions[id(required)] for required in requires])
+            except KeyError:
+                raise RuntimeError(f'Prerequisite of task [{_name(task)}] is not part of the graph')
+        return prerequisites
+
+    @staticmethod
+    def _sort(prerequisites: List[List[int]]) -> List[int]:
+        dependants: List[List[int]] = [[] for _ in prerequisites]
+        missing = [len(required) for required in prerequisites]
+        for (idx, required) in enumerate(prerequisites):
+            for required_idx in required:
+                dependants[required_idx].append(idx)
+
+        queue = deque(idx for (idx, count) in enumerate(missing) if count == 0)
+        order: List[int] = []
+        while queue:
+            idx = queue.popleft()
+            order.append(idx)
+            for dependant_idx in dependants[idx]:
+                missing[dependant_idx] -= 1
+                if missing[dependant_idx] == 0:
+                    queue.append(dependant_idx)
+
+        if len(order) != len(prerequisites):
+            raise RuntimeError('Dependencies between tasks contain a cycle')
+        return order
+
+    async def _run(self, scheduler: BaseTaskScheduler) -> List[BaseTaskResult]:
+        futures: Dict[int, asyncio.Future] = {}
+        # prerequisites are always started before tasks depending on them
+        for idx in self._order:
+            futures[idx] = asyncio.ensure_future(
+                self._run_task(scheduler, idx, [futures[required_idx] for required_idx in self._prerequisites[idx]]))
+        return list(await asyncio.gather(*[futures[idx] for idx in range(len(self._graph_tasks))]))
+
+    async def _run_task(self, scheduler: BaseTaskScheduler, idx: int,
+                        prerequisites: List[asyncio.Future]) -> BaseTaskResult:
+        task = self._graph_tasks[idx]
+        for (required_idx, prerequisite) in zip(self._prerequisites[idx], prerequisites):
+            if not self._is_satisfied(await prerequisite):
+                result = TaskResult(
+                    TaskResultStatus.UNKNOWN, f'Task [{_name(task)}] skipped, as its prerequisite ' +
+                    f'[{_name(self._graph_tasks[required_idx])}] was not satisfied')
+                self._stream_skipped(idx, result)
+                return result
+        return await self._schedule(scheduler, idx, _unwrap(task))
@@ -0,0 +1,105 @@
+import asyncio
+import math
+import time
+from collections import OrderedDict, deque
+from logging import getLogger
+from typing import Awaitable, Callable, Deque, Optional
+
+from checklisting.result import BaseTaskResult
+
+logger = getLogger(__name__)
+
+
+class LatencyTracker(object):
+
+    # latencies of at most max_keys sources are kept, those of the least recently recorded one are dropped first
+    def __init__(self, window: int = 100, max_keys: int = 1024) -> None:
+        assert window > 0
+        assert max_keys > 0
+        self._window = window
+        self._max_keys = max_keys
+        self._latencies: 'OrderedDict[str, Deque[float]]' = OrderedDict()
+        self._all_latencies: Deque[float] = deque(maxlen=window)
+
+    def record(self, key: str, latency: float) -> None:
+        if key not in self._latencies:
+            self._latencies[key] = deque(maxlen=self._window)
+            while len(self._latencies) > self._max_keys:
+                self._latencies.popitem(last=False)
+        else:
+            self._latencies.move_to_end(key)
+        self._latencies[key].append(latency)
+        self._all_latencies.append(latency)
+
+    def count(self, key: Optional[str] = None) -> int:
+        if key is None:
+            return len(self._all_latencies)
+        return len(self._latencies.get(key, ()))
+
+    def get_percentile(self, percentile: float, key: Optional[str] = None) -> Optional[float]:
+        latencies = self._all_latencies if key is None else self._latencies.get(key)
+        if not latencies:
+            return None
+        ordered = sorted(latencies)
+        return ordered[max(math.ceil(percentile * len(ordered)) - 1, 0)]
+
+
+class HedgingPolicy(object):
+
+    # without enough observations of the source, those of all sources are used and then default_delay, if any
+    def __init__(self,
+                 percentile: float = 0.95,
+                 min_samples: int = 5,
+                 default_delay: Optional[float] = None,
+                 tracker: Optional[LatencyTracker] = None) -> None:
+        assert 0 < percentile <= 1
+        assert min_samples > 0
+        assert default_delay is None or default_delay > 0
+        self._percentile = percentile
+        self._min_samples = min_samples
+        self._default_delay = default_delay
+        self._tracker = tracker or LatencyTracker()
+
+    @property
+    def tracker(self) -> LatencyTracker:
+        return self._tracker
+
+    def get_delay(self, key: str) -> Optional[float]:
+        if self._tracker.count(key) >= self._min_samples:
+            return self._tracker.get_percentile(self._percentile, key)
+        if self._tracker.count() >= self._min_samples:
+            return self._tracker.get_percentile(self._percentile)
+        return self._default_delay
+
+    async def _timed(self, key: str, call: Callable[[], Awaitable[BaseTaskResult]]) -> BaseTaskResult:
+        started = time.monotonic()
+        result = await call()
+        self._tracker.record(key, time.monotonic() - started)
+        return result
+
+    async def execute(self, key: str, call: Callable[[], Awaitable[BaseTaskResult]]) -> BaseTaskResult:
+        delay = self.get_delay(key)
+        primary = asyncio.ensure_future(self._timed(key, call))
+        if delay is None:
+            return await primary
+
+        pending = {primary}
+        try:
+            (done, _) = await asyncio.wait(pending, timeout=delay)
+            if not done:
+                logger.debug(f'No response from [{key}] within [{delay:.3f}] seconds, sending hedged request')
+                pending.add(asyncio.ensure_future(self._timed(key, call)))
+
+            # first successful response wins; failed one is only used if the other request fails too
+            error: Optional[BaseException] = None
+            while pending:
+                (done, pending) = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    if future.exception() is None:
+                        return future.result()
+                    error = future.exception()
+            assert error is not None
+            raise error
+        finally:
+            for future in pending:
+                future.cancel()
@@ -0,0 +1,187 @@
+import asyncio
+import math
+import os
+import sys
+import threading
+import time
+from collections import deque
+from logging import getLogger
+from typing import Any, Callable, Deque, Dict, List, NamedTuple, Optional, Tuple
+
+from checklisting.result import BaseTaskResult, TaskResult
+from checklisting.result.status import TaskResultStatus
+from checklisting.task import BaseTask, Checklist
+
+logger = getLogger(__name__)
+
+LoopStall = NamedTuple('LoopStall', [('at', float), ('lag', float), ('blocker', str)])
+LoopLagStats = NamedTuple('LoopLagStats', [('samples', int), ('max_lag', float), ('p99_lag', float),
+                                           ('stalls', List[LoopStall])])
+
+
+def _describe_frame(frame: Any) -> str:
+    return f'{frame.f_code.co_name} ({os.path.basename(frame.f_code.co_filename)}:{frame.f_lineno})'
+
+
+def _find_blocker(frame: Any) -> str:
+    # innermost checklisting task on the stack is named, otherwise only the innermost function is known
+    location = _describe_frame(frame)
+    while frame is not None:
+        owner = frame.f_locals.get('self')
+        if isinstance(owner, BaseTask):
+            return f'task [{owner.__class__.__name__}] in {location}'
+        frame = frame.f_back
+    return f'callback in {location}'
+
+
+class LoopLagMonitor(object):
+
+    # lag is the delay of a callback scheduled every interval; while it is overdue by more than threshold, stack of
+    # the event loop thread is inspected from a watchdog thread to find out what is blocking it; like lags, stalls are
+    # kept for window intervals
+    def __init__(self,
+                 interval: float = 0.1,
+                 threshold: float = 0.1,
+                 window: int = 600,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        assert interval > 0
+        assert threshold > 0
+        assert window > 0
+        self._interval = interval
+        self._threshold = threshold
+        self._clock = clock
+        self._window = window
+        self._lags: Deque[float] = deque(maxlen=window)
+        self._stalls: Deque[Tuple[float, LoopStall]] = deque(maxlen=100)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread_id: Optional[int] = None
+        self._expected = 0.0
+        self._blocker: Optional[Tuple[float, str]] = None
+        self._handle: Optional[asyncio.Handle] = None
+        self._stopped = threading.Event()
+        self._watchdog: Optional[threading.Thread] = None
+
+    @classmethod
+    def ofDict(cls, raw: Dict[str, Any]) -> 'LoopLagMonitor':
+        return cls(float(raw.get('interval', 0.1)), float(raw.get('threshold', 0.1)), int(raw.get('window', 600)))
+
+    @property
+    def threshold(self) -> float:
+        return self._threshold
+
+    @property
+    def is_running(self) -> bool:
+        return self._handle is not None
+
+    def start(self, loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+        # has to be called from the thread running the loop
+        if self.is_running:
+            return
+        self._loop = loop or asyncio.get_event_loop()
+        self._thread_id = threading.get_ident()
+        self._schedule()
+        self._stopped.clear()
+        self._watchdog = threading.Thread(target=self._watch, name='checklisting-loop-lag', daemon=True)
+        self._watchdog.start()
+
+    def stop(self) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        self._stopped.set()
+        if self._watchdog is not None:
+            self._watchdog.join()
+            self._watchdog = None
+
+    def _schedule(self) -> None:
+        assert self._loop is not None
+        self._expected = self._clock() + self._interval
+        self._handle = self._loop.call_later(self._interval, self._beat)
+
+    def _get_blocker(self) -> str:
+        blocker = self._blocker
+        return blocker[1] if blocker is not None and blocker[0] == self._expected else 'unknown'
+
+    def _beat(self) -> None:
+        lag = max(self._clock() - self._expected, 0.0)
+        self._lags.append(lag)
+        if lag >= self._threshold:
+            stall = LoopStall(time.time(), lag, self._get_blocker())
+            self._stalls.append((self._clock(), stall))
+            logger.warning(f'Event loop was blocked for [{lag:.3f}] seconds by {stall.blocker}')
+        self._schedule()
+
+    def _watch(self) -> None:
+        while not self._stopped.wait(self._threshold / 2):
+            expected = self._expected
+            if self._clock() - expected < self._threshold or \
+                    (self._blocker is not None and self._blocker[0] == expected):
+                continue
+            frame = sys._current_frames().get(self._thread_id)  # type: ignore
+            if frame is not None:
+                self._blocker = (expected, _find_blocker(frame))
+
+    def get_stats(self) -> LoopLagStats:
+        expired_at = self._clock() - self._window * self._interval
+        while self._stalls and self._stalls[0][0] < expired_at:
+            self._stalls.popleft()
+        lags = list(self._lags)
+        stalls = [stall for (_, stall) in self._stalls]
+        # stall which has just finished is included before the overdue heartbeat gets to record it
+        overdue = self._clock() - self._expected if self.is_running else 0.0
+        if overdue >= self._threshold:
+            lags.append(overdue)
+            stalls.append(LoopStall(time.time(), overdue, self._get_blocker()))
+        if not lags:
+            return LoopLagStats(0, 0.0, 0.0, stalls)
+        lags.sort()
+        return LoopLagStats(len(lags), lags[-1], lags[max(math.ceil(0.99 * len(lags)) - 1, 0)], stalls)
+
+
+_default_loop_lag_monitor: Optional[LoopLagMonitor] = None
+
+
+def get_default_loop_lag_monitor() -> Optional[LoopLagMonitor]:
+    return _default_loop_lag_monitor
+
+
+def set_default_loop_lag_monitor(monitor: Optional[LoopLagMonitor]) -> None:
+    global _default_loop_lag_monitor
+    _default_loop_lag_monitor = monitor
+
+
+def set_process_loop_lag_monitor(raw: Optional[Dict[str, Any]]) -> None:
+    set_default_loop_lag_monitor(LoopLagMonitor.ofDict(raw) if raw else None)
+
+
+class LoopLagTask(BaseTask):
+
+    # stalls of the event loop are warnings, unless one of them took longer than error_threshold
+    def __init__(self, monitor: Optional[LoopLagMonitor] = None, error_threshold: float = 1.0) -> None:
+        super().__init__()
+        self._monitor = monitor
+        self._error_threshold = error_threshold
+
+    async def _execute(self) -> BaseTaskResult:
+        monitor = self._monitor or get_default_loop_lag_monitor()
+        if monitor is None or not monitor.is_running:
+            return TaskResult(TaskResultStatus.UNKNOWN, 'Event loop lag is not monitored')
+
+        stats = monitor.get_stats()
+        msg = f'Event loop lag is [{stats.max_lag:.3f}] seconds at most and [{stats.p99_lag:.3f}] seconds at p99 ' + \
+            f'over [{stats.samples}] samples'
+        if not stats.stalls:
+            return TaskResult(TaskResultStatus.SUCCESS, f'{msg}, no stall longer than [{monitor.threshold}] seconds')
+
+        worst = max(stats.stalls, key=lambda stall: stall.lag)
+        msg = f'{msg}; it stalled [{len(stats.stalls)}] times, worst for [{worst.lag:.3f}] seconds by {worst.blocker}'
+        if worst.lag > self._error_threshold:
+            return TaskResult(TaskResultStatus.FAILURE, msg)
+        return TaskResult(TaskResultStatus.WARNING, msg)
+
+
+SELF_CHECK_NAME = 'self-check'
+
+
+def create_self_check(monitor: Optional[LoopLagMonitor] = None) -> Checklist:
+    return Checklist(SELF_CHECK_NAME, [LoopLagTask(monitor)])
@@ -0,0 +1,28 @@
+import asyncio
+from logging import getLogger
+from typing import Optional
+
+from checklisting.extras import has_module, import_module
+
+logger = getLogger(__name__)
+
+LOOP_IMPLEMENTATIONS = ('asyncio', 'uvloop', 'auto')
+
+
+def set_event_loop_implementation(name: Optional[str]) -> str:
+    # auto picks uvloop when it is installed; missing uvloop falls back to asyncio, so config may be shared by hosts
+    if not name:
+        return 'asyncio'
+    if name not in LOOP_IMPLEMENTATIONS:
+        raise RuntimeError(f'Unknown event loop implementation [{name}], ' +
+                           f'available are: {", ".join(LOOP_IMPLEMENTATIONS)}')
+
+    if name != 'asyncio' and has_module('uvloop'):
+        asyncio.set_event_loop_policy(import_module('uvloop').EventLoopPolicy())
+        return 'uvloop'
+
+    if name == 'uvloop':
+        logger.warning('Event loop implementation [uvloop] is not installed, falling back to [asyncio]; ' +
+                       'pip install checklisting[loop]')
+    asyncio.set_event_loop_policy(None)
+    return 'asyncio'
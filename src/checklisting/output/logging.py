@@ -25,5 +25,8 @@ class LoggingOutputWriter(BaseOutputWriter):
         return logger
 
     def write(self, result: BaseTaskResult) -> None:
+        # lines (and lazy messages in them) are not rendered when nobody is going to see them
+        if not self._logger.isEnabledFor(logging.DEBUG):
+            return
         for line in self._serializer.get_lines(result):
             self._logger.debug(line)
@@ -0,0 +1,106 @@
+import asyncio
+import time
+from contextvars import Context
+from typing import Awaitable, Callable, Optional
+
+from checklisting.deadline import deadline_scope
+from checklisting.result import BaseTaskResult
+from checklisting.singleflight import SingleFlight
+from checklisting.task import BaseTask
+
+
+def _ensure_future_in_clean_context(coro: Awaitable) -> asyncio.Future:
+    # future outlives the request it is started by, so it must not carry context of the request (e.g. sink of streamed
+    # results, throttling or scheduler of its tasks), which asyncio copies by default
+    return Context().run(asyncio.ensure_future, coro)
+
+
+class ResultSnapshot(object):
+
+    def __init__(self, result: BaseTaskResult, taken_at: float) -> None:
+        self._result = result
+        self._taken_at = taken_at
+
+    @property
+    def result(self) -> BaseTaskResult:
+        return self._result
+
+    @property
+    def taken_at(self) -> float:
+        return self._taken_at
+
+
+class PeriodicTaskExecutor(object):
+
+    def __init__(self,
+                 task: BaseTask,
+                 interval: float,
+                 timeout: Optional[float] = None,
+                 max_age: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic,
+                 on_refresh: Optional[Callable[[BaseTaskResult], None]] = None) -> None:
+        assert interval > 0
+        self._task = task
+        self._interval = interval
+        self._timeout = timeout
+        self._max_age = max_age or 2 * interval
+        self._clock = clock
+        self._on_refresh = on_refresh
+        self._snapshot: Optional[ResultSnapshot] = None
+        self._single_flight: SingleFlight[ResultSnapshot] = SingleFlight()
+        self._background: Optional[asyncio.Future] = None
+
+    @property
+    def snapshot(self) -> Optional[ResultSnapshot]:
+        return self._snapshot
+
+    @property
+    def age(self) -> Optional[float]:
+        if self._snapshot is None:
+            return None
+        return self._clock() - self._snapshot.taken_at
+
+    @property
+    def is_stale(self) -> bool:
+        age = self.age
+        return age is None or age > self._max_age
+
+    @property
+    def is_running(self) -> bool:
+        return self._background is not None and not self._background.done()
+
+    async def get_snapshot(self) -> ResultSnapshot:
+        if self._snapshot is None:
+            return await self.refresh()
+        return self._snapshot
+
+    async def refresh(self) -> ResultSnapshot:
+        return await self._single_flight.run(None, lambda: _ensure_future_in_clean_context(self._refresh()))
+
+    async def _refresh(self) -> ResultSnapshot:
+        # refresh is shared by all callers, so none of their deadlines applies
+        with deadline_scope(self._timeout, True):
+            result = await self._task.execute()
+        self._snapshot = ResultSnapshot(result, self._clock())
+        if self._on_refresh is not None:
+            self._on_refresh(result)
+        return self._snapshot
+
+    def start(self) -> None:
+        if not self.is_running:
+            self._background = _ensure_future_in_clean_context(self._run_periodically())
+
+    async def stop(self) -> None:
+        if self._background is None:
+            return
+        self._background.cancel()
+        try:
+            await self._background
+        except asyncio.CancelledError:
+            pass
+        self._background = None
+
+    async def _run_periodically(self) -> None:
+        while True:
+            await self.refresh()
+            await asyncio.sleep(self._interval)
@@ -0,0 +1,235 @@
+import cProfile
+import os
+import pstats
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import Counter
+from typing import Any, Awaitable, Dict, Generator, List, Optional, Tuple, Type, TypeVar
+
+R = TypeVar('R')
+
+
+class TaskStatsEntry(object):
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.wall_time = 0.0
+        self.cpu_time = 0.0
+
+
+class TaskStats(object):
+
+    # cpu time is that of event loop thread only, so work offloaded to thread or process pools is not included
+    def __init__(self) -> None:
+        self._entries: Dict[str, TaskStatsEntry] = {}
+
+    @property
+    def entries(self) -> Dict[str, TaskStatsEntry]:
+        return self._entries
+
+    def record(self, name: str, wall_time: float, cpu_time: float) -> None:
+        entry = self._entries.get(name)
+        if entry is None:
+            entry = TaskStatsEntry()
+            self._entries[name] = entry
+        entry.count += 1
+        entry.wall_time += wall_time
+        entry.cpu_time += cpu_time
+
+    def get_lines(self) -> List[str]:
+        return [
+            f'{name:<40} count=[{entry.count}] wall=[{entry.wall_time:.3f}s] cpu=[{entry.cpu_time:.3f}s]'
+            for (name, entry) in sorted(self._entries.items(), key=lambda item: item[1].wall_time, reverse=True)
+        ]
+
+
+class _ObservedExecution(object):
+
+    # measures cpu time of each step of the coroutine, so time of other tasks interleaved with it is not counted
+    def __init__(self, coro: Any, name: str, task_stats: TaskStats) -> None:
+        self._coro = coro
+        self._name = name
+        self._task_stats = task_stats
+
+    def __await__(self) -> Generator[Any, Any, Any]:
+        started = time.monotonic()
+        cpu_time = 0.0
+        (value, error) = (None, None)
+        try:
+            while True:
+                step_started = time.thread_time()
+                try:
+                    yielded = self._coro.send(value) if error is None else self._coro.throw(error)
+                except StopIteration as e:
+                    return e.value
+                finally:
+                    cpu_time += time.thread_time() - step_started
+
+                try:
+                    (value, error) = ((yield yielded), None)
+                except GeneratorExit:
+                    self._coro.close()
+                    raise
+                except BaseException as e:
+                    (value, error) = (None, e)
+        finally:
+            self._task_stats.record(self._name, time.monotonic() - started, cpu_time)
+
+
+_active_task_stats: Optional[TaskStats] = None
+
+
+def observe_execution(task: object, coro: Awaitable[R]) -> Awaitable[R]:
+    task_stats = _active_task_stats
+    if task_stats is None:
+        return coro
+    return _ObservedExecution(coro, task.__class__.__name__, task_stats)
+
+
+class BaseProfiler(ABC):
+
+    DEFAULT_OUTPUT = 'checklisting.prof'
+
+    def __init__(self) -> None:
+        self._task_stats = TaskStats()
+
+    @property
+    def task_stats(self) -> TaskStats:
+        return self._task_stats
+
+    def start(self) -> None:
+        global _active_task_stats
+        if _active_task_stats is not None:
+            raise RuntimeError('Another profiling is already in progress')
+        _active_task_stats = self._task_stats
+        self._start()
+
+    def stop(self) -> None:
+        global _active_task_stats
+        self._stop()
+        _active_task_stats = None
+
+    def __enter__(self) -> 'BaseProfiler':
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def report(self, limit: int = 20) -> str:
+        lines = ['Tasks:']
+        lines.extend(f'    {line}' for line in self._task_stats.get_lines())
+        lines.append('Hot functions:')
+        lines.extend(f'    {function:<80} [{seconds:.3f}s]' for (function, seconds) in self.get_hot_functions(limit))
+        return '\n'.join(lines)
+
+    @abstractmethod
+    def _start(self) -> None:
+        pass
+
+    @abstractmethod
+    def _stop(self) -> None:
+        pass
+
+    @abstractmethod
+    def get_hot_functions(self, limit: int) -> List[Tuple[str, float]]:
+        pass
+
+    @abstractmethod
+    def dump(self, path: str) -> None:
+        pass
+
+
+class CProfileProfiler(BaseProfiler):
+
+    DEFAULT_OUTPUT = 'checklisting.pstats'
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._profile = cProfile.Profile()
+
+    def _start(self) -> None:
+        self._profile.enable()
+
+    def _stop(self) -> None:
+        self._profile.disable()
+
+    def get_hot_functions(self, limit: int) -> List[Tuple[str, float]]:
+        # functions are ordered by time spent in them, excluding functions they call
+        stats = pstats.Stats(self._profile).stats  # type: ignore
+        hot = sorted(stats.items(), key=lambda item: item[1][2], reverse=True)[:limit]
+        return [(f'{function} ({os.path.basename(filename)}:{lineno})', total_time)
+                for ((filename, lineno, function), (_, _, total_time, _, _)) in hot]
+
+    def dump(self, path: str) -> None:
+        self._profile.dump_stats(path)
+
+
+class SamplingProfiler(BaseProfiler):
+
+    DEFAULT_OUTPUT = 'checklisting.collapsed'
+
+    # samples stack of the thread starting the profiler; overhead does not depend on number of function calls
+    def __init__(self, interval: float = 0.005) -> None:
+        assert interval > 0
+        super().__init__()
+        self._interval = interval
+        self._stacks: Counter = Counter()
+        self._thread_id: Optional[int] = None
+        self._stopped = threading.Event()
+        self._sampler: Optional[threading.Thread] = None
+
+    @property
+    def samples(self) -> int:
+        return sum(self._stacks.values())
+
+    def _start(self) -> None:
+        self._thread_id = threading.get_ident()
+        self._stopped.clear()
+        self._sampler = threading.Thread(target=self._sample, name='checklisting-sampler', daemon=True)
+        self._sampler.start()
+
+    def _stop(self) -> None:
+        self._stopped.set()
+        if self._sampler is not None:
+            self._sampler.join()
+            self._sampler = None
+
+    def _sample(self) -> None:
+        while not self._stopped.wait(self._interval):
+            frame = sys._current_frames().get(self._thread_id)  # type: ignore
+            stack = []
+            while frame is not None:
+                stack.append(f'{frame.f_code.co_name} ({os.path.basename(frame.f_code.co_filename)}:' +
+                             f'{frame.f_code.co_firstlineno})')
+                frame = frame.f_back
+            if stack:
+                self._stacks[';'.join(reversed(stack))] += 1
+
+    def get_hot_functions(self, limit: int) -> List[Tuple[str, float]]:
+        # functions are ordered by number of samples they were on top of the stack in
+        leaves: Counter = Counter()
+        for (stack, count) in self._stacks.items():
+            leaves[stack.rsplit(';', 1)[-1]] += count
+        return [(function, count * self._interval) for (function, count) in leaves.most_common(limit)]
+
+    def dump(self, path: str) -> None:
+        # collapsed stacks format, as consumed by flamegraph tools
+        with open(path, 'w') as stream:
+            for (stack, count) in self._stacks.items():
+                stream.write(f'{stack} {count}\n')
+
+
+PROFILERS: Dict[str, Type[BaseProfiler]] = {
+    'cprofile': CProfileProfiler,
+    'sampling': SamplingProfiler,
+}
+
+
+def create_profiler(name: str) -> BaseProfiler:
+    try:
+        return PROFILERS[name]()
+    except KeyError:
+        raise RuntimeError(f'Unknown profiler [{name}], available are: {", ".join(sorted(PROFILERS))}')
@@ -0,0 +1,107 @@
+import asyncio
+import time
+from typing import Any, Callable, Dict, Optional
+
+from checklisting.task import report_throttling
+
+
+class TokenBucket(object):
+
+    def __init__(self, rate: float, burst: int = 1, clock: Callable[[], float] = time.monotonic) -> None:
+        assert rate > 0
+        assert burst > 0
+        self._rate = rate
+        self._burst = burst
+        self._clock = clock
+        self._tokens = float(burst)
+        self._updated = clock()
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    @property
+    def burst(self) -> int:
+        return self._burst
+
+    def reserve(self) -> float:
+        # token is taken right away, possibly in advance, so waiting callers are served in order of arrival
+        now = self._clock()
+        self._tokens = min(float(self._burst), self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+        self._tokens -= 1
+        return 0.0 if self._tokens >= 0 else -self._tokens / self._rate
+
+    def release(self) -> None:
+        self._tokens = min(float(self._burst), self._tokens + 1)
+
+    async def acquire(self) -> float:
+        delay = self.reserve()
+        if delay > 0:
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                self.release()
+                raise
+        return delay
+
+
+class RateLimiterRegistry(object):
+
+    # limits are keyed by destination, either host:port or just host covering all of its ports
+    def __init__(self,
+                 rate: Optional[float] = None,
+                 burst: int = 1,
+                 limits: Optional[Dict[str, Dict[str, Any]]] = None,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        self._rate = rate
+        self._burst = burst
+        self._limits = limits or {}
+        self._clock = clock
+        self._buckets: Dict[str, Optional[TokenBucket]] = {}
+
+    @classmethod
+    def ofDict(cls, raw: Dict[str, Any]) -> 'RateLimiterRegistry':
+        return cls(raw.get('rate'), raw.get('burst', 1), raw.get('destinations'))
+
+    def _create_bucket(self, key: str) -> Optional[TokenBucket]:
+        limit = self._limits.get(key) or self._limits.get(key.rsplit(':', 1)[0])
+        if limit is not None:
+            return TokenBucket(limit['rate'], limit.get('burst', 1), self._clock)
+        if self._rate is not None:
+            return TokenBucket(self._rate, self._burst, self._clock)
+        return None
+
+    def get(self, key: str) -> Optional[TokenBucket]:
+        if key not in self._buckets:
+            self._buckets[key] = self._create_bucket(key)
+        return self._buckets[key]
+
+    async def acquire(self, key: str) -> float:
+        bucket = self.get(key)
+        if bucket is None:
+            return 0.0
+        return await bucket.acquire()
+
+
+_default_rate_limiters: Optional[RateLimiterRegistry] = None
+
+
+def get_default_rate_limiters() -> Optional[RateLimiterRegistry]:
+    return _default_rate_limiters
+
+
+def set_default_rate_limiters(rate_limiters: Optional[RateLimiterRegistry]) -> None:
+    global _default_rate_limiters
+    _default_rate_limiters = rate_limiters
+
+
+def set_process_rate_limiters(raw: Optional[Dict[str, Any]]) -> None:
+    set_default_rate_limiters(RateLimiterRegistry.ofDict(raw) if raw else None)
+
+
+async def throttle(key: str, rate_limiters: Optional[RateLimiterRegistry] = None) -> None:
+    # calls are limited by process wide rate limiters, unless given other ones; there are none by default
+    rate_limiters = rate_limiters or get_default_rate_limiters()
+    if rate_limiters is not None:
+        report_throttling(await rate_limiters.acquire(key))
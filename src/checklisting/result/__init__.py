@@ -1,14 +1,83 @@
 from __future__ import annotations
 
+import copy
+import sys
 from abc import ABC, abstractmethod
-from itertools import chain
-from typing import Iterable, Union
+from collections import OrderedDict
+from functools import lru_cache
+from hashlib import blake2b
+from string import Formatter
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple, Union
 
 from .status import TaskResultStatus
 
+# started_at and finished_at are wall clock timestamps; queued is time spent waiting for scheduler before start,
+# throttled is time spent by the task and its subtasks waiting for rate limiters
+TaskTiming = NamedTuple('TaskTiming', [('started_at', float), ('finished_at', float), ('duration', float),
+                                       ('queued', float), ('throttled', float)])
+TaskTiming.__new__.__defaults__ = (0.0, )
+
+
+@lru_cache(maxsize=256)
+def _compile_template(template: str) -> Tuple[Tuple[str, ...], str]:
+    # named fields are replaced by positional ones, so rendering needs only values of fields in order of their names;
+    # fields may be formatted more than once or accessed by attribute or index, e.g. {disk.total} or {values[0]}
+    positions: Dict[str, int] = OrderedDict()
+    parts: List[str] = []
+    for (literal, field, format_spec, conversion) in Formatter().parse(template):
+        parts.append(literal.replace('{', '{{').replace('}', '}}'))
+        if field is None:
+            continue
+        name = field.partition('.')[0].partition('[')[0]
+        position = positions.setdefault(name, len(positions))
+        parts.append('{' + str(position) + field[len(name):] + (f'!{conversion}' if conversion else '') +
+                     (f':{format_spec}' if format_spec else '') + '}')
+    return (tuple(positions), ''.join(parts))
+
+
+class LazyMessage(object):
+
+    # template (str.format syntax) is rendered with fields only when text of the message is needed, e.g. by a
+    # serializer; names of fields come from the template, so only their values are kept with each message
+    __slots__ = ('_template', '_values')
+
+    def __init__(self, template: str, **fields: Any) -> None:
+        self._template = template
+        self._values = tuple(fields[name] for name in _compile_template(template)[0])
+
+    @property
+    def template(self) -> str:
+        return self._template
+
+    @property
+    def fields(self) -> Mapping[str, Any]:
+        return dict(zip(_compile_template(self._template)[0], self._values))
+
+    def __str__(self) -> str:
+        return sys.intern(_compile_template(self._template)[1].format(*self._values))
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__}("{self._template[:20]}...")>'
+
+
+def _compute_digest(status: TaskResultStatus, message: str, results: Iterable[Any]) -> bytes:
+    # digest of subtask results is used in place of their content, so it is computed once per result of the tree
+    encoded_message = str(message).encode('utf-8', 'surrogatepass')
+    digest = blake2b(b'%d:%d:' % (status.value, len(encoded_message)), digest_size=16)
+    digest.update(encoded_message)
+    for result in results:
+        if isinstance(result, BaseTaskResult):
+            digest.update(result.digest)
+        else:
+            # other objects can only contribute their hash
+            digest.update(hash(result).to_bytes(8, 'little', signed=True))
+    return digest.digest()
+
 
 class BaseTaskResult(ABC):
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def status(self) -> TaskResultStatus:
@@ -19,6 +88,30 @@ class BaseTaskResult(ABC):
     def message(self) -> str:
         pass
 
+    @property
+    def digest(self) -> bytes:
+        # content hash of status, message and results of subtasks, if any; timing and retries are not part of it
+        return _compute_digest(self.status, self.message, getattr(self, 'results', ()))
+
+    @property
+    def timing(self) -> Optional[TaskTiming]:
+        return getattr(self, '_timing', None)
+
+    @property
+    def retries(self) -> int:
+        return getattr(self, '_retries', 0)
+
+    def with_timing(self, timing: TaskTiming) -> BaseTaskResult:
+        # results may be shared, e.g. by cache, so timing is set on a copy
+        result = copy.copy(self)
+        result._timing = timing
+        return result
+
+    def with_retries(self, retries: int) -> BaseTaskResult:
+        result = copy.copy(self)
+        result._retries = retries
+        return result
+
     def __repr__(self):
         return f'<{self.__class__.__name__}({self.status}, "{self.message[:20]}...")>'
 
@@ -31,10 +124,19 @@ class BaseTaskResult(ABC):
 
 class TaskResult(BaseTaskResult):
 
-    def __init__(self, status: TaskResultStatus, message: str) -> None:
+    # trees federated from many agents hold lots of results, so they are kept without __dict__; messages are interned
+    # as most of them repeat across agents
+    __slots__ = ('_status', '_message', '_timing', '_retries', '_digest')
+
+    def __init__(self,
+                 status: TaskResultStatus,
+                 message: Union[str, LazyMessage],
+                 timing: Optional[TaskTiming] = None) -> None:
         super().__init__()
         self._status = status
-        self._message = message
+        self._message = sys.intern(message) if type(message) is str else message
+        self._timing = timing
+        self._digest: Optional[bytes] = None
 
     @property
     def status(self) -> TaskResultStatus:
@@ -42,25 +144,61 @@ class TaskResult(BaseTaskResult):
 
     @property
     def message(self) -> str:
-        return self._message
+        message = self._message
+        if type(message) is LazyMessage:
+            # once rendered, text replaces template and fields, so the result weighs as much as one built with it
+            message = self._message = str(message)
+        return message
+
+    @property
+    def digest(self) -> bytes:
+        # results are immutable, so their digest (Merkle style for trees) is computed only once, when first needed
+        if self._digest is None:
+            self._digest = _compute_digest(self._status, self.message, getattr(self, 'results', ()))
+        return self._digest
+
+    def _has_digest_of_same_kind(self, other: BaseTaskResult) -> bool:
+        # digests are computed by hashing (e.g. set or dict membership); once both results have them, comparing
+        # unchanged trees does not walk them anymore
+        return type(other) is type(self) and self._digest is not None and other._digest is not None  # type: ignore
+
+    def __eq__(self, other: BaseTaskResult) -> bool:
+        if self is other:
+            return True
+        if self._has_digest_of_same_kind(other):
+            return self._digest == other.digest
+        return super().__eq__(other)
+
+    def __hash__(self) -> int:
+        return hash(self.digest)
 
 
 class MultiTaskResult(TaskResult):
 
-    def __init__(self, status: TaskResultStatus, message: str, task_results: Iterable[BaseTaskResult]) -> None:
-        super().__init__(status, message)
-        self._results = list(task_results)
+    __slots__ = ('_results', )
+
+    def __init__(self,
+                 status: TaskResultStatus,
+                 message: Union[str, LazyMessage],
+                 task_results: Iterable[BaseTaskResult],
+                 timing: Optional[TaskTiming] = None) -> None:
+        super().__init__(status, message, timing)
+        # results are immutable, so a tuple of them is shared by copies instead of being copied
+        self._results = tuple(task_results)
 
     @property
     def results(self) -> Iterable[BaseTaskResult]:
         return self._results
 
     def __eq__(self, other: Union[BaseTaskResult, MultiTaskResult]) -> bool:
-        if not super().__eq__(other):
+        if self is other:
+            return True
+        if self._has_digest_of_same_kind(other):
+            return self._digest == other.digest
+        if not BaseTaskResult.__eq__(self, other):
             return False
         if not isinstance(other, MultiTaskResult):
             return True
-        return self._results == other.results
+        return self._results == tuple(other.results)
 
-    def __hash__(self) -> int:
-        return hash('\n'.join(chain([str(super().__hash__())], map(str, map(hash, self._results)))))
+    __hash__ = TaskResult.__hash__
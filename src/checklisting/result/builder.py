@@ -12,6 +12,9 @@ class MultiTaskResultBuilder(object):
         self._status_validator = status_validator or DefaultTaskResultStatusValidator()
         self._message_builder = message_builder or StatusAwareTaskResultMessageBuilder()
 
+    def is_settled(self, results: Iterator[BaseTaskResult]) -> bool:
+        return self._status_validator.is_settled_by_results(results)
+
     def of_results(self, results: Iterator[BaseTaskResult]) -> MultiTaskResult:
         results_list = list(results)
         status = self._status_validator.of_results(results_list)
@@ -0,0 +1,52 @@
+from enum import Enum
+from typing import Iterator, NamedTuple, Optional, Tuple
+
+from . import BaseTaskResult, MultiTaskResult
+
+
+class ResultChangeKind(Enum):
+    CHANGED = 'CHANGED'
+    ADDED = 'ADDED'
+    REMOVED = 'REMOVED'
+
+    def __str__(self):
+        return self.name
+
+
+# path is made of indexes of subtask results leading to the result within the tree, root has an empty one
+ResultChange = NamedTuple('ResultChange', [('path', Tuple[int, ...]), ('kind', ResultChangeKind),
+                                           ('old', Optional[BaseTaskResult]), ('new', Optional[BaseTaskResult])])
+
+
+def _get_results(result: BaseTaskResult) -> Tuple[BaseTaskResult, ...]:
+    return tuple(result.results) if isinstance(result, MultiTaskResult) else ()
+
+
+def diff_results(old: BaseTaskResult, new: BaseTaskResult, path: Tuple[int, ...] = ()) -> Iterator[ResultChange]:
+    # subtrees with equal digests are skipped without being walked; results of subtasks are matched by position,
+    # those without counterpart are reported as added or removed as a whole
+    if old is new or old.digest == new.digest:
+        return
+    if old.status != new.status or old.message != new.message:
+        yield ResultChange(path, ResultChangeKind.CHANGED, old, new)
+
+    (old_results, new_results) = (_get_results(old), _get_results(new))
+    for (idx, (old_result, new_result)) in enumerate(zip(old_results, new_results)):
+        yield from diff_results(old_result, new_result, path + (idx, ))
+    for idx in range(len(new_results), len(old_results)):
+        yield ResultChange(path + (idx, ), ResultChangeKind.REMOVED, old_results[idx], None)
+    for idx in range(len(old_results), len(new_results)):
+        yield ResultChange(path + (idx, ), ResultChangeKind.ADDED, None, new_results[idx])
+
+
+def format_path(path: Tuple[int, ...]) -> str:
+    return '/' + '/'.join(map(str, path))
+
+
+def describe_change(change: ResultChange) -> str:
+    if change.old is None:
+        return f'{format_path(change.path)} added: [{change.new.status}] {change.new.message}'
+    if change.new is None:
+        return f'{format_path(change.path)} removed: [{change.old.status}] {change.old.message}'
+    return f'{format_path(change.path)} changed from [{change.old.status}] {change.old.message} ' + \
+        f'to [{change.new.status}] {change.new.message}'
@@ -9,7 +9,8 @@ from ..status import TaskResultStatus
 class BaseTaskResultMessageBuilder(ABC):
 
     def of_results(self, status: TaskResultStatus, results: Iterator[BaseTaskResult]) -> TaskResultStatus:
-        return self.build(status, [result.message for result in results])
+        # messages are rendered only if the builder uses them
+        return self.build(status, (result.message for result in results))
 
     @abstractmethod
     def build(self, status: TaskResultStatus, messages: Iterator[str]) -> str:
@@ -0,0 +1,79 @@
+from bisect import bisect_left
+from heapq import merge
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from . import BaseTaskResult, MultiTaskResult
+from .status import TaskResultStatus
+
+Path = Tuple[int, ...]
+
+IndexedResult = NamedTuple('IndexedResult', [('checklist', str), ('path', Path), ('result', BaseTaskResult)])
+
+
+def parse_path(raw: str) -> Path:
+    # counterpart of format_path of checklisting.result.diff, e.g. '/0/2' or '0/2'
+    return tuple(int(part) for part in raw.split('/') if part)
+
+
+def _get_under(paths: List[Path], path: Path) -> List[Path]:
+    # paths are kept in tree order, in which those under given one are contiguous
+    if not path:
+        return paths
+    return paths[bisect_left(paths, path):bisect_left(paths, path[:-1] + (path[-1] + 1, ))]
+
+
+class ResultIndex(object):
+
+    # results of checklists are indexed once, by path and by checklist, status and being a leaf, so lookups do not
+    # walk the trees; paths are made of indexes of subtask results within result of a checklist
+    def __init__(self, checklists: Iterable[Tuple[str, BaseTaskResult]]) -> None:
+        self._checklists: List[str] = []
+        self._results: Dict[Tuple[str, Path], BaseTaskResult] = {}
+        self._paths: Dict[Tuple[str, TaskResultStatus, bool], List[Path]] = {}
+        for (name, result) in checklists:
+            name = self._get_unique_name(name)
+            self._checklists.append(name)
+            self._add(name, result)
+
+    def _get_unique_name(self, name: str) -> str:
+        # names of checklists need not be unique, those seen again are told apart by a suffix that needs no escaping
+        # in URLs, e.g. 'foo~2'
+        unique_name = name
+        occurrence = 1
+        while (unique_name, ()) in self._results:
+            occurrence += 1
+            unique_name = f'{name}~{occurrence}'
+        return unique_name
+
+    def _add(self, checklist: str, root: BaseTaskResult) -> None:
+        stack: List[Tuple[Path, BaseTaskResult]] = [((), root)]
+        while stack:
+            (path, result) = stack.pop()
+            results = tuple(result.results) if isinstance(result, MultiTaskResult) else ()
+            self._results[(checklist, path)] = result
+            self._paths.setdefault((checklist, result.status, not results), []).append(path)
+            stack.extend((path + (idx, ), results[idx]) for idx in reversed(range(len(results))))
+
+    @property
+    def checklists(self) -> List[str]:
+        return list(self._checklists)
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def get(self, checklist: str, path: Path = ()) -> Optional[BaseTaskResult]:
+        return self._results.get((checklist, path))
+
+    def find(self,
+             checklist: Optional[str] = None,
+             status: Optional[TaskResultStatus] = None,
+             path: Path = (),
+             leaves_only: bool = False) -> Iterator[IndexedResult]:
+        # results are yielded in tree order, checklist by checklist; path itself is included when it matches
+        checklists = [checklist] if checklist is not None else self._checklists
+        statuses = [status] if status is not None else list(TaskResultStatus)
+        kinds = [True] if leaves_only else [True, False]
+        for name in checklists:
+            for matched in merge(*(_get_under(self._paths.get((name, matched_status, is_leaf), []), path)
+                                   for matched_status in statuses for is_leaf in kinds)):
+                yield IndexedResult(name, matched, self._results[(name, matched)])
@@ -11,6 +11,13 @@ class BaseTaskResultStatusValidator(ABC):
     def of_results(self, results: Iterable[BaseTaskResult]) -> TaskResultStatus:
         return self.validate([result.status for result in results])
 
+    def is_settled_by_results(self, results: Iterable[BaseTaskResult]) -> bool:
+        return self.is_settled([result.status for result in results])
+
+    def is_settled(self, task_result_statuses: Iterable[TaskResultStatus]) -> bool:
+        # settled means no further statuses could change result of validation of given ones
+        return False
+
     @abstractmethod
     def validate(self, task_result_statuses: Iterable[TaskResultStatus]) -> TaskResultStatus:
         pass
@@ -30,6 +37,9 @@ class FallbackTaskResultStatusValidator(BaseTaskResultStatusValidator):
             return result
         return self._fallback()
 
+    def is_settled(self, task_result_statuses: Iterable[TaskResultStatus]) -> bool:
+        return self._inner_validator.is_settled(task_result_statuses)
+
 
 class AllOfSameTypeTaskResultStatusValidator(BaseTaskResultStatusValidator):
 
@@ -44,6 +54,9 @@ class AllOfSameTypeTaskResultStatusValidator(BaseTaskResultStatusValidator):
 
         return TaskResultStatus.UNKNOWN
 
+    def is_settled(self, task_result_statuses: Iterable[TaskResultStatus]) -> bool:
+        return len(set(task_result_statuses)) > 1
+
 
 class MostCommonTaskResultStatusValidator(BaseTaskResultStatusValidator):
 
@@ -79,6 +92,9 @@ class AvailableStatusTaskResultStatusValidator(BaseTaskResultStatusValidator):
 
         return TaskResultStatus.UNKNOWN
 
+    def is_settled(self, task_result_statuses: Iterable[TaskResultStatus]) -> bool:
+        return self._expected_status in task_result_statuses
+
 
 class AggregatedTaskResultStatusValidator(BaseTaskResultStatusValidator):
 
@@ -94,6 +110,15 @@ class AggregatedTaskResultStatusValidator(BaseTaskResultStatusValidator):
 
         return TaskResultStatus.UNKNOWN
 
+    def is_settled(self, task_result_statuses: Iterable[TaskResultStatus]) -> bool:
+        for validator in self._inner_validators:
+            if not validator.is_settled(task_result_statuses):
+                return False
+            if validator.validate(task_result_statuses) != TaskResultStatus.UNKNOWN:
+                return True
+
+        return True
+
 
 class PrioritizedTaskResultStatusValidator(AggregatedTaskResultStatusValidator):
 
@@ -114,3 +139,7 @@ class DefaultTaskResultStatusValidator(AggregatedTaskResultStatusValidator):
             AllOfSameTypeTaskResultStatusValidator(),
             PrioritizedTaskResultStatusValidator(),
         )
+
+    def is_settled(self, task_result_statuses: Iterable[TaskResultStatus]) -> bool:
+        # FAILURE wins no matter if all statuses are the same or they are prioritized
+        return TaskResultStatus.FAILURE in task_result_statuses or super().is_settled(task_result_statuses)
@@ -0,0 +1,99 @@
+import asyncio
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Type
+
+from checklisting.deadline import get_remaining_time
+from checklisting.result import BaseTaskResult, TaskResult
+from checklisting.result.status import TaskResultStatus
+
+
+class TransientError(RuntimeError):
+
+    # raised by an attempt to mark its failure as worth retrying; result, if given, is reported once retries run out
+    def __init__(self, message: str, result: Optional[BaseTaskResult] = None) -> None:
+        super().__init__(message)
+        self._result = result
+
+    @property
+    def result(self) -> Optional[BaseTaskResult]:
+        return self._result
+
+
+DEFAULT_RETRYABLE_ERRORS: Tuple[Type[BaseException], ...] = (OSError, EOFError, asyncio.TimeoutError)
+
+
+class RetryPolicy(object):
+
+    def __init__(self,
+                 attempts: int = 3,
+                 backoff: float = 0.1,
+                 multiplier: float = 2.0,
+                 max_backoff: float = 5.0,
+                 jitter: float = 0.5,
+                 budget: Optional[float] = None,
+                 retryable: Tuple[Type[BaseException], ...] = DEFAULT_RETRYABLE_ERRORS,
+                 rand: Callable[[], float] = random.random) -> None:
+        assert attempts > 0
+        assert backoff >= 0
+        assert multiplier >= 1
+        assert 0 <= jitter <= 1
+        assert budget is None or budget > 0
+        self._attempts = attempts
+        self._backoff = backoff
+        self._multiplier = multiplier
+        self._max_backoff = max_backoff
+        self._jitter = jitter
+        self._budget = budget
+        self._retryable = retryable
+        self._rand = rand
+
+    @classmethod
+    def ofDict(cls, raw: Dict[str, Any]) -> 'RetryPolicy':
+        return cls(**{
+            key: raw[key]
+            for key in ('attempts', 'backoff', 'multiplier', 'max_backoff', 'jitter', 'budget') if key in raw
+        })
+
+    @property
+    def attempts(self) -> int:
+        return self._attempts
+
+    def is_retryable(self, error: BaseException) -> bool:
+        return isinstance(error, TransientError) or isinstance(error, self._retryable)
+
+    def get_backoff(self, retry: int) -> float:
+        delay = min(self._backoff * self._multiplier**(retry - 1), self._max_backoff)
+        # jitter spreads retries of many tasks failing at once, e.g. when a shared dependency restarts
+        return delay * (1 - self._jitter * self._rand())
+
+    def _fits_budget(self, started: float, delay: float) -> bool:
+        if self._budget is not None and time.monotonic() - started + delay > self._budget:
+            return False
+        remaining = get_remaining_time()
+        return remaining is None or delay < remaining
+
+    async def execute(self, attempt: Callable[[], Awaitable[BaseTaskResult]]) -> BaseTaskResult:
+        started = time.monotonic()
+        retries = 0
+        while True:
+            try:
+                result = await attempt()
+                break
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                delay = self.get_backoff(retries + 1)
+                if retries + 1 >= self._attempts or not self.is_retryable(e) or not self._fits_budget(started, delay):
+                    result = self._failure(e)
+                    break
+            await asyncio.sleep(delay)
+            retries += 1
+
+        return result.with_retries(retries) if retries else result
+
+    @staticmethod
+    def _failure(error: Exception) -> BaseTaskResult:
+        if isinstance(error, TransientError) and error.result is not None:
+            return error.result
+        return TaskResult(TaskResultStatus.FAILURE, str(error))
@@ -1,35 +1,115 @@
 import argparse
 import asyncio
-from typing import Any, Dict, Optional
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional
 
+from checklisting.blocking import set_process_blocking_executor
+from checklisting.circuit import set_process_circuit_breakers
 from checklisting.configuration.loader import ConfigurationLoader
+from checklisting.deadline import deadline_scope
+from checklisting.lag import create_self_check, get_default_loop_lag_monitor, set_process_loop_lag_monitor
 from checklisting.loaders import (BaseChecklistsLoader,
                                   ChecklistLoaderSourceEntry)
 from checklisting.loaders.pyspd import PySPDChecklistsLoader
+from checklisting.loop import set_event_loop_implementation
 from checklisting.output.logging import LoggingOutputWriter
 from checklisting.parser import YamlParser
 from checklisting.provider import BaseChecklistsProvider
+from checklisting.ratelimit import set_process_rate_limiters
+from checklisting.result import BaseTaskResult
+from checklisting.scheduler import set_process_max_concurrency
+from checklisting.task import Checklist
 
 from . import BaseRunner, BaseRunnerFactory
 
+_sharded_runner: Optional['CliRunner'] = None
+_sharded_checklists: List[Checklist] = []
+
 
 class CliRunner(BaseRunner):
 
-    def __init__(self, checklists_provider: BaseChecklistsProvider) -> None:
+    def __init__(self,
+                 checklists_provider: BaseChecklistsProvider,
+                 timeout: Optional[float] = None,
+                 workers: int = 1) -> None:
+        assert workers > 0
         super().__init__()
         self._output_writer = LoggingOutputWriter()
         self._checklists_provider = checklists_provider
+        self._timeout = timeout
+        self._workers = workers
 
-    def run(self) -> None:
+    async def _execute_checklists(self, checklists: List[Checklist]) -> List[BaseTaskResult]:
+        monitor = get_default_loop_lag_monitor()
+        if monitor is None:
+            return await self._execute_provided_checklists(checklists)
+
+        monitor.start()
+        try:
+            results = await self._execute_provided_checklists(checklists)
+            # self-check runs last, so it covers stalls caused by all of the checklists
+            results.append(await create_self_check(monitor).execute())
+            return results
+        finally:
+            monitor.stop()
+
+    async def _execute_provided_checklists(self, checklists: List[Checklist]) -> List[BaseTaskResult]:
+        with deadline_scope(self._timeout):
+            return await asyncio.gather(*[checklist.execute() for checklist in checklists])
+
+    def _run_checklists(self, checklists: List[Checklist]) -> List[BaseTaskResult]:
         loop = asyncio.get_event_loop()
-        checklists_results = loop.run_until_complete(
-            asyncio.gather(*[checklist.execute() for checklist in self._checklists_provider.get_all()]))
+        checklists_results = loop.run_until_complete(self._execute_checklists(checklists))
         loop.close()
+        return checklists_results
+
+    def _run_sharded(self, checklists: List[Checklist]) -> List[BaseTaskResult]:
+        # workers are forked once checklists are loaded, as those do not have to be picklable; only results are
+        global _sharded_runner, _sharded_checklists
+        try:
+            context = multiprocessing.get_context('fork')
+        except ValueError:
+            raise RuntimeError('Running checklists in multiple workers requires fork start method of processes')
+
+        shards = min(self._workers, len(checklists)) or 1
+        _sharded_runner = self
+        _sharded_checklists = checklists
+        try:
+            with ProcessPoolExecutor(shards, mp_context=context) as pool:
+                shards_results = list(pool.map(_execute_shard, range(shards), [shards] * shards))
+        finally:
+            _sharded_runner = None
+            _sharded_checklists = []
+
+        # checklists are dealt to workers in turns, so results are merged back the same way; self-checks come last
+        results: List[BaseTaskResult] = [None] * len(checklists)  # type: ignore
+        self_check_results: List[BaseTaskResult] = []
+        for (shard, shard_results) in enumerate(shards_results):
+            shard_size = len(range(shard, len(checklists), shards))
+            results[shard::shards] = shard_results[:shard_size]
+            self_check_results.extend(shard_results[shard_size:])
+        return results + self_check_results
+
+    def run(self) -> None:
+        checklists = list(self._checklists_provider.get_all())
+        if self._workers > 1:
+            checklists_results = self._run_sharded(checklists)
+        else:
+            checklists_results = self._run_checklists(checklists)
 
         for checklist_results in checklists_results:
             self._output_writer.write(checklist_results)
 
 
+def _execute_shard(shard: int, shards: int) -> List[BaseTaskResult]:
+    # executed in forked worker, which must not reuse event loop of its parent
+    assert _sharded_runner is not None
+    asyncio.set_event_loop(asyncio.new_event_loop())
+    # checklists are those of the parent, as results are merged back by their positions there
+    return _sharded_runner._run_checklists(_sharded_checklists[shard::shards])
+
+
 class CliRunnerFactory(BaseRunnerFactory):
 
     def __init__(self,
@@ -45,12 +125,32 @@ class CliRunnerFactory(BaseRunnerFactory):
             raise RuntimeError('Please provide path to configuration file [--config]')
 
         raw_configuration = self.configuration_loader.load(args.config)
+        if args.timeout:
+            raw_configuration['checklists']['timeout'] = args.timeout
+        if args.loop:
+            raw_configuration['checklists']['loop'] = args.loop
+        if args.workers:
+            raw_configuration['checklists']['workers'] = args.workers
         return self._provide(raw_configuration)
 
     def _load_checklist_provider(self, raw_configuration: Dict[str, Any]) -> BaseChecklistsProvider:
+        set_event_loop_implementation(raw_configuration['checklists'].get('loop'))
+        set_process_max_concurrency(raw_configuration['checklists'].get('max_concurrency'))
+        blocking_configuration = raw_configuration['checklists'].get('blocking', {})
+        set_process_blocking_executor(blocking_configuration.get('max_workers'), blocking_configuration.get('timeout'))
+        circuit_breaker_configuration = raw_configuration['checklists'].get('circuit_breaker', {})
+        set_process_circuit_breakers(circuit_breaker_configuration.get('failure_threshold'),
+                                     circuit_breaker_configuration.get('cooldown'))
+        set_process_rate_limiters(raw_configuration['checklists'].get('rate_limit'))
+        set_process_loop_lag_monitor(raw_configuration['checklists'].get('loop_lag'))
         return self.checklists_loader.load_checklists(
             list(map(ChecklistLoaderSourceEntry.ofDict, raw_configuration['checklists']['sources'])),
             raw_configuration['checklists'].get('configurations', {}))
 
+    def _get_timeout(self, raw_configuration: Dict[str, Any]) -> Optional[float]:
+        timeout = raw_configuration['checklists'].get('timeout')
+        return float(timeout) if timeout else None
+
     def _provide(self, raw_configuration: Dict[str, Any]) -> BaseRunner:
-        return CliRunner(self._load_checklist_provider(raw_configuration))
+        return CliRunner(self._load_checklist_provider(raw_configuration), self._get_timeout(raw_configuration),
+                         int(raw_configuration['checklists'].get('workers', 1)))
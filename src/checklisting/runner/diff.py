@@ -0,0 +1,51 @@
+import argparse
+from typing import Optional
+
+from checklisting.output.logging import LoggingOutputWriter
+from checklisting.result import BaseTaskResult, MultiTaskResult, TaskResult
+from checklisting.result.diff import describe_change, diff_results
+from checklisting.result.status import TaskResultStatus
+from checklisting.serializer import BaseDeserializer
+from checklisting.serializer.json import JsonDeserializer
+
+from . import BaseRunner, BaseRunnerFactory
+
+
+class DiffRunner(BaseRunner):
+
+    # each change is reported as result of its own, carrying status the result has now (unknown once removed)
+    def __init__(self, old_path: str, new_path: str, deserializer: Optional[BaseDeserializer] = None) -> None:
+        super().__init__()
+        self._output_writer = LoggingOutputWriter()
+        self._old_path = old_path
+        self._new_path = new_path
+        self._deserializer = deserializer or JsonDeserializer()
+
+    def _load(self, path: str) -> BaseTaskResult:
+        with open(path) as stream:
+            loaded = self._deserializer.loads(stream.read())
+        # output of webserver holds a list of results of checklists
+        if isinstance(loaded, list):
+            return MultiTaskResult(TaskResultStatus.UNKNOWN, 'Checklists', loaded)
+        return loaded
+
+    def diff(self, old: BaseTaskResult, new: BaseTaskResult) -> BaseTaskResult:
+        changes = [
+            TaskResult(change.new.status if change.new is not None else TaskResultStatus.UNKNOWN,
+                       describe_change(change)) for change in diff_results(old, new)
+        ]
+        if not changes:
+            return TaskResult(TaskResultStatus.SUCCESS, 'No changes')
+        status = max((change.status for change in changes), key=lambda status: status.value)
+        return MultiTaskResult(status, f'Found [{len(changes)}] changes', changes)
+
+    def run(self) -> None:
+        self._output_writer.write(self.diff(self._load(self._old_path), self._load(self._new_path)))
+
+
+class DiffRunnerFactory(BaseRunnerFactory):
+
+    def provide(self, args: argparse.Namespace) -> BaseRunner:
+        if not args.old or not args.new:
+            raise RuntimeError('Please provide results to compare [--old] and [--new]')
+        return DiffRunner(args.old, args.new)
@@ -1,9 +1,19 @@
 import argparse
+import asyncio
+import sys
 from itertools import chain
-from typing import Iterator
+from typing import AsyncIterator, Iterable, Iterator, Optional, TextIO
 
+from checklisting.blocking import get_default_blocking_executor
+from checklisting.deadline import deadline_scope
 from checklisting.extras import import_module
+from checklisting.fleet import (DEFAULT_INITIAL_CONCURRENCY, DEFAULT_MAX_CONCURRENCY, AdaptiveConcurrencyLimit,
+                                FleetExecutor)
+from checklisting.hedging import HedgingPolicy
+from checklisting.loop import set_event_loop_implementation
+from checklisting.output.logging import LoggingOutputWriter
 from checklisting.provider import StaticChecklistsProvider
+from checklisting.result import BaseTaskResult
 from checklisting.task import Checklist
 from checklisting.tasks.external import ExternalChecklistTask
 
@@ -20,11 +30,75 @@ def _fix_url(source: str) -> str:
         return source
 
 
+def _parse_sources(items: Iterable[str]) -> Iterator[yarl.URL]:
+    # each item may hold several comma separated sources
+    return map(yarl.URL, map(_fix_url, filter(None, map(str.strip, chain.from_iterable(
+        item.split(',') for item in items)))))
+
+
+async def _read_lines(stream: TextIO) -> AsyncIterator[str]:
+    # lines are read one by one in a thread, so sources produced slowly (e.g. piped from discovery) do not block
+    executor = get_default_blocking_executor()
+    while True:
+        line = await executor.run('ExternalFleetRunner', stream.readline)
+        if not line:
+            return
+        if not line.lstrip().startswith('#'):
+            yield line
+
+
+async def _read_sources(stream: TextIO) -> AsyncIterator[yarl.URL]:
+    async for line in _read_lines(stream):
+        for source in _parse_sources([line]):
+            yield source
+
+
 class ExternalChecklistRunner(CliRunner):
 
-    def __init__(self, sources: Iterator[yarl.URL]) -> None:
+    def __init__(self,
+                 sources: Iterator[yarl.URL],
+                 timeout: Optional[float] = None,
+                 hedging_policy: Optional[HedgingPolicy] = None) -> None:
         super().__init__(
-            StaticChecklistsProvider([Checklist('external', (ExternalChecklistTask(source) for source in sources))]))
+            StaticChecklistsProvider([
+                Checklist('external', (ExternalChecklistTask(source, hedging_policy=hedging_policy)
+                                       for source in sources))
+            ]), timeout)
+
+
+class ExternalFleetRunner(BaseRunner):
+
+    # sources are streamed from file (or stdin for '-') and results are written out as soon as they are known, so
+    # memory is bounded by number of sources checked concurrently; timeout applies to each source on its own
+    def __init__(self,
+                 sources_path: str,
+                 timeout: Optional[float] = None,
+                 hedging_policy: Optional[HedgingPolicy] = None,
+                 fleet_executor: Optional[FleetExecutor[yarl.URL]] = None) -> None:
+        super().__init__()
+        self._output_writer = LoggingOutputWriter()
+        self._sources_path = sources_path
+        self._timeout = timeout
+        self._hedging_policy = hedging_policy
+        self._fleet_executor = fleet_executor or FleetExecutor[yarl.URL]()
+
+    async def _check(self, source: yarl.URL) -> BaseTaskResult:
+        with deadline_scope(self._timeout):
+            return await ExternalChecklistTask(source, hedging_policy=self._hedging_policy).execute()
+
+    async def _execute(self, stream: TextIO) -> BaseTaskResult:
+        summary = await self._fleet_executor.run(_read_sources(stream), self._check, self._output_writer.write)
+        return summary.to_result()
+
+    def run(self) -> None:
+        loop = asyncio.get_event_loop()
+        if self._sources_path == '-':
+            result = loop.run_until_complete(self._execute(sys.stdin))
+        else:
+            with open(self._sources_path) as stream:
+                result = loop.run_until_complete(self._execute(stream))
+        loop.close()
+        self._output_writer.write(result)
 
 
 class ExternalChecklistRunnerFactory(BaseRunnerFactory):
@@ -37,16 +111,19 @@ class ExternalChecklistRunnerFactory(BaseRunnerFactory):
         return 'external'
 
     def provide(self, args: argparse.Namespace) -> BaseRunner:
-        if not args.sources:
-            raise RuntimeError('Please provide external sources to checklist [-s | --source | --sources]')
-
-        sources = list(
-            map(
-                yarl.URL,
-                map(
-                    _fix_url,
-                    filter(
-                        None,
-                        chain.from_iterable(
-                            filter(None, map(lambda item: item.split(','), chain.from_iterable(args.sources))))))))
-        return ExternalChecklistRunner(sources)
+        if not args.sources and not args.sources_file:
+            raise RuntimeError('Please provide external sources to checklist [-s | --source | --sources] ' +
+                               'or file to read them from [--sources-file]')
+
+        set_event_loop_implementation(args.loop)
+        # latencies of the whole fleet are observed, so hedging picks up even during a single run
+        hedging_policy = HedgingPolicy(default_delay=args.hedge_delay) if args.hedge_delay else None
+        if args.sources_file:
+            max_concurrency = args.max_concurrency or DEFAULT_MAX_CONCURRENCY
+            concurrency_limit = AdaptiveConcurrencyLimit(min(DEFAULT_INITIAL_CONCURRENCY, max_concurrency),
+                                                         maximum=max_concurrency)
+            return ExternalFleetRunner(args.sources_file, args.timeout, hedging_policy,
+                                       FleetExecutor[yarl.URL](concurrency_limit))
+
+        sources = list(_parse_sources(chain.from_iterable(args.sources)))
+        return ExternalChecklistRunner(sources, args.timeout, hedging_policy)
@@ -1,13 +1,26 @@
 import asyncio
+import json
+import os
+import tempfile
 from logging import getLogger
-from typing import Any, Dict, Optional
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 from aiohttp import web
 
+from checklisting.deadline import deadline_scope
+from checklisting.lag import LoopLagMonitor, create_self_check, get_default_loop_lag_monitor
 from checklisting.output.logging import LoggingOutputWriter
+from checklisting.periodic import PeriodicTaskExecutor, ResultSnapshot
+from checklisting.profiling import BaseProfiler, create_profiler
 from checklisting.provider import BaseChecklistsProvider
+from checklisting.result import BaseTaskResult
+from checklisting.result.query import ResultIndex, parse_path
+from checklisting.result.status import TaskResultStatus
 from checklisting.serializer import BaseSerializer
 from checklisting.serializer.json import JsonSerializer
+from checklisting.singleflight import SingleFlight
+from checklisting.task import Checklist, StreamedResult
+from checklisting.tasks.periodic import set_default_background_execution
 
 from .. import BaseRunner
 from ..cli import CliRunnerFactory
@@ -15,37 +28,309 @@ from ..cli import CliRunnerFactory
 _logger = getLogger('checklisting.runner.web')
 
 
+def _wants_messages(request: web.Request) -> bool:
+    # e.g. dashboards showing only statuses ask for ?messages=0, so messages are not even rendered for them
+    return request.query.get('messages') not in ('0', 'false')
+
+
+class ChecklistsExecution(object):
+
+    # results of a single execution of checklists, which are serialized (per serializer) and indexed at most once
+    def __init__(self, results: List[Tuple[str, BaseTaskResult]]) -> None:
+        self._results = results
+        self._serialized: Dict[BaseSerializer, str] = {}
+        self._index: Optional[ResultIndex] = None
+
+    def dumps(self, serializer: BaseSerializer) -> str:
+        if serializer not in self._serialized:
+            self._serialized[serializer] = serializer.dumps([result for (_, result) in self._results])
+        return self._serialized[serializer]
+
+    @property
+    def index(self) -> ResultIndex:
+        if self._index is None:
+            self._index = ResultIndex(self._results)
+        return self._index
+
+
 class ChecklistHttpHandler(object):
 
-    def __init__(self, checklist_provider: BaseChecklistsProvider,
-                 serializer: Optional[BaseSerializer] = None) -> None:
+    def __init__(self,
+                 checklist_provider: BaseChecklistsProvider,
+                 serializer: Optional[BaseSerializer] = None,
+                 timeout: Optional[float] = None,
+                 self_check: Optional[Checklist] = None) -> None:
         self._checklist_provider = checklist_provider
         self._serializer = serializer or JsonSerializer()
+        self._status_serializer = JsonSerializer(messages=False)
         self._logging_writer = LoggingOutputWriter()
+        self._timeout = timeout
+        self._self_check = self_check
+        self._single_flight: SingleFlight[ChecklistsExecution] = SingleFlight()
 
-    async def __call__(self, request: web.Request) -> web.Response:
-        checklists_results = await asyncio.gather(*[c.execute() for c in self._checklist_provider.get_all()])
+    def _get_request_timeout(self, request: web.Request) -> Optional[float]:
+        try:
+            return float(request.query['timeout'])
+        except (KeyError, ValueError):
+            return None
+
+    async def __call__(self, request: web.Request) -> web.StreamResponse:
+        timeout = self._get_request_timeout(request)
+        if request.query.get('stream') in ('1', 'true'):
+            return await self._stream(request, timeout)
+        serializer = self._serializer if _wants_messages(request) else self._status_serializer
+        execution = await self._execute(timeout)
+        return web.Response(body=execution.dumps(serializer), content_type='application/json')
+
+    def _dumps_streamed(self, checklist: Checklist, streamed: StreamedResult) -> bytes:
+        return (f'{{"checklist": {json.dumps(checklist.name)}, "path": {json.dumps(list(streamed.path))}, ' +
+                f'"result": {self._serializer.dumps(streamed.result)}}}\n').encode()
+
+    async def _stream(self, request: web.Request, timeout: Optional[float]) -> web.StreamResponse:
+        # each result is written as a separate JSON line as soon as it is known; results of checklists come last
+        response = web.StreamResponse(headers={'Content-Type': 'application/x-ndjson'})
+        await response.prepare(request)
+
+        queue: asyncio.Queue = asyncio.Queue()
+
+        async def forward(checklist: Checklist) -> None:
+            async for streamed in checklist.execute_stream():
+                queue.put_nowait((checklist, streamed))
+
+        # checklist failing to stream its results does not cut those of the others short, its error is written instead
+        checklists = list(self._checklist_provider.get_all())
+        with deadline_scope(self._timeout), deadline_scope(timeout):
+            forwarding = asyncio.ensure_future(
+                asyncio.gather(*[forward(checklist) for checklist in checklists], return_exceptions=True))
+        forwarding.add_done_callback(lambda _: queue.put_nowait(None))
+        try:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    break
+                (checklist, streamed) = item
+                if not streamed.path:
+                    self._logging_writer.write(streamed.result)
+                await response.write(self._dumps_streamed(checklist, streamed))
+        finally:
+            forwarding.cancel()
+
+        for (checklist, outcome) in zip(checklists, forwarding.result()):
+            if isinstance(outcome, Exception):
+                _logger.error(f'Streaming results of checklist [{checklist.name}] failed', exc_info=outcome)
+                await response.write((f'{{"checklist": {json.dumps(checklist.name)}, ' +
+                                      f'"error": {json.dumps(str(outcome))}}}\n').encode())
+
+        if self._self_check is not None:
+            async for streamed in self._self_check.execute_stream():
+                if not streamed.path:
+                    self._logging_writer.write(streamed.result)
+                await response.write(self._dumps_streamed(self._self_check, streamed))
+        await response.write_eof()
+        return response
+
+    async def _run(self, timeout: Optional[float]) -> List[Tuple[str, BaseTaskResult]]:
+        checklists = list(self._checklist_provider.get_all())
+        with deadline_scope(self._timeout), deadline_scope(timeout):
+            checklists_results = await asyncio.gather(*[c.execute() for c in checklists])
+        if self._self_check is not None:
+            checklists.append(self._self_check)
+            checklists_results.append(await self._self_check.execute())
 
         for checklist_results in checklists_results:
             self._logging_writer.write(checklist_results)
 
-        return web.Response(body=self._serializer.dumps(checklists_results), content_type='application/json')
+        return list(zip([checklist.name for checklist in checklists], checklists_results))
+
+    async def _execute(self, timeout: Optional[float]) -> ChecklistsExecution:
+        # concurrent requests, either for all results or for some of them, share the execution already in progress
+        return await self._single_flight.run(timeout, lambda: self._create_execution(timeout))
+
+    async def _create_execution(self, timeout: Optional[float]) -> ChecklistsExecution:
+        return ChecklistsExecution(await self._run(timeout))
+
+    async def get_index(self, request: web.Request) -> ResultIndex:
+        return (await self._execute(self._get_request_timeout(request))).index
+
+
+class SnapshotChecklistHttpHandler(object):
+
+    STALE_HEADER = 'X-Checklisting-Stale'
+
+    def __init__(self,
+                 executors: Iterable[PeriodicTaskExecutor],
+                 serializer: Optional[BaseSerializer] = None,
+                 names: Optional[Iterable[str]] = None) -> None:
+        self._executors = list(executors)
+        self._serializer = serializer or JsonSerializer()
+        self._status_serializer = JsonSerializer(messages=False)
+        self._serialized: Dict[BaseSerializer, Tuple[List[ResultSnapshot], str]] = {}
+        self._names = list(names) if names is not None else [str(idx) for idx in range(len(self._executors))]
+        assert len(self._names) == len(self._executors)
+        self._indexed: Tuple[List[ResultSnapshot], ResultIndex] = ([], ResultIndex([]))
+
+    def _dumps(self, snapshots: List[ResultSnapshot], serializer: BaseSerializer) -> str:
+        # snapshots change once per refresh interval, so there is no need to serialize them on each request
+        (serialized_snapshots, body) = self._serialized.get(serializer, ([], ''))
+        if len(serialized_snapshots) != len(snapshots) or \
+                any(old is not new for (old, new) in zip(serialized_snapshots, snapshots)):
+            body = serializer.dumps([snapshot.result for snapshot in snapshots])
+            self._serialized[serializer] = (snapshots, body)
+        return body
+
+    async def get_index(self, request: web.Request) -> ResultIndex:
+        # as with serialization, snapshots are indexed once per refresh
+        snapshots = await asyncio.gather(*[executor.get_snapshot() for executor in self._executors])
+        (indexed_snapshots, index) = self._indexed
+        if len(indexed_snapshots) != len(snapshots) or \
+                any(old is not new for (old, new) in zip(indexed_snapshots, snapshots)):
+            index = ResultIndex(zip(self._names, [snapshot.result for snapshot in snapshots]))
+            self._indexed = (list(snapshots), index)
+        return index
+
+    async def __call__(self, request: web.Request) -> web.Response:
+        snapshots = await asyncio.gather(*[executor.get_snapshot() for executor in self._executors])
+        serializer = self._serializer if _wants_messages(request) else self._status_serializer
+        age = max([executor.age or 0.0 for executor in self._executors], default=0.0)
+        is_stale = any(executor.is_stale for executor in self._executors)
+        return web.Response(
+            body=self._dumps(list(snapshots), serializer),
+            content_type='application/json',
+            headers={
+                'Age': str(int(age)),
+                SnapshotChecklistHttpHandler.STALE_HEADER: str(is_stale).lower()
+            })
+
+
+class ResultQueryHttpHandler(object):
+
+    # e.g. GET /results?checklist=foo&status=FAILURE&path=/0/1&leaves=1 returns only the matching results (each with
+    # its subtasks) instead of the whole trees; all parameters are optional
+    def __init__(self,
+                 get_index: Callable[[web.Request], Awaitable[ResultIndex]],
+                 serializer: Optional[BaseSerializer] = None) -> None:
+        self._get_index = get_index
+        self._serializer = serializer or JsonSerializer()
+
+    async def __call__(self, request: web.Request) -> web.Response:
+        try:
+            status = TaskResultStatus[request.query['status'].upper()] if 'status' in request.query else None
+            path = parse_path(request.query.get('path', ''))
+        except (KeyError, ValueError):
+            return web.Response(status=400, text='Invalid status or path')
+
+        index = await self._get_index(request)
+        checklist = request.query.get('checklist')
+        if checklist is not None and checklist not in index.checklists:
+            return web.Response(status=404, text=f'Unknown checklist [{checklist}]')
+        found = index.find(checklist, status, path, request.query.get('leaves') in ('1', 'true'))
+        body = ', '.join(f'{{"checklist": {json.dumps(name)}, "path": {json.dumps(list(found_path))}, ' +
+                         f'"result": {self._serializer.dumps(result)}}}' for (name, found_path, result) in found)
+        return web.Response(body=f'[{body}]', content_type='application/json')
+
+
+class ProfilingHttpHandler(object):
+
+    # checklists are always executed anew, so profile is not affected by sharing or caching of results
+    def __init__(self, checklist_provider: BaseChecklistsProvider, timeout: Optional[float] = None) -> None:
+        self._checklist_provider = checklist_provider
+        self._timeout = timeout
+
+    async def __call__(self, request: web.Request) -> web.Response:
+        try:
+            profiler = create_profiler(request.query.get('profiler', 'cprofile'))
+        except RuntimeError as e:
+            return web.Response(status=400, text=str(e))
+        try:
+            profiler.start()
+        except RuntimeError as e:
+            return web.Response(status=409, text=str(e))
+
+        try:
+            with deadline_scope(self._timeout):
+                await asyncio.gather(*[c.execute() for c in self._checklist_provider.get_all()])
+        finally:
+            profiler.stop()
+
+        if request.query.get('output') == 'raw':
+            return web.Response(body=self._dumps(profiler), content_type='application/octet-stream')
+        return web.Response(text=profiler.report())
+
+    def _dumps(self, profiler: BaseProfiler) -> bytes:
+        (fd, path) = tempfile.mkstemp(suffix=os.path.splitext(profiler.DEFAULT_OUTPUT)[1])
+        os.close(fd)
+        try:
+            profiler.dump(path)
+            with open(path, 'rb') as stream:
+                return stream.read()
+        finally:
+            os.remove(path)
+
+
+class LoopLagHttpHandler(object):
+
+    def __init__(self, monitor: LoopLagMonitor) -> None:
+        self._monitor = monitor
+
+    async def __call__(self, request: web.Request) -> web.Response:
+        stats = self._monitor.get_stats()
+        return web.json_response(dict(stats._asdict(), stalls=[stall._asdict() for stall in stats.stalls]))
 
 
 class WebserverRunner(BaseRunner):
 
-    def __init__(self, addr: str, port: int, checklists_provider: BaseChecklistsProvider) -> None:
+    def __init__(self,
+                 addr: str,
+                 port: int,
+                 checklists_provider: BaseChecklistsProvider,
+                 timeout: Optional[float] = None,
+                 refresh_interval: Optional[float] = None,
+                 checklist_refresh_intervals: Optional[Dict[str, float]] = None,
+                 profiling: bool = False) -> None:
         super().__init__()
         self._addr = addr
         self._port = port
         self._checklists_provider = checklists_provider
+        self._timeout = timeout
+        self._refresh_interval = refresh_interval
+        self._checklist_refresh_intervals = checklist_refresh_intervals or {}
+        self._profiling = profiling
+
+    def _create_handler(
+            self, monitor: Optional[LoopLagMonitor]) -> Union[ChecklistHttpHandler, SnapshotChecklistHttpHandler]:
+        self_check = create_self_check(monitor) if monitor is not None else None
+        if not self._refresh_interval:
+            return ChecklistHttpHandler(self._checklists_provider, timeout=self._timeout, self_check=self_check)
+
+        # results of checklists are logged once per refresh, as they are once per request without snapshots
+        logging_writer = LoggingOutputWriter()
+        checklists = list(self._checklists_provider.get_all()) + ([self_check] if self_check is not None else [])
+        executors = [
+            PeriodicTaskExecutor(checklist,
+                                 self._checklist_refresh_intervals.get(checklist.name, self._refresh_interval),
+                                 self._timeout,
+                                 on_refresh=logging_writer.write) for checklist in checklists
+        ]
+        for executor in executors:
+            executor.start()
+        return SnapshotChecklistHttpHandler(executors, names=[checklist.name for checklist in checklists])
 
     def run(self) -> None:
-        handler = ChecklistHttpHandler(self._checklists_provider)
+        set_default_background_execution(True)
+        loop = asyncio.get_event_loop()
+        monitor = get_default_loop_lag_monitor()
+        if monitor is not None:
+            monitor.start(loop)
+
+        handler = self._create_handler(monitor)
         app = web.Application()
         app.router.add_route('GET', '/', handler)
+        app.router.add_route('GET', '/results', ResultQueryHttpHandler(handler.get_index))
+        if monitor is not None:
+            app.router.add_route('GET', '/loop-lag', LoopLagHttpHandler(monitor))
+        if self._profiling:
+            app.router.add_route('GET', '/profile', ProfilingHttpHandler(self._checklists_provider, self._timeout))
 
-        loop = asyncio.get_event_loop()
         future = loop.create_server(app.make_handler(), self._addr, self._port)
         srv = loop.run_until_complete(future)
         _logger.info('serving on [%s]', srv.sockets[0].getsockname())
@@ -62,4 +347,10 @@ class WebserverRunnerFactory(CliRunnerFactory):
         config = raw_configuration.get('web', {}).get('server', {})
         port = int(config.get('port', 8080))
         addr = config.get('addr', '127.0.0.1')
-        return WebserverRunner(addr, port, self._load_checklist_provider(raw_configuration))
+        refresh_interval = config.get('refresh_interval')
+        checklist_refresh_intervals = dict(
+            (name, float(interval)) for (name, interval) in config.get('checklist_refresh_intervals', {}).items())
+        return WebserverRunner(addr, port, self._load_checklist_provider(raw_configuration),
+                               self._get_timeout(raw_configuration),
+                               float(refresh_interval) if refresh_interval else None, checklist_refresh_intervals,
+                               bool(config.get('profiling', False)))
@@ -0,0 +1,51 @@
+import asyncio
+from typing import Optional
+
+from checklisting.result import BaseTaskResult
+from checklisting.task import (BaseTask, BaseTaskScheduler, ConcurrentTaskScheduler, get_default_scheduler,
+                               queueing_scope, set_default_scheduler)
+
+
+class BoundedTaskScheduler(BaseTaskScheduler):
+
+    def __init__(self, max_concurrency: int, inner_scheduler: Optional[BaseTaskScheduler] = None) -> None:
+        assert max_concurrency > 0
+        super().__init__()
+        self._max_concurrency = max_concurrency
+        self._inner_scheduler = inner_scheduler
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def max_concurrency(self) -> int:
+        return self._max_concurrency
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # semaphore is bound to the loop it was created in, so create one per loop
+        loop = asyncio.get_event_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+            self._loop = loop
+        return self._semaphore
+
+    def _get_inner_scheduler(self) -> BaseTaskScheduler:
+        return self._inner_scheduler or get_default_scheduler()
+
+    async def schedule(self, task: BaseTask) -> BaseTaskResult:
+        # composite tasks only wait for their subtasks; holding a slot while doing so could starve them
+        if task.is_composite:
+            return await task.execute()
+
+        with queueing_scope():
+            async with self._get_semaphore():
+                inner_scheduler = self._get_inner_scheduler()
+                if inner_scheduler is self:
+                    return await task.execute()
+                return await inner_scheduler.schedule(task)
+
+
+def set_process_max_concurrency(max_concurrency: Optional[int]) -> None:
+    if max_concurrency:
+        set_default_scheduler(BoundedTaskScheduler(max_concurrency, ConcurrentTaskScheduler()))
+    else:
+        set_default_scheduler(ConcurrentTaskScheduler())
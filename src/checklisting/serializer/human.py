@@ -23,4 +23,17 @@ class HumanReadableSerializer(BaseSerializer):
 
     def _msg(self, result: BaseTaskResult, indent_level: int) -> str:
         indentation = ' ' * HumanReadableSerializer.INDENT_LENGTH * indent_level
-        return f'{indentation}[{result.status:<8}] {result.message}'
+        return f'{indentation}[{result.status:<8}] {result.message}{self._details(result)}'
+
+    def _details(self, result: BaseTaskResult) -> str:
+        details = []
+        timing = result.timing
+        if timing is not None:
+            details.append(f'took {timing.duration:.3f}s')
+            if timing.queued >= 0.001:
+                details.append(f'queued {timing.queued:.3f}s')
+            if timing.throttled >= 0.001:
+                details.append(f'throttled {timing.throttled:.3f}s')
+        if result.retries:
+            details.append(f'retried {result.retries}x')
+        return f' ({", ".join(details)})' if details else ''
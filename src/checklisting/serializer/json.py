@@ -1,39 +1,58 @@
 import json
+from functools import partial
 from typing import Iterable
 
-from checklisting.result import BaseTaskResult, MultiTaskResult, TaskResult
+from checklisting.result import BaseTaskResult, MultiTaskResult, TaskResult, TaskTiming
 from checklisting.result.status import TaskResultStatus
 
 from . import BaseDeserializer, BaseSerializer
 
 
-def task_result_encoder(obj):
+def task_result_encoder(obj, messages: bool = True):
     if isinstance(obj, TaskResultStatus):
         return str(obj)
     if isinstance(obj, BaseTaskResult):
-        output = dict(status=obj.status, message=obj.message)
+        # without messages, lazy ones (see LazyMessage) are never rendered
+        output = dict(status=obj.status, message=obj.message) if messages else dict(status=obj.status)
+        if obj.timing is not None:
+            output['timing'] = obj.timing._asdict()
+        if obj.retries:
+            output['retries'] = obj.retries
         if isinstance(obj, MultiTaskResult):
             output['results'] = obj.results
         return output
     raise TypeError(f"Cannot JSON-encode obj {type(obj)}")
 
 
+# results serialized without messages have no other keys, unlike other objects with status, which are left as is
+_STATUS_ONLY_KEYS = frozenset(['status', 'timing', 'retries', 'results'])
+
+
 def task_result_decoder(obj):
-    if 'status' in obj and 'message' in obj:
+    if 'status' in obj and ('message' in obj or obj.keys() <= _STATUS_ONLY_KEYS):
         status = TaskResultStatus[obj['status']]
-        message = obj['message']
+        message = obj.get('message', '')
+        # fields added to timing later may be missing in output of older versions
+        timing = TaskTiming(**{field: value
+                               for (field, value) in obj['timing'].items() if field in TaskTiming._fields
+                               }) if 'timing' in obj else None
 
         if 'results' in obj and isinstance(obj['results'], Iterable):
-            return MultiTaskResult(status, message, obj['results'])
+            result = MultiTaskResult(status, message, obj['results'], timing)
         else:
-            return TaskResult(status, message)
+            result = TaskResult(status, message, timing)
+        return result.with_retries(obj['retries']) if obj.get('retries') else result
     return obj
 
 
 class JsonSerializer(BaseSerializer):
 
+    def __init__(self, messages: bool = True) -> None:
+        super().__init__()
+        self._encoder = task_result_encoder if messages else partial(task_result_encoder, messages=False)
+
     def dumps(self, result: BaseTaskResult) -> str:
-        return json.dumps(result, default=task_result_encoder)
+        return json.dumps(result, default=self._encoder)
 
 
 class JsonDeserializer(BaseDeserializer):
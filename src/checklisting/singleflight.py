@@ -0,0 +1,26 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, Generic, Hashable, TypeVar
+
+R = TypeVar('R')
+
+
+class SingleFlight(Generic[R]):
+
+    def __init__(self) -> None:
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+
+    def __len__(self) -> int:
+        return len(self._in_flight)
+
+    async def run(self, key: Hashable, factory: Callable[[], Awaitable[R]]) -> R:
+        future = self._in_flight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(factory())
+            self._in_flight[key] = future
+            future.add_done_callback(lambda done: self._forget(key, done))
+        # one of the callers going away must not cancel the call for the others
+        return await asyncio.shield(future)
+
+    def _forget(self, key: Hashable, future: asyncio.Future) -> None:
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
@@ -1,45 +1,281 @@
 import asyncio
+import time
 from abc import ABC, abstractmethod
-from typing import Iterable, Optional
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Awaitable, Callable, Iterable, Iterator, List, NamedTuple, Optional, Tuple
 
-from .result import BaseTaskResult, TaskResult
+from .deadline import get_remaining_time
+from .profiling import observe_execution
+from .result import BaseTaskResult, TaskResult, TaskTiming
 from .result.builder import MultiTaskResultBuilder
 from .result.message.builder import PrefixedTaskResultMessageBuilder
 from .result.status import TaskResultStatus
 
+_scheduled_at: ContextVar[Optional[float]] = ContextVar('checklisting_scheduled_at', default=None)
+_throttled: ContextVar[Optional[List[float]]] = ContextVar('checklisting_throttled', default=None)
+
+# path is made of indexes of subtasks leading to the task within the tree, root has an empty one
+StreamedResult = NamedTuple('StreamedResult', [('path', Tuple[int, ...]), ('result', BaseTaskResult)])
+
+_result_sink: ContextVar[Optional[Callable[[StreamedResult], None]]] = ContextVar('checklisting_result_sink',
+                                                                                  default=None)
+_stream_path: ContextVar[Tuple[int, ...]] = ContextVar('checklisting_stream_path', default=())
+
+
+@contextmanager
+def queueing_scope() -> Iterator[None]:
+    # task executed within the scope reports time since its start as queueing; outermost scope wins
+    if _scheduled_at.get() is not None:
+        yield
+        return
+
+    token = _scheduled_at.set(time.monotonic())
+    try:
+        yield
+    finally:
+        _scheduled_at.reset(token)
+
+
+def report_throttling(delay: float) -> None:
+    # reported time is added to timing of currently executed task
+    throttled = _throttled.get()
+    if throttled is not None:
+        throttled[0] += delay
+
 
 class BaseTask(ABC):
 
+    @property
+    def is_composite(self) -> bool:
+        # composite tasks only wait for their subtasks, which are run by scheduler on their own
+        return False
+
     async def execute(self) -> BaseTaskResult:
+        scheduled_at = _scheduled_at.get()
+        # subtasks are queued on their own
+        token = _scheduled_at.set(None)
+        # throttling of subtasks counts towards their parents too
+        parent_throttled = _throttled.get()
+        throttled = [0.0]
+        throttled_token = _throttled.set(throttled)
+        started = time.monotonic()
+        started_at = time.time()
         try:
-            return await self._execute()
+            result = await observe_execution(self, self._execute_within_deadline())
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
-            return TaskResult(TaskResultStatus.FAILURE, str(e))
+            result = TaskResult(TaskResultStatus.FAILURE, str(e))
+        finally:
+            _scheduled_at.reset(token)
+            _throttled.reset(throttled_token)
+            if parent_throttled is not None:
+                parent_throttled[0] += throttled[0]
+
+        duration = time.monotonic() - started
+        queued = 0.0 if scheduled_at is None else started - scheduled_at
+        return result.with_timing(TaskTiming(started_at, started_at + duration, duration, queued, throttled[0]))
+
+    async def _execute_within_deadline(self) -> BaseTaskResult:
+        timeout = get_remaining_time()
+        if timeout is None:
+            return await self._execute()
+
+        started = time.monotonic()
+        try:
+            return await asyncio.wait_for(self._execute(), timeout)
+        except asyncio.TimeoutError:
+            return TaskResult(TaskResultStatus.FAILURE,
+                              f'Task [{self.__class__.__name__}] timed out after ' +
+                              f'[{time.monotonic() - started:.3f}] seconds')
 
     @abstractmethod
     async def _execute(self) -> BaseTaskResult:
         pass
 
 
+class WrapperTask(BaseTask):
+
+    def __init__(self, task: BaseTask) -> None:
+        super().__init__()
+        self._task = task
+
+    @property
+    def task(self) -> BaseTask:
+        return self._task
+
+    @property
+    def is_composite(self) -> bool:
+        return self._task.is_composite
+
+    async def _execute_within_deadline(self) -> BaseTaskResult:
+        # wrapped task enforces the deadline on its own
+        return await self._execute()
+
+    async def _execute(self) -> BaseTaskResult:
+        return await self._task.execute()
+
+
+class BaseTaskScheduler(ABC):
+
+    # each task is passed, along with its index, to schedule hook if given (e.g. by MultiTask streaming results), which
+    # calls schedule method on its own; overrides of run have to do the same
+    async def run(self,
+                  tasks: Iterable[BaseTask],
+                  schedule: Optional[Callable[[int, BaseTask], Awaitable[BaseTaskResult]]] = None
+                  ) -> List[BaseTaskResult]:
+        if schedule is None:
+            return list(await asyncio.gather(*[self.schedule(task) for task in tasks]))
+        return list(await asyncio.gather(*[schedule(idx, task) for (idx, task) in enumerate(tasks)]))
+
+    @abstractmethod
+    async def schedule(self, task: BaseTask) -> BaseTaskResult:
+        pass
+
+
+class ConcurrentTaskScheduler(BaseTaskScheduler):
+
+    async def schedule(self, task: BaseTask) -> BaseTaskResult:
+        return await task.execute()
+
+
+_default_scheduler: BaseTaskScheduler = ConcurrentTaskScheduler()
+_current_scheduler: ContextVar[BaseTaskScheduler] = ContextVar('checklisting_current_scheduler')
+
+
+def get_default_scheduler() -> BaseTaskScheduler:
+    return _default_scheduler
+
+
+def set_default_scheduler(scheduler: BaseTaskScheduler) -> None:
+    global _default_scheduler
+    _default_scheduler = scheduler
+
+
 class MultiTask(BaseTask):
 
-    def __init__(self, tasks: Iterable[BaseTask], result_builder: Optional[MultiTaskResultBuilder] = None) -> None:
+    def __init__(self,
+                 tasks: Iterable[BaseTask],
+                 result_builder: Optional[MultiTaskResultBuilder] = None,
+                 scheduler: Optional[BaseTaskScheduler] = None,
+                 fail_fast: bool = False) -> None:
         super().__init__()
         self._tasks = tasks
         self._result_builder = result_builder or MultiTaskResultBuilder()
+        self._scheduler = scheduler
+        self._fail_fast = fail_fast
+
+    @property
+    def is_composite(self) -> bool:
+        return True
+
+    def _get_scheduler(self) -> BaseTaskScheduler:
+        # nested tasks without own scheduler share the one of their parent so its limits cover whole subtree
+        return self._scheduler or _current_scheduler.get(None) or get_default_scheduler()
+
+    async def _execute_within_deadline(self) -> BaseTaskResult:
+        # subtasks enforce the deadline on their own, so results of those finished in time are kept
+        return await self._execute()
 
     async def _execute(self) -> BaseTaskResult:
-        results = await asyncio.gather(*[task.execute() for task in self._tasks])
+        scheduler = self._get_scheduler()
+        token = _current_scheduler.set(scheduler)
+        try:
+            results = await self._run(scheduler)
+        finally:
+            _current_scheduler.reset(token)
         return self._result_builder.of_results(results)
 
+    async def execute_stream(self) -> AsyncIterator[StreamedResult]:
+        # results of all subtasks in the tree are yielded as they complete, followed by the one of this task
+        queue: asyncio.Queue = asyncio.Queue()
+        execution = asyncio.ensure_future(self._execute_streamed(queue.put_nowait))
+        execution.add_done_callback(lambda _: queue.put_nowait(None))
+        try:
+            while True:
+                streamed = await queue.get()
+                if streamed is None:
+                    break
+                yield streamed
+            yield StreamedResult((), execution.result())
+        finally:
+            execution.cancel()
+
+    async def _execute_streamed(self, sink: Callable[[StreamedResult], None]) -> BaseTaskResult:
+        # executed as a separate asyncio task, so the context set here is not visible to the caller
+        _result_sink.set(sink)
+        _stream_path.set(())
+        return await self.execute()
+
+    async def _run(self, scheduler: BaseTaskScheduler) -> List[BaseTaskResult]:
+        if self._fail_fast:
+            return await self._run_until_settled(scheduler)
+        if _result_sink.get() is not None:
+            return await scheduler.run(self._tasks, lambda idx, task: self._schedule(scheduler, idx, task))
+        return await scheduler.run(self._tasks)
+
+    async def _schedule(self, scheduler: BaseTaskScheduler, idx: int, task: BaseTask) -> BaseTaskResult:
+        sink = _result_sink.get()
+        if sink is None:
+            return await scheduler.schedule(task)
+
+        path = _stream_path.get() + (idx, )
+        token = _stream_path.set(path)
+        try:
+            result = await scheduler.schedule(task)
+        finally:
+            _stream_path.reset(token)
+        sink(StreamedResult(path, result))
+        return result
+
+    async def _run_until_settled(self, scheduler: BaseTaskScheduler) -> List[BaseTaskResult]:
+        tasks = list(self._tasks)
+        futures = [asyncio.ensure_future(self._schedule(scheduler, idx, task)) for (idx, task) in enumerate(tasks)]
+        pending = set(futures)
+        try:
+            while pending:
+                (_, pending) = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                if self._result_builder.is_settled([future.result() for future in futures if future.done()]):
+                    break
+        finally:
+            for future in pending:
+                future.cancel()
+            if pending:
+                await asyncio.wait(pending)
+
+        results = [
+            self._skipped_result(task) if future in pending else future.result()
+            for (task, future) in zip(tasks, futures)
+        ]
+        for (idx, future) in enumerate(futures):
+            if future in pending:
+                self._stream_skipped(idx, results[idx])
+        return results
+
+    def _stream_skipped(self, idx: int, result: BaseTaskResult) -> None:
+        # results of subtasks which were not scheduled are streamed as well
+        sink = _result_sink.get()
+        if sink is not None:
+            sink(StreamedResult(_stream_path.get() + (idx, ), result))
+
+    def _skipped_result(self, task: BaseTask) -> BaseTaskResult:
+        return TaskResult(TaskResultStatus.UNKNOWN,
+                          f'Task [{task.__class__.__name__}] skipped, as result of its parent is already known')
+
 
 class Checklist(MultiTask):
 
-    def __init__(self, name: str, tasks: Iterable[BaseTask],
-                 result_builder: Optional[MultiTaskResultBuilder] = None) -> None:
+    def __init__(self,
+                 name: str,
+                 tasks: Iterable[BaseTask],
+                 result_builder: Optional[MultiTaskResultBuilder] = None,
+                 scheduler: Optional[BaseTaskScheduler] = None,
+                 fail_fast: bool = False) -> None:
         super().__init__(
             tasks, result_builder or
-            MultiTaskResultBuilder(None, PrefixedTaskResultMessageBuilder(f'Checklist [{name}]: ')))
+            MultiTaskResultBuilder(None, PrefixedTaskResultMessageBuilder(f'Checklist [{name}]: ')), scheduler,
+            fail_fast)
         self._name = name
 
     @property
@@ -0,0 +1,95 @@
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Hashable, NamedTuple, Optional
+
+from checklisting.deadline import deadline_scope
+from checklisting.result import BaseTaskResult
+from checklisting.singleflight import SingleFlight
+from checklisting.task import BaseTask, WrapperTask
+
+CacheEntry = NamedTuple('CacheEntry', [('expires_at', float), ('result', BaseTaskResult)])
+
+
+class TaskResultCache(object):
+
+    def __init__(self, max_size: int = 1024, clock: Callable[[], float] = time.monotonic) -> None:
+        assert max_size > 0
+        self._max_size = max_size
+        self._clock = clock
+        self._entries: 'OrderedDict[Hashable, CacheEntry]' = OrderedDict()
+        self._single_flight: SingleFlight[BaseTaskResult] = SingleFlight()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[BaseTaskResult]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        if entry.expires_at <= self._clock():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return entry.result
+
+    def put(self, key: Hashable, result: BaseTaskResult, ttl: float) -> None:
+        self._entries[key] = CacheEntry(self._clock() + ttl, result)
+        self._entries.move_to_end(key)
+        # least recently used entries are evicted first
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    async def get_or_refresh(self, key: Hashable, ttl: float,
+                             refresh: Callable[[], Awaitable[BaseTaskResult]]) -> BaseTaskResult:
+        # concurrent misses of the same key share a single refresh
+        result = self.get(key)
+        if result is None:
+            result = await self._single_flight.run(key, lambda: self._refresh(key, ttl, refresh))
+        return result
+
+    async def _refresh(self, key: Hashable, ttl: float,
+                       refresh: Callable[[], Awaitable[BaseTaskResult]]) -> BaseTaskResult:
+        result = await refresh()
+        self.put(key, result, ttl)
+        return result
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+_default_cache = TaskResultCache()
+
+
+def get_default_cache() -> TaskResultCache:
+    return _default_cache
+
+
+class CachedTask(WrapperTask):
+
+    def __init__(self,
+                 task: BaseTask,
+                 ttl: float,
+                 cache: Optional[TaskResultCache] = None,
+                 key: Optional[Hashable] = None,
+                 timeout: Optional[float] = None) -> None:
+        assert ttl > 0
+        super().__init__(task)
+        self._ttl = ttl
+        self._cache = get_default_cache() if cache is None else cache
+        self._key = self if key is None else key
+        self._timeout = timeout
+
+    async def _execute_within_deadline(self) -> BaseTaskResult:
+        # unlike wrapped task, shared refresh does not enforce deadline of the caller, so it is enforced here
+        return await BaseTask._execute_within_deadline(self)
+
+    async def _execute(self) -> BaseTaskResult:
+        return await self._cache.get_or_refresh(self._key, self._ttl, self._refresh)
+
+    async def _refresh(self) -> BaseTaskResult:
+        # refresh is shared by all callers and its result is cached for others, so none of their deadlines applies;
+        # caller running out of time stops waiting for it, while it goes on
+        with deadline_scope(self._timeout, True):
+            return await self._task.execute()
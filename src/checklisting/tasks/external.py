@@ -1,10 +1,14 @@
 from typing import Any, Optional, Union
 
+from checklisting.circuit import CircuitBreakerRegistry
 from checklisting.extras import import_module
+from checklisting.hedging import HedgingPolicy
+from checklisting.ratelimit import RateLimiterRegistry
 from checklisting.result import BaseTaskResult, MultiTaskResult, TaskResult
 from checklisting.result.builder import MultiTaskResultBuilder
 from checklisting.result.message.builder import PrefixedTaskResultMessageBuilder
 from checklisting.result.status import TaskResultStatus
+from checklisting.retry import RetryPolicy
 from checklisting.serializer.json import JsonDeserializer
 from checklisting.tasks.http import BaseHttpTaskResponseValidator, HttpMethod, HttpTask
 
@@ -35,5 +39,17 @@ class ExternalChecklistTask(HttpTask):
     def __init__(self,
                  url: Union[str, yarl.URL],
                  validator: Optional[BaseHttpTaskResponseValidator] = None,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 circuit_breakers: Optional[CircuitBreakerRegistry] = None,
+                 rate_limiters: Optional[RateLimiterRegistry] = None,
+                 hedging_policy: Optional[HedgingPolicy] = None,
                  **kwargs: Any) -> None:
-        super().__init__(HttpMethod.GET, url, validator or ExternalChecklistResponseValidator(url), **kwargs)
+        super().__init__(HttpMethod.GET, url, validator or ExternalChecklistResponseValidator(url), retry_policy,
+                         circuit_breakers, rate_limiters, **kwargs)
+        self._hedging_policy = hedging_policy
+        self._source = str(url)
+
+    async def _execute(self) -> BaseTaskResult:
+        if self._hedging_policy is None:
+            return await super()._execute()
+        return await self._hedging_policy.execute(self._source, super()._execute)
@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Iterator, Optional
-from checklisting.task import BaseTask
+from checklisting.blocking import BlockingTask, BlockingTaskExecutor
 from checklisting.result import BaseTaskResult, TaskResult
 from checklisting.result.builder import MultiTaskResultBuilder
 from checklisting.result.status import TaskResultStatus
@@ -34,16 +34,32 @@ class PerLineFileContentValidator(BaseFileContentValidator):
             filter(None, map(self._line_validator.validate, filter(None, map(str.strip, filter(None, lines))))))
 
 
-class FileContentTask(BaseTask):
+def _validate_file(path: Path, validator: BaseFileContentValidator) -> BaseTaskResult:
+    if not path.exists():
+        return TaskResult(TaskResultStatus.FAILURE, f'File [{path}] does not exist')
 
-    def __init__(self, path: Path, validator: BaseFileContentValidator) -> None:
-        super().__init__()
+    with open(path, 'r', 1) as stream:
+        return validator.validate(stream)
+
+
+class FileContentTask(BlockingTask):
+
+    # with validation_executor given, the file is read and validated in its worker, e.g. a separate process
+    def __init__(self,
+                 path: Path,
+                 validator: BaseFileContentValidator,
+                 executor: Optional[BlockingTaskExecutor] = None,
+                 validation_executor: Optional[BlockingTaskExecutor] = None) -> None:
+        super().__init__(executor)
         self._path = path
         self._validator = validator
+        self._validation_executor = validation_executor
 
     async def _execute(self) -> BaseTaskResult:
-        if not self._path.exists():
-            return TaskResult(TaskResultStatus.FAILURE, f'File [{self._path}] does not exist')
+        if self._validation_executor is None:
+            return await super()._execute()
+        return await self._validation_executor.run(self.__class__.__name__, _validate_file, self._path,
+                                                   self._validator)
 
-        with open(self._path, 'r', 1) as stream:
-            return self._validator.validate(stream)
+    def _execute_blocking(self) -> BaseTaskResult:
+        return _validate_file(self._path, self._validator)
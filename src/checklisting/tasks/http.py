@@ -2,9 +2,12 @@ from abc import ABC, abstractmethod
 from enum import Enum
 from typing import Any, Awaitable, Optional, Union
 
+from checklisting.circuit import CircuitBreakerRegistry, execute_guarded
 from checklisting.extras import import_module
+from checklisting.ratelimit import RateLimiterRegistry, throttle
 from checklisting.result import BaseTaskResult, TaskResult
 from checklisting.result.status import TaskResultStatus
+from checklisting.retry import RetryPolicy, TransientError
 from checklisting.task import BaseTask
 
 aiohttp = import_module('aiohttp')
@@ -41,10 +44,16 @@ class SimpleHttpTaskResponseValidator(BaseHttpTaskResponseValidator):
 
 class HttpTask(BaseTask):
 
+    # responses with these statuses are retried when retry policy is given, e.g. 503 during a deploy
+    RETRYABLE_STATUSES = frozenset([502, 503, 504])
+
     def __init__(self,
                  method: HttpMethod,
                  url: Union[str, yarl.URL],
                  validator: Optional[BaseHttpTaskResponseValidator] = None,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 circuit_breakers: Optional[CircuitBreakerRegistry] = None,
+                 rate_limiters: Optional[RateLimiterRegistry] = None,
                  **kwargs: Any) -> None:
         super().__init__()
         self._method = method
@@ -52,8 +61,31 @@ class HttpTask(BaseTask):
         self._kwargs = kwargs
         self._client_session = None
         self._validator = validator or SimpleHttpTaskResponseValidator()
+        self._retry_policy = retry_policy
+        self._circuit_breakers = circuit_breakers
+        self._rate_limiters = rate_limiters
+        destination_url = yarl.URL(url)
+        self._destination = f'{destination_url.host}:{destination_url.port}'
 
     async def _execute(self) -> BaseTaskResult:
-        async with aiohttp.ClientSession() as session:
-            async with session.request(self._method.value, self._url, **self._kwargs) as resp:
-                return await self._validator.validate(resp)
+        if self._retry_policy is None:
+            return await self._guarded_request()
+        return await self._retry_policy.execute(self._guarded_request)
+
+    async def _guarded_request(self) -> BaseTaskResult:
+        return await execute_guarded(self._destination, self._request, self._circuit_breakers)
+
+    async def _request(self) -> BaseTaskResult:
+        await throttle(self._destination, self._rate_limiters)
+        try:
+            async with aiohttp.ClientSession() as session:
+                async with session.request(self._method.value, self._url, **self._kwargs) as resp:
+                    result = await self._validator.validate(resp)
+                    if self._retry_policy is not None and resp.status in self.RETRYABLE_STATUSES:
+                        raise TransientError(f'Request to [{resp.real_url}] returned [{resp.status}]', result)
+                    return result
+        except aiohttp.ServerDisconnectedError as e:
+            # unlike most of connection errors it is not an OSError, while it is typical for restarting server
+            if self._retry_policy is None:
+                raise
+            raise TransientError(f'Request to [{self._url}] failed: {e}') from e
@@ -1,16 +1,17 @@
 from pathlib import Path
-from checklisting.task import BaseTask
-from checklisting.result import TaskResult
+from typing import Optional
+from checklisting.blocking import BlockingTask, BlockingTaskExecutor
+from checklisting.result import BaseTaskResult, TaskResult
 from checklisting.result.status import TaskResultStatus
 
 
-class FileExistsTask(BaseTask):
+class FileExistsTask(BlockingTask):
 
-    def __init__(self, path: Path) -> None:
-        super().__init__()
+    def __init__(self, path: Path, executor: Optional[BlockingTaskExecutor] = None) -> None:
+        super().__init__(executor)
         self._path = path
 
-    async def _execute(self):
+    def _execute_blocking(self) -> BaseTaskResult:
         if self._path.is_file():
             return TaskResult(TaskResultStatus.SUCCESS, f"File [{self._path}] exists")
 
@@ -26,12 +27,13 @@ class FileExistsTask(BaseTask):
         return str(self) == str(other)
 
 
-class DirectoryExistsTask(BaseTask):
+class DirectoryExistsTask(BlockingTask):
 
-    def __init__(self, path: Path) -> None:
+    def __init__(self, path: Path, executor: Optional[BlockingTaskExecutor] = None) -> None:
+        super().__init__(executor)
         self._path = path
 
-    async def _execute(self):
+    def _execute_blocking(self) -> BaseTaskResult:
         if self._path.is_dir():
             return TaskResult(TaskResultStatus.SUCCESS, f"Directory [{self._path}] exists")
 
@@ -0,0 +1,50 @@
+from typing import Optional
+
+from checklisting.periodic import PeriodicTaskExecutor
+from checklisting.result import BaseTaskResult
+from checklisting.task import BaseTask
+
+# execution in background needs event loop that keeps running after checklists are executed, i.e. that of webserver
+_default_background_execution = False
+
+
+def get_default_background_execution() -> bool:
+    return _default_background_execution
+
+
+def set_default_background_execution(enabled: bool) -> None:
+    global _default_background_execution
+    _default_background_execution = enabled
+
+
+class PeriodicTask(BaseTask):
+
+    def __init__(self,
+                 task: BaseTask,
+                 interval: float,
+                 timeout: Optional[float] = None,
+                 background: Optional[bool] = None) -> None:
+        super().__init__()
+        self._interval = interval
+        self._executor = PeriodicTaskExecutor(task, interval, timeout)
+        self._background = background
+
+    @property
+    def is_composite(self) -> bool:
+        # wrapped task is executed in background, so there is no point in holding a slot while waiting for it
+        return True
+
+    async def _execute(self) -> BaseTaskResult:
+        background = self._background if self._background is not None else get_default_background_execution()
+        if background:
+            # background execution starts with first use; afterwards latest result is returned right away
+            self._executor.start()
+            snapshot = await self._executor.get_snapshot()
+            return snapshot.result
+
+        # otherwise (e.g. in one-shot runs, which close event loop afterwards) nothing is left running, wrapped task
+        # is executed on use once latest result is older than interval
+        age = self._executor.age
+        if age is None or age >= self._interval:
+            return (await self._executor.refresh()).result
+        return (await self._executor.get_snapshot()).result
@@ -1,11 +1,10 @@
-import asyncio
 import ssl
 from typing import Iterator, Optional
 
-from checklisting.result import BaseTaskResult, TaskResult
+from checklisting.graph import DependentTask, TaskGraph
+from checklisting.result import BaseTaskResult, LazyMessage, TaskResult
 from checklisting.result.builder import MultiTaskResultBuilder
 from checklisting.result.status import TaskResultStatus
-from checklisting.task import BaseTask
 from checklisting.tasks.socket import (BaseSocketTaskResponseValidator,
                                        SocketTask)
 
@@ -37,12 +36,13 @@ class ZookeeperMntrResonseValidator(BaseSocketTaskResponseValidator):
         else:
             try:
                 (key, *values) = filter(None, line.split())
-                yield TaskResult(TaskResultStatus.INFO, f'[{key}]=[{" ".join(values)}]')
+                yield TaskResult(TaskResultStatus.INFO,
+                                 LazyMessage('[{key}]=[{value}]', key=key, value=' '.join(values)))
             except ValueError:
                 yield TaskResult(TaskResultStatus.WARNING, f'Line [{line}] is not parseable')
 
 
-class ZookeeperTask(BaseTask):
+class ZookeeperTask(TaskGraph):
 
     def __init__(self,
                  host: str,
@@ -51,14 +51,7 @@ class ZookeeperTask(BaseTask):
                  ruok_validator: Optional[BaseSocketTaskResponseValidator] = None,
                  mntr_validator: Optional[BaseSocketTaskResponseValidator] = None,
                  result_builder: Optional[MultiTaskResultBuilder] = None) -> None:
-        super().__init__()
-        self._ruok_task = SocketTask(b'ruok', host, port, ssl_context, ruok_validator or
-                                     ZookeeperRuokResponseValidator())
-        self._mntr_task = SocketTask(b'mntr', host, port, ssl_context, mntr_validator or
-                                     ZookeeperMntrResonseValidator())
-        self._result_builder = result_builder or MultiTaskResultBuilder()
-
-    async def _execute(self) -> BaseTaskResult:
-        return self._result_builder.of_results(await asyncio.gather(self._ruok_task.execute(),
-                                                                    self._mntr_task.execute()))
-
+        ruok_task = SocketTask(b'ruok', host, port, ssl_context, ruok_validator or ZookeeperRuokResponseValidator())
+        mntr_task = SocketTask(b'mntr', host, port, ssl_context, mntr_validator or ZookeeperMntrResonseValidator())
+        # there is no point in asking for stats of a node that is not even able to tell it is ok
+        super().__init__([ruok_task, DependentTask(mntr_task, [ruok_task])], result_builder)
@@ -6,8 +6,12 @@ from itertools import chain
 from logging import getLogger
 from typing import Iterator, List, Optional
 
+from checklisting.blocking import BlockingTaskExecutor
+from checklisting.circuit import CircuitBreakerRegistry, execute_guarded
+from checklisting.ratelimit import RateLimiterRegistry, throttle
 from checklisting.result import BaseTaskResult, TaskResult, TaskResultStatus
 from checklisting.result.builder import MultiTaskResultBuilder
+from checklisting.retry import RetryPolicy
 from checklisting.task import BaseTask
 
 logger = getLogger(__name__)
@@ -66,16 +70,38 @@ class SocketTask(BaseTask):
                  host: str,
                  port: int = 2181,
                  ssl_context: Optional[ssl.SSLContext] = None,
-                 validator: Optional[BaseSocketTaskResponseValidator] = None) -> None:
+                 validator: Optional[BaseSocketTaskResponseValidator] = None,
+                 validation_executor: Optional[BlockingTaskExecutor] = None,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 circuit_breakers: Optional[CircuitBreakerRegistry] = None,
+                 rate_limiters: Optional[RateLimiterRegistry] = None) -> None:
         super().__init__()
         self._cmd = cmd
         self._host = host
         self._port = port
         self._ssl_context = ssl_context
         self._validator = validator or SimpleSocketTaskResponseValidator()
+        self._validation_executor = validation_executor
+        self._retry_policy = retry_policy
+        self._circuit_breakers = circuit_breakers
+        self._rate_limiters = rate_limiters
+        self._destination = f'{host}:{port}'
 
     async def _execute(self) -> BaseTaskResult:
-        return self._validator.validate(await self._execute_connection())
+        if self._retry_policy is None:
+            return await self._execute_guarded()
+        return await self._retry_policy.execute(self._execute_guarded)
+
+    async def _execute_guarded(self) -> BaseTaskResult:
+        return await execute_guarded(self._destination, self._execute_attempt, self._circuit_breakers)
+
+    async def _execute_attempt(self) -> BaseTaskResult:
+        await throttle(self._destination, self._rate_limiters)
+        lines = await self._execute_connection()
+        if self._validation_executor is None:
+            return self._validator.validate(lines)
+        # validator is pickled when executor runs it in another process, so hand it materialized response
+        return await self._validation_executor.run(self.__class__.__name__, self._validator.validate, list(lines))
 
     async def _execute_connection(self) -> Iterator[bytes]:
         logger.debug(f'Openning connection; host=[{self._host}]; port=[{self._port}]; ' +
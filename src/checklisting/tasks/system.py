@@ -2,8 +2,9 @@ import asyncio
 import os
 from typing import Iterable, Iterator, NamedTuple, Optional
 
+from checklisting.blocking import BlockingTask, BlockingTaskExecutor
 from checklisting.extras import import_module
-from checklisting.result import BaseTaskResult, MultiTaskResult, TaskResult
+from checklisting.result import BaseTaskResult, LazyMessage, MultiTaskResult, TaskResult
 from checklisting.result.builder import MultiTaskResultBuilder
 from checklisting.result.status import TaskResultStatus
 from checklisting.task import BaseTask
@@ -16,6 +17,15 @@ DiskInfoStruct = NamedTuple('DiskInfoStruct', [('mountpoint', str), ('device', s
                                                ('used', int), ('percent', float)])
 CPUUsageStruct = NamedTuple('CPUUsageStruct', [('user', float), ('system', float), ('idle', float), ('iowait', float)])
 
+# messages of per CPU and per disk results are rendered only when needed, as there may be many of them
+CPU_USAGE_MESSAGE = 'CPU times for CPU #{cpu} for past [{interval}] seconds are: ' + \
+    'user=[{user}]; system=[{system}]; idle=[{idle}]; iowait=[{iowait}]'
+DISK_INFO_MESSAGE = 'Device [{device}] (mount: [{mountpoint}]; fstype: [{fstype}]) has [{total_gigs}] GB in total ' + \
+    'and is used in [{percent}%] which is'
+DISK_INFO_ERROR_MESSAGE = DISK_INFO_MESSAGE + ' greater than error treshold [{treshold}%]'
+DISK_INFO_WARNING_MESSAGE = DISK_INFO_MESSAGE + ' greater than warning treshold [{treshold}%]'
+DISK_INFO_SUCCESS_MESSAGE = DISK_INFO_MESSAGE + ' at acceptable level'
+
 
 async def _cpu_times_percent(interval: float) -> Iterable[CPUUsageStruct]:
     psutil.cpu_times_percent(interval=None, percpu=True)
@@ -63,9 +73,14 @@ class CPUUsageValidator(object):
                                  cpu_usage_list: Iterator[CPUUsageStruct]) -> Iterator[BaseTaskResult]:
         for (idx, cpu_usage_info) in enumerate(cpu_usage_list):
             yield TaskResult(
-                TaskResultStatus.INFO, f'CPU times for CPU #{idx} for past [{interval}] seconds are: ' +
-                f'user=[{cpu_usage_info.user}]; system=[{cpu_usage_info.system}]; ' +
-                f'idle=[{cpu_usage_info.idle}]; iowait=[{cpu_usage_info.iowait}]')
+                TaskResultStatus.INFO,
+                LazyMessage(CPU_USAGE_MESSAGE,
+                            cpu=idx,
+                            interval=interval,
+                            user=cpu_usage_info.user,
+                            system=cpu_usage_info.system,
+                            idle=cpu_usage_info.idle,
+                            iowait=cpu_usage_info.iowait))
 
     def validate(self, interval: float, cpu_usage_list: Iterator[CPUUsageStruct]) -> MultiTaskResult:
         return self._result_builder.of_results(self._validate_cpu_usage_info(interval, cpu_usage_list))
@@ -149,13 +164,15 @@ class MemoryInfoValidator(object):
         return TaskResult(TaskResultStatus.SUCCESS, f'{msg} at acceptable level')
 
 
-class MemoryInfoTask(BaseTask):
+class MemoryInfoTask(BlockingTask):
 
-    def __init__(self, memory_info_validator: Optional[MemoryInfoValidator] = None) -> None:
-        super().__init__()
+    def __init__(self,
+                 memory_info_validator: Optional[MemoryInfoValidator] = None,
+                 executor: Optional[BlockingTaskExecutor] = None) -> None:
+        super().__init__(executor)
         self._validator = memory_info_validator or MemoryInfoValidator()
 
-    async def _execute(self) -> BaseTaskResult:
+    def _execute_blocking(self) -> BaseTaskResult:
         mem = psutil.virtual_memory()
         return self._validator.validate(mem.total, mem.percent)
 
@@ -173,18 +190,20 @@ class DiskInfoValidator(object):
         self._result_builder = result_builder or MultiTaskResultBuilder()
 
     def _validate_disk_info_struct(self, disk_info_struct: DiskInfoStruct) -> BaseTaskResult:
-        total_gigs = round(disk_info_struct.total / GIGABYTE, 2)
-
-        msg = f'Device [{disk_info_struct.device}] (mount: [{disk_info_struct.mountpoint}]; ' +\
-            f'fstype: [{disk_info_struct.fstype}]) has [{total_gigs}] GB in total and is used in ' +\
-            f'[{disk_info_struct.percent}%] which is'
+        fields = dict(device=disk_info_struct.device,
+                      mountpoint=disk_info_struct.mountpoint,
+                      fstype=disk_info_struct.fstype,
+                      total_gigs=round(disk_info_struct.total / GIGABYTE, 2),
+                      percent=disk_info_struct.percent)
         if disk_info_struct.percent > self._usage_percent_error_treshold:
-            return TaskResult(TaskResultStatus.FAILURE,
-                              f'{msg} greater than error treshold [{self._usage_percent_error_treshold}%]')
+            return TaskResult(
+                TaskResultStatus.FAILURE,
+                LazyMessage(DISK_INFO_ERROR_MESSAGE, treshold=self._usage_percent_error_treshold, **fields))
         if disk_info_struct.percent > self._usage_percent_warn_treshold:
-            return TaskResult(TaskResultStatus.WARNING,
-                              f'{msg} greater than warning treshold [{self._usage_percent_warn_treshold}%]')
-        return TaskResult(TaskResultStatus.SUCCESS, f'{msg} at acceptable level')
+            return TaskResult(
+                TaskResultStatus.WARNING,
+                LazyMessage(DISK_INFO_WARNING_MESSAGE, treshold=self._usage_percent_warn_treshold, **fields))
+        return TaskResult(TaskResultStatus.SUCCESS, LazyMessage(DISK_INFO_SUCCESS_MESSAGE, **fields))
 
     def _build_results(self, disk_info_list: Iterator[DiskInfoStruct]) -> Iterator[BaseTaskResult]:
         for disk_info_struct in disk_info_list:
@@ -194,13 +213,15 @@ class DiskInfoValidator(object):
         return self._result_builder.of_results(self._build_results(iter(disk_info_list)))
 
 
-class DiskInfoTask(BaseTask):
+class DiskInfoTask(BlockingTask):
 
-    def __init__(self, disk_info_validator: Optional[DiskInfoValidator] = None) -> None:
-        super().__init__()
+    def __init__(self,
+                 disk_info_validator: Optional[DiskInfoValidator] = None,
+                 executor: Optional[BlockingTaskExecutor] = None) -> None:
+        super().__init__(executor)
         self._disk_info_validator = disk_info_validator or DiskInfoValidator()
 
-    async def _execute(self) -> BaseTaskResult:
+    def _execute_blocking(self) -> BaseTaskResult:
         partitions = psutil.disk_partitions()
         disk_info_structs = []
         for partition in partitions:
@@ -0,0 +1,15 @@
+from checklisting.deadline import deadline_scope
+from checklisting.result import BaseTaskResult
+from checklisting.task import BaseTask, WrapperTask
+
+
+class TimeoutTask(WrapperTask):
+
+    def __init__(self, task: BaseTask, timeout: float) -> None:
+        assert timeout > 0
+        super().__init__(task)
+        self._timeout = timeout
+
+    async def _execute(self) -> BaseTaskResult:
+        with deadline_scope(self._timeout):
+            return await self._task.execute()
@@ -0,0 +1,135 @@
+import asyncio
+import os
+import threading
+import time
+
+import asynctest
+
+from checklisting.blocking import (BlockingTask, BlockingTaskExecutor, ProcessPoolTaskExecutor,
+                                   get_default_blocking_executor, set_default_blocking_executor,
+                                   set_process_blocking_executor)
+from checklisting.result import TaskResult
+from checklisting.result.status import TaskResultStatus
+
+
+class SleepingTask(BlockingTask):
+
+    def __init__(self, delay: float = 0, executor=None) -> None:
+        super().__init__(executor)
+        self.delay = delay
+        self.thread = None
+
+    def _execute_blocking(self):
+        self.thread = threading.current_thread()
+        time.sleep(self.delay)
+        return TaskResult(TaskResultStatus.SUCCESS, 'done')
+
+
+class BlockingTaskExecutorTest(asynctest.TestCase):
+
+    def setUp(self):
+        self.executor = BlockingTaskExecutor(2)
+
+    def tearDown(self):
+        self.executor.shutdown()
+
+    async def test_runs_function_outside_of_event_loop_thread(self):
+        thread = await self.executor.run('test', threading.current_thread)
+
+        self.assertIsNot(thread, threading.current_thread())
+
+    async def test_event_loop_is_not_blocked_while_function_runs(self):
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        ticker = asyncio.ensure_future(tick())
+        await self.executor.run('test', lambda: time.sleep(0.1))
+        ticker.cancel()
+
+        self.assertGreater(ticks, 3)
+
+    async def test_limits_number_of_worker_threads(self):
+        counter = {'current': 0, 'max': 0}
+        lock = threading.Lock()
+
+        def work():
+            with lock:
+                counter['current'] += 1
+                counter['max'] = max(counter['max'], counter['current'])
+            time.sleep(0.02)
+            with lock:
+                counter['current'] -= 1
+
+        await asyncio.gather(*[self.executor.run('test', work) for _ in range(6)])
+
+        self.assertEqual(counter['max'], 2)
+
+    async def test_raises_error_when_call_takes_longer_than_timeout(self):
+        executor = BlockingTaskExecutor(1, 0.01)
+        try:
+            with self.assertRaises(RuntimeError) as context:
+                await executor.run('SlowTask', lambda: time.sleep(0.2))
+        finally:
+            executor.shutdown(False)
+
+        self.assertEqual(str(context.exception), 'Blocking call of task [SlowTask] timed out after [0.01] seconds')
+
+    def test_arguments_are_validated(self):
+        with self.assertRaises(AssertionError):
+            BlockingTaskExecutor(0)
+
+        with self.assertRaises(AssertionError):
+            BlockingTaskExecutor(1, 0)
+
+
+class BlockingTaskTest(asynctest.TestCase):
+
+    def setUp(self):
+        self._default_executor = get_default_blocking_executor()
+
+    def tearDown(self):
+        set_default_blocking_executor(self._default_executor)
+
+    async def test_body_is_executed_in_given_executor(self):
+        executor = BlockingTaskExecutor(1)
+        task = SleepingTask(executor=executor)
+
+        result = await task.execute()
+        executor.shutdown()
+
+        self.assertEqual(result, TaskResult(TaskResultStatus.SUCCESS, 'done'))
+        self.assertTrue(task.thread.name.startswith('checklisting-blocking'))
+
+    async def test_default_executor_is_used_when_none_given(self):
+        set_process_blocking_executor(1, 0.01)
+
+        result = await SleepingTask(0.2).execute()
+
+        self.assertEqual(result.status, TaskResultStatus.FAILURE)
+        self.assertEqual(result.message, 'Blocking call of task [SleepingTask] timed out after [0.01] seconds')
+
+    def test_process_executor_falls_back_to_defaults(self):
+        set_process_blocking_executor(None, None)
+
+        self.assertEqual(get_default_blocking_executor().max_workers, 8)
+        self.assertIsNone(get_default_blocking_executor().timeout)
+
+
+class ProcessPoolTaskExecutorTest(asynctest.TestCase):
+
+    async def test_runs_function_in_worker_process(self):
+        executor = ProcessPoolTaskExecutor(1)
+        try:
+            pid = await executor.run('test', os.getpid)
+        finally:
+            executor.shutdown()
+
+        self.assertNotEqual(pid, os.getpid())
+
+    def test_defaults_to_number_of_cpus(self):
+        self.assertEqual(ProcessPoolTaskExecutor().max_workers, os.cpu_count() or 1)
@@ -0,0 +1,208 @@
+import asyncio
+import socket
+import unittest
+
+import asynctest
+from helpers import FakeClock
+
+from checklisting.circuit import (CircuitBreaker, CircuitBreakerRegistry, CircuitState, get_default_circuit_breakers,
+                                  set_default_circuit_breakers, set_process_circuit_breakers)
+from checklisting.deadline import deadline_scope
+from checklisting.result import TaskResult
+from checklisting.result.status import TaskResultStatus
+from checklisting.retry import TransientError
+from checklisting.tasks.socket import SocketTask
+
+
+class CircuitBreakerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.breaker = CircuitBreaker(2, 10, self.clock)
+
+    def test_opens_after_threshold_of_failures(self):
+        self.breaker.record_failure()
+        self.assertTrue(self.breaker.allow())
+
+        self.breaker.record_failure()
+
+        self.assertEqual(self.breaker.state, CircuitState.OPEN)
+        self.assertFalse(self.breaker.allow())
+
+    def test_success_resets_failures(self):
+        self.breaker.record_failure()
+        self.breaker.record_success()
+        self.breaker.record_failure()
+
+        self.assertEqual(self.breaker.state, CircuitState.CLOSED)
+
+    def test_allows_single_probe_once_cooldown_passes(self):
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.clock.now += 10
+
+        self.assertTrue(self.breaker.allow())
+        self.assertEqual(self.breaker.state, CircuitState.HALF_OPEN)
+        self.assertFalse(self.breaker.allow())
+
+    def test_failed_probe_opens_circuit_again(self):
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.clock.now += 10
+        self.breaker.allow()
+
+        self.breaker.record_failure()
+
+        self.assertEqual(self.breaker.state, CircuitState.OPEN)
+        self.assertEqual(self.breaker.get_remaining_cooldown(), 10)
+
+    def test_successful_probe_closes_circuit(self):
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.clock.now += 10
+        self.breaker.allow()
+
+        self.breaker.record_success()
+
+        self.assertEqual(self.breaker.state, CircuitState.CLOSED)
+        self.assertTrue(self.breaker.allow())
+
+    def test_cancelled_probe_lets_another_call_probe(self):
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.clock.now += 10
+        self.breaker.allow()
+
+        self.breaker.record_cancellation()
+
+        self.assertTrue(self.breaker.allow())
+
+
+class CircuitBreakerRegistryTest(asynctest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.registry = CircuitBreakerRegistry(1, 10, self.clock)
+        self.calls = 0
+
+    async def _failing(self):
+        self.calls += 1
+        raise ConnectionRefusedError('refused')
+
+    async def _succeeding(self):
+        self.calls += 1
+        return TaskResult(TaskResultStatus.SUCCESS, 'ok')
+
+    async def test_open_circuit_fails_immediately_without_calling(self):
+        with self.assertRaises(ConnectionRefusedError):
+            await self.registry.execute('host:1', self._failing)
+        self.clock.now += 4
+
+        result = await self.registry.execute('host:1', self._failing)
+
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(result.status, TaskResultStatus.FAILURE)
+        self.assertEqual(result.message, 'Circuit for [host:1] is open after [1] failures, ' +
+                         'next probe in [6.000] seconds')
+
+    async def test_circuits_are_kept_per_key(self):
+        with self.assertRaises(ConnectionRefusedError):
+            await self.registry.execute('host:1', self._failing)
+
+        result = await self.registry.execute('host:2', self._succeeding)
+
+        self.assertEqual(result.status, TaskResultStatus.SUCCESS)
+
+    async def test_failure_results_of_answering_endpoint_keep_circuit_closed(self):
+
+        async def _failure():
+            return TaskResult(TaskResultStatus.FAILURE, 'Disk [/var] is full')
+
+        for _ in range(3):
+            result = await self.registry.execute('host:1', _failure)
+
+        self.assertEqual(result.message, 'Disk [/var] is full')
+        self.assertEqual(self.registry.get('host:1').state, CircuitState.CLOSED)
+
+    async def test_transient_errors_count_as_failures(self):
+
+        async def _unavailable():
+            raise TransientError('Request to [host:1] returned [503]')
+
+        with self.assertRaises(TransientError):
+            await self.registry.execute('host:1', _unavailable)
+
+        self.assertEqual(self.registry.get('host:1').state, CircuitState.OPEN)
+
+    async def test_call_cut_off_by_deadline_counts_as_failure(self):
+        registry = CircuitBreakerRegistry(2, 10, self.clock)
+
+        async def _hanging():
+            await asyncio.sleep(10)
+
+        for _ in range(2):
+            with deadline_scope(0.01):
+                result = await registry.execute('host:1', _hanging)
+            self.assertEqual(result.status, TaskResultStatus.FAILURE)
+
+        self.assertEqual(registry.get('host:1').state, CircuitState.OPEN)
+
+    async def test_cancellation_is_propagated(self):
+
+        async def _cancelled():
+            raise asyncio.CancelledError()
+
+        with self.assertRaises(asyncio.CancelledError):
+            await self.registry.execute('host:1', _cancelled)
+
+        self.assertEqual(self.registry.get('host:1').state, CircuitState.CLOSED)
+
+
+class CircuitBreakerTaskTest(asynctest.TestCase):
+
+    def setUp(self):
+        self._default_circuit_breakers = get_default_circuit_breakers()
+
+    def tearDown(self):
+        set_default_circuit_breakers(self._default_circuit_breakers)
+
+    def _closed_port(self) -> int:
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+            return sock.getsockname()[1]
+
+    async def test_tasks_share_process_wide_circuit_breakers(self):
+        set_process_circuit_breakers(1, 10)
+        port = self._closed_port()
+
+        first = await SocketTask(b'ruok', '127.0.0.1', port).execute()
+        second = await SocketTask(b'mntr', '127.0.0.1', port).execute()
+
+        self.assertNotIn('Circuit', first.message)
+        self.assertRegex(second.message, rf'^Circuit for \[127\.0\.0\.1:{port}\] is open')
+
+    async def test_task_cut_off_by_deadline_opens_circuit(self):
+        set_process_circuit_breakers(2, 10)
+
+        class HangingSocketTask(SocketTask):
+
+            async def _execute_connection(self):
+                await asyncio.sleep(10)
+
+        for _ in range(2):
+            with deadline_scope(0.01):
+                await HangingSocketTask(b'ruok', '127.0.0.1', 2181).execute()
+        result = await HangingSocketTask(b'ruok', '127.0.0.1', 2181).execute()
+
+        self.assertEqual(get_default_circuit_breakers().get('127.0.0.1:2181').state, CircuitState.OPEN)
+        self.assertRegex(result.message, r'^Circuit for \[127\.0\.0\.1:2181\] is open after \[2\] failures')
+
+    async def test_there_are_no_circuit_breakers_by_default(self):
+        set_process_circuit_breakers(None)
+        port = self._closed_port()
+
+        await SocketTask(b'ruok', '127.0.0.1', port).execute()
+        result = await SocketTask(b'ruok', '127.0.0.1', port).execute()
+
+        self.assertIsNone(get_default_circuit_breakers())
+        self.assertNotIn('Circuit', result.message)
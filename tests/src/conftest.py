@@ -0,0 +1 @@
+# directory of this file is put on sys.path by pytest, so tests in subdirectories can import helpers too
@@ -0,0 +1,46 @@
+import time
+import unittest
+
+from checklisting.deadline import deadline_scope, get_deadline, get_remaining_time
+
+
+class DeadlineScopeTest(unittest.TestCase):
+
+    def test_no_deadline_by_default(self):
+        self.assertIsNone(get_deadline())
+        self.assertIsNone(get_remaining_time())
+
+    def test_sets_deadline_within_scope(self):
+        with deadline_scope(10) as deadline:
+            self.assertEqual(get_deadline(), deadline)
+            self.assertAlmostEqual(deadline, time.monotonic() + 10, delta=1)
+            self.assertLessEqual(get_remaining_time(), 10)
+
+        self.assertIsNone(get_deadline())
+
+    def test_None_timeout_keeps_current_deadline(self):
+        with deadline_scope(10) as outer_deadline:
+            with deadline_scope(None) as inner_deadline:
+                self.assertEqual(inner_deadline, outer_deadline)
+
+    def test_nested_scope_may_only_shorten_deadline(self):
+        with deadline_scope(10) as outer_deadline:
+            with deadline_scope(20) as inner_deadline:
+                self.assertEqual(inner_deadline, outer_deadline)
+
+            with deadline_scope(1) as inner_deadline:
+                self.assertLess(inner_deadline, outer_deadline)
+
+            self.assertEqual(get_deadline(), outer_deadline)
+
+    def test_detached_scope_ignores_current_deadline(self):
+        with deadline_scope(1) as outer_deadline:
+            with deadline_scope(20, True) as inner_deadline:
+                self.assertGreater(inner_deadline, outer_deadline)
+
+            with deadline_scope(None, True):
+                self.assertIsNone(get_deadline())
+
+    def test_remaining_time_is_never_negative(self):
+        with deadline_scope(-1):
+            self.assertEqual(get_remaining_time(), 0)
@@ -0,0 +1,122 @@
+import asyncio
+import unittest
+
+import asynctest
+
+from checklisting.fleet import AdaptiveConcurrencyLimit, FleetExecutor, FleetSummary
+from checklisting.result import TaskResult
+from checklisting.result.status import TaskResultStatus
+
+
+class AdaptiveConcurrencyLimitTest(unittest.TestCase):
+
+    def test_limit_grows_by_about_one_per_window_of_fast_responses(self):
+        limit = AdaptiveConcurrencyLimit(initial=4)
+
+        for _ in range(5):
+            limit.record(0.1)
+
+        self.assertEqual(limit.limit, 5)
+
+    def test_limit_does_not_exceed_maximum(self):
+        limit = AdaptiveConcurrencyLimit(initial=2, maximum=3)
+
+        for _ in range(100):
+            limit.record(0.1)
+
+        self.assertEqual(limit.limit, 3)
+
+    def test_limit_is_cut_once_per_window_of_slow_responses(self):
+        limit = AdaptiveConcurrencyLimit(initial=8, tolerance=2, backoff=0.5)
+        for _ in range(8):
+            limit.record(0.1)
+        grown = limit.limit
+
+        limit.record(1)
+        self.assertEqual(limit.limit, grown // 2)
+        for _ in range(3):
+            limit.record(1)
+        self.assertEqual(limit.limit, grown // 2)
+
+    def test_limit_does_not_drop_below_minimum(self):
+        limit = AdaptiveConcurrencyLimit(initial=2, minimum=2)
+        limit.record(0.1)
+
+        for _ in range(5):
+            limit.record(10)
+
+        self.assertEqual(limit.limit, 2)
+
+
+class FleetSummaryTest(unittest.TestCase):
+
+    def test_empty_summary_is_unknown(self):
+        result = FleetSummary().to_result()
+
+        self.assertEqual(result.status, TaskResultStatus.UNKNOWN)
+        self.assertEqual(result.message, 'Fleet: [0] sources checked')
+
+    def test_statuses_are_counted_and_worst_one_wins(self):
+        summary = FleetSummary()
+        for status in [TaskResultStatus.SUCCESS, TaskResultStatus.FAILURE, TaskResultStatus.SUCCESS]:
+            summary.record(TaskResult(status, ''))
+
+        result = summary.to_result()
+
+        self.assertEqual(result.status, TaskResultStatus.FAILURE)
+        self.assertEqual(result.message, 'Fleet: [3] sources checked: FAILURE=[1], SUCCESS=[2]')
+
+
+async def _sources(count):
+    for source in range(count):
+        yield source
+
+
+class FleetExecutorTest(asynctest.TestCase):
+
+    async def test_concurrency_is_bounded_by_limit(self):
+        in_progress = 0
+        max_in_progress = 0
+
+        async def execute(source):
+            nonlocal in_progress, max_in_progress
+            in_progress += 1
+            max_in_progress = max(max_in_progress, in_progress)
+            await asyncio.sleep(0.001)
+            in_progress -= 1
+            return TaskResult(TaskResultStatus.SUCCESS, str(source))
+
+        executor = FleetExecutor(AdaptiveConcurrencyLimit(initial=3, maximum=3))
+        results = []
+
+        summary = await executor.run(_sources(20), execute, results.append)
+
+        self.assertEqual(max_in_progress, 3)
+        self.assertEqual(summary.total, 20)
+        self.assertEqual(sorted(int(result.message) for result in results), list(range(20)))
+
+    async def test_results_are_handed_over_as_they_complete(self):
+        handed_over = []
+
+        async def execute(source):
+            await asyncio.sleep(0.02 if source == 0 else 0)
+            return TaskResult(TaskResultStatus.SUCCESS, str(source))
+
+        def on_result(result):
+            handed_over.append(result.message)
+
+        await FleetExecutor(AdaptiveConcurrencyLimit(initial=2)).run(_sources(3), execute, on_result)
+
+        self.assertEqual(handed_over, ['1', '2', '0'])
+
+    async def test_progress_is_reported(self):
+
+        async def execute(source):
+            return TaskResult(TaskResultStatus.SUCCESS, '')
+
+        with self.assertLogs('checklisting.fleet', 'INFO') as logs:
+            await FleetExecutor(AdaptiveConcurrencyLimit(initial=1), progress_interval=1e-9).run(
+                _sources(2), execute, lambda result: None)
+
+        self.assertRegex(logs.output[0], r'\[1\] sources checked: SUCCESS=\[1\]; \[0\] in progress, ' +
+                         r'concurrency limit is \[\d+\]')
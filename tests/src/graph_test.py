@@ -0,0 +1,147 @@
+import asyncio
+from typing import List
+
+import asynctest
+
+from checklisting.graph import DependentTask, TaskGraph, is_prerequisite_satisfied
+from checklisting.result import TaskResult
+from checklisting.result.status import TaskResultStatus
+from checklisting.scheduler import BoundedTaskScheduler
+from checklisting.task import BaseTask, MultiTask
+
+
+class RecordingTask(BaseTask):
+
+    def __init__(self, log: List[str], name: str, status: TaskResultStatus = TaskResultStatus.SUCCESS,
+                 delay: float = 0) -> None:
+        super().__init__()
+        self._log = log
+        self._name = name
+        self._status = status
+        self._delay = delay
+
+    async def _execute(self):
+        self._log.append(f'start {self._name}')
+        await asyncio.sleep(self._delay)
+        self._log.append(f'end {self._name}')
+        return TaskResult(self._status, self._name)
+
+
+class IsPrerequisiteSatisfiedTest(asynctest.TestCase):
+
+    def test_only_FAILURE_and_UNKNOWN_are_not_satisfied(self):
+        for status in TaskResultStatus:
+            self.assertEqual(is_prerequisite_satisfied(TaskResult(status, '')),
+                             status not in (TaskResultStatus.FAILURE, TaskResultStatus.UNKNOWN))
+
+
+class DependentTaskTest(asynctest.TestCase):
+
+    async def test_executed_alone_ignores_prerequisites(self):
+        log = []
+        result = await DependentTask(RecordingTask(log, 'b'), [RecordingTask(log, 'a')]).execute()
+
+        self.assertEqual(result.message, 'b')
+        self.assertEqual(log, ['start b', 'end b'])
+
+
+class TaskGraphTest(asynctest.TestCase):
+
+    def setUp(self):
+        self.log = []
+
+    async def test_tasks_are_executed_after_their_prerequisites(self):
+        a = RecordingTask(self.log, 'a', delay=0.01)
+        b = RecordingTask(self.log, 'b')
+        graph = TaskGraph([DependentTask(b, [a]), a])
+
+        result = await graph.execute()
+
+        self.assertEqual(self.log, ['start a', 'end a', 'start b', 'end b'])
+        self.assertEqual([r.message for r in result.results], ['b', 'a'])
+
+    async def test_independent_tasks_are_executed_concurrently(self):
+        a = RecordingTask(self.log, 'a', delay=0.01)
+        b = RecordingTask(self.log, 'b', delay=0.01)
+        c = RecordingTask(self.log, 'c')
+        graph = TaskGraph([a, b, DependentTask(c, [a, b])])
+
+        await graph.execute()
+
+        self.assertEqual(self.log[:2], ['start a', 'start b'])
+        self.assertEqual(self.log[-2:], ['start c', 'end c'])
+
+    async def test_skips_whole_subtree_of_failed_prerequisite(self):
+        a = RecordingTask(self.log, 'a', TaskResultStatus.FAILURE)
+        b = DependentTask(RecordingTask(self.log, 'b'), [a])
+        c = DependentTask(RecordingTask(self.log, 'c'), [b])
+        d = RecordingTask(self.log, 'd')
+        graph = TaskGraph([a, b, c, d])
+
+        result = await graph.execute()
+
+        self.assertEqual(result.status, TaskResultStatus.FAILURE)
+        self.assertEqual(sorted(self.log), ['end a', 'end d', 'start a', 'start d'])
+        (_, skipped_b, skipped_c, _) = result.results
+        self.assertEqual(skipped_b.status, TaskResultStatus.UNKNOWN)
+        self.assertEqual(skipped_b.message,
+                         'Task [RecordingTask] skipped, as its prerequisite [RecordingTask] was not satisfied')
+        self.assertEqual(skipped_c.status, TaskResultStatus.UNKNOWN)
+
+    async def test_prerequisite_may_be_referenced_by_its_wrapper(self):
+        a = DependentTask(RecordingTask(self.log, 'a', TaskResultStatus.FAILURE), [])
+        graph = TaskGraph([a, DependentTask(RecordingTask(self.log, 'b'), [a])])
+
+        await graph.execute()
+
+        self.assertEqual(self.log, ['start a', 'end a'])
+
+    async def test_custom_satisfaction_predicate(self):
+        a = RecordingTask(self.log, 'a', TaskResultStatus.FAILURE)
+        graph = TaskGraph([a, DependentTask(RecordingTask(self.log, 'b'), [a])], is_satisfied=lambda result: True)
+
+        await graph.execute()
+
+        self.assertEqual(self.log, ['start a', 'end a', 'start b', 'end b'])
+
+    async def test_respects_scheduler_limits(self):
+        a = RecordingTask(self.log, 'a')
+        graph = TaskGraph([a, DependentTask(MultiTask([RecordingTask(self.log, 'b')]), [a])],
+                          scheduler=BoundedTaskScheduler(1))
+
+        result = await asyncio.wait_for(graph.execute(), 1)
+
+        self.assertEqual(result.status, TaskResultStatus.SUCCESS)
+
+    async def test_stream_yields_results_of_graph_tasks_with_their_paths(self):
+        a = RecordingTask(self.log, 'a')
+        graph = TaskGraph([
+            a,
+            DependentTask(RecordingTask(self.log, 'b'), [a]),
+            MultiTask([RecordingTask(self.log, 'x'), RecordingTask(self.log, 'y')])
+        ])
+        root = MultiTask([RecordingTask(self.log, 't'), graph])
+
+        streamed = {path: result.message async for (path, result) in root.execute_stream()}
+
+        self.assertEqual(sorted(streamed), [(), (0, ), (1, ), (1, 0), (1, 1), (1, 2), (1, 2, 0), (1, 2, 1)])
+        self.assertEqual([streamed[path] for path in [(1, 0), (1, 1), (1, 2, 0), (1, 2, 1)]], ['a', 'b', 'x', 'y'])
+
+    async def test_stream_yields_skipped_results_of_graph_tasks(self):
+        a = RecordingTask(self.log, 'a', TaskResultStatus.FAILURE)
+        graph = TaskGraph([a, DependentTask(RecordingTask(self.log, 'b'), [a])])
+
+        streamed = [(path, result.status) async for (path, result) in graph.execute_stream()]
+
+        self.assertEqual(streamed, [((0, ), TaskResultStatus.FAILURE), ((1, ), TaskResultStatus.UNKNOWN),
+                                    ((), TaskResultStatus.FAILURE)])
+
+    def test_unknown_prerequisite_is_not_allowed(self):
+        with self.assertRaises(RuntimeError):
+            TaskGraph([DependentTask(RecordingTask(self.log, 'b'), [RecordingTask(self.log, 'a')])])
+
+    def test_cycles_are_not_allowed(self):
+        a = RecordingTask(self.log, 'a')
+        b = RecordingTask(self.log, 'b')
+        with self.assertRaises(RuntimeError):
+            TaskGraph([DependentTask(a, [b]), DependentTask(b, [a])])
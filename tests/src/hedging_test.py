@@ -0,0 +1,142 @@
+import asyncio
+import unittest
+
+import asynctest
+
+from checklisting.hedging import HedgingPolicy, LatencyTracker
+from checklisting.result import TaskResult
+from checklisting.result.status import TaskResultStatus
+
+
+class LatencyTrackerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tracker = LatencyTracker(10)
+
+    def test_percentile_of_source(self):
+        for latency in range(1, 11):
+            self.tracker.record('a', latency)
+        self.tracker.record('b', 100)
+
+        self.assertEqual(self.tracker.get_percentile(0.9, 'a'), 9)
+        self.assertEqual(self.tracker.get_percentile(1, 'a'), 10)
+        self.assertEqual(self.tracker.get_percentile(0.5, 'b'), 100)
+
+    def test_percentile_of_all_sources(self):
+        self.tracker.record('a', 1)
+        self.tracker.record('b', 3)
+
+        self.assertEqual(self.tracker.get_percentile(1), 3)
+        self.assertEqual(self.tracker.count(), 2)
+
+    def test_only_recent_latencies_are_kept(self):
+        for latency in range(20):
+            self.tracker.record('a', latency)
+
+        self.assertEqual(self.tracker.count('a'), 10)
+        self.assertEqual(self.tracker.get_percentile(0.1, 'a'), 10)
+
+    def test_unknown_source_has_no_percentile(self):
+        self.assertIsNone(self.tracker.get_percentile(0.5, 'a'))
+
+    def test_least_recently_recorded_sources_are_dropped(self):
+        tracker = LatencyTracker(10, max_keys=2)
+        tracker.record('a', 1)
+        tracker.record('b', 2)
+        tracker.record('a', 3)
+        tracker.record('c', 4)
+
+        self.assertEqual(tracker.count('a'), 2)
+        self.assertEqual(tracker.count('b'), 0)
+        self.assertEqual(tracker.count('c'), 1)
+        self.assertEqual(tracker.count(), 4)
+
+
+class HedgingPolicyDelayTest(unittest.TestCase):
+
+    def test_default_delay_is_used_without_enough_observations(self):
+        policy = HedgingPolicy(min_samples=2, default_delay=3)
+        policy.tracker.record('a', 1)
+
+        self.assertEqual(policy.get_delay('a'), 3)
+
+    def test_observations_of_all_sources_are_used_without_enough_of_source(self):
+        policy = HedgingPolicy(percentile=1, min_samples=2, default_delay=3)
+        policy.tracker.record('a', 1)
+        policy.tracker.record('b', 2)
+
+        self.assertEqual(policy.get_delay('c'), 2)
+
+    def test_observations_of_source_are_preferred(self):
+        policy = HedgingPolicy(percentile=1, min_samples=2)
+        for (key, latency) in [('a', 1), ('a', 1), ('b', 5), ('b', 5)]:
+            policy.tracker.record(key, latency)
+
+        self.assertEqual(policy.get_delay('a'), 1)
+
+
+class Source(object):
+
+    def __init__(self, *delays: float, fail: bool = False) -> None:
+        self.calls = 0
+        self._delays = list(delays)
+        self._fail = fail
+
+    async def __call__(self):
+        self.calls += 1
+        call = self.calls
+        await asyncio.sleep(self._delays.pop(0))
+        if self._fail and call == 1:
+            raise ConnectionResetError('reset')
+        return TaskResult(TaskResultStatus.SUCCESS, f'call {call}')
+
+
+class HedgingPolicyTest(asynctest.TestCase):
+
+    async def test_no_hedging_without_delay(self):
+        source = Source(0.01)
+
+        result = await HedgingPolicy().execute('a', source)
+
+        self.assertEqual(result.message, 'call 1')
+        self.assertEqual(source.calls, 1)
+
+    async def test_fast_response_is_not_hedged(self):
+        source = Source(0.001, 0.001)
+
+        result = await HedgingPolicy(default_delay=0.05).execute('a', source)
+
+        self.assertEqual(result.message, 'call 1')
+        self.assertEqual(source.calls, 1)
+
+    async def test_slow_response_is_hedged_and_faster_one_wins(self):
+        source = Source(1, 0.01)
+
+        result = await asyncio.wait_for(HedgingPolicy(default_delay=0.01).execute('a', source), 0.5)
+
+        self.assertEqual(result.message, 'call 2')
+        self.assertEqual(source.calls, 2)
+
+    async def test_failed_request_gives_way_to_other_one(self):
+        source = Source(0.03, 0.04, fail=True)
+
+        result = await HedgingPolicy(default_delay=0.01).execute('a', source)
+
+        self.assertEqual(result.message, 'call 2')
+
+    async def test_error_is_raised_when_all_requests_fail(self):
+
+        async def failing():
+            await asyncio.sleep(0.02)
+            raise ConnectionResetError('reset')
+
+        with self.assertRaises(ConnectionResetError):
+            await HedgingPolicy(default_delay=0.01).execute('a', failing)
+
+    async def test_latency_of_responses_is_recorded(self):
+        policy = HedgingPolicy()
+
+        await policy.execute('a', Source(0.01))
+
+        self.assertEqual(policy.tracker.count('a'), 1)
+        self.assertGreaterEqual(policy.tracker.get_percentile(1, 'a'), 0.01)
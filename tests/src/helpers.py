@@ -0,0 +1,31 @@
+import asyncio
+
+from checklisting.deadline import get_deadline
+from checklisting.result import TaskResult
+from checklisting.result.status import TaskResultStatus
+from checklisting.task import BaseTask
+
+
+class FakeClock(object):
+
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class CountingTask(BaseTask):
+
+    def __init__(self, delay: float = 0) -> None:
+        super().__init__()
+        self.calls = 0
+        self.deadlines = []
+        self._delay = delay
+
+    async def _execute(self):
+        self.calls += 1
+        calls = self.calls
+        self.deadlines.append(get_deadline())
+        await asyncio.sleep(self._delay)
+        return TaskResult(TaskResultStatus.INFO, f'call {calls}')
@@ -0,0 +1,128 @@
+import asyncio
+import time
+
+import asynctest
+import mock
+from helpers import FakeClock
+
+from checklisting.lag import LoopLagMonitor, LoopLagTask, create_self_check
+from checklisting.result import BaseTaskResult, TaskResult
+from checklisting.result.status import TaskResultStatus
+from checklisting.task import BaseTask
+
+
+class BlockingSleepTask(BaseTask):
+
+    def __init__(self, duration: float) -> None:
+        super().__init__()
+        self._duration = duration
+
+    async def _execute(self) -> BaseTaskResult:
+        time.sleep(self._duration)
+        return TaskResult(TaskResultStatus.SUCCESS, 'slept')
+
+
+class LoopLagMonitorTest(asynctest.TestCase):
+
+    def setUp(self):
+        self.monitor = LoopLagMonitor(interval=0.01, threshold=0.05)
+        self.monitor.start(self.loop)
+
+    def tearDown(self):
+        self.monitor.stop()
+
+    async def test_lag_is_sampled(self):
+        await asyncio.sleep(0.05)
+
+        stats = self.monitor.get_stats()
+        self.assertGreater(stats.samples, 0)
+        self.assertLess(stats.max_lag, 0.05)
+        self.assertEqual(stats.stalls, [])
+
+    async def test_stall_is_attributed_to_blocking_task(self):
+        await BlockingSleepTask(0.15).execute()
+        await asyncio.sleep(0.02)
+
+        stats = self.monitor.get_stats()
+        self.assertEqual(len(stats.stalls), 1)
+        self.assertGreaterEqual(stats.stalls[0].lag, 0.05)
+        self.assertRegex(stats.stalls[0].blocker, r'^task \[BlockingSleepTask\] in _execute \(lag_test.py:\d+\)$')
+
+    async def test_stall_is_attributed_to_callback(self):
+        self.loop.call_soon(time.sleep, 0.15)
+        await asyncio.sleep(0.2)
+
+        stats = self.monitor.get_stats()
+        self.assertEqual(len(stats.stalls), 1)
+        self.assertRegex(stats.stalls[0].blocker, r'^callback in ')
+
+    async def test_stop_cancels_heartbeat(self):
+        self.monitor.stop()
+        samples = self.monitor.get_stats().samples
+
+        await asyncio.sleep(0.03)
+
+        self.assertFalse(self.monitor.is_running)
+        self.assertEqual(self.monitor.get_stats().samples, samples)
+
+
+class LoopLagTaskTest(asynctest.TestCase):
+
+    async def test_result_is_unknown_without_running_monitor(self):
+        result = await LoopLagTask(LoopLagMonitor()).execute()
+
+        self.assertEqual(result.status, TaskResultStatus.UNKNOWN)
+        self.assertEqual(result.message, 'Event loop lag is not monitored')
+
+    async def test_result_is_success_without_stalls(self):
+        monitor = LoopLagMonitor(interval=0.01, threshold=0.05)
+        monitor.start(self.loop)
+        try:
+            await asyncio.sleep(0.03)
+            result = await LoopLagTask(monitor).execute()
+        finally:
+            monitor.stop()
+
+        self.assertEqual(result.status, TaskResultStatus.SUCCESS)
+        self.assertIn('no stall longer than [0.05] seconds', result.message)
+
+    async def test_result_depends_on_worst_stall(self):
+        monitor = LoopLagMonitor(interval=0.01, threshold=0.05)
+        monitor.start(self.loop)
+        try:
+            await BlockingSleepTask(0.1).execute()
+            warning = await LoopLagTask(monitor).execute()
+            failure = await LoopLagTask(monitor, error_threshold=0.06).execute()
+        finally:
+            monitor.stop()
+
+        self.assertEqual(warning.status, TaskResultStatus.WARNING)
+        self.assertRegex(warning.message, r'stalled \[1\] times, worst for \[0\.\d+\] seconds by task ' +
+                         r'\[BlockingSleepTask\]')
+        self.assertEqual(failure.status, TaskResultStatus.FAILURE)
+
+    async def test_old_stalls_are_forgotten(self):
+        clock = FakeClock()
+        monitor = LoopLagMonitor(interval=0.1, threshold=0.05, window=10, clock=clock)
+        monitor.start(mock.Mock())
+        try:
+            clock.now += 2.1
+            monitor._beat()
+            failure = await LoopLagTask(monitor).execute()
+            for _ in range(11):
+                clock.now += 0.1
+                monitor._beat()
+            success = await LoopLagTask(monitor).execute()
+        finally:
+            monitor.stop()
+
+        self.assertEqual(failure.status, TaskResultStatus.FAILURE)
+        self.assertIn('stalled [1] times', failure.message)
+        self.assertEqual(success.status, TaskResultStatus.SUCCESS)
+        self.assertEqual(monitor.get_stats().stalls, [])
+
+    async def test_self_check_is_checklist_of_loop_lag(self):
+        result = await create_self_check(LoopLagMonitor()).execute()
+
+        self.assertEqual(result.status, TaskResultStatus.UNKNOWN)
+        self.assertIn('Checklist [self-check]', result.message)
@@ -0,0 +1,50 @@
+import asyncio
+import unittest
+
+import mock
+import uvloop
+
+from checklisting.loop import set_event_loop_implementation
+
+
+class SetEventLoopImplementationTest(unittest.TestCase):
+
+    def tearDown(self):
+        asyncio.set_event_loop_policy(None)
+
+    def test_policy_is_kept_when_no_implementation_is_given(self):
+        policy = asyncio.get_event_loop_policy()
+
+        self.assertEqual(set_event_loop_implementation(None), 'asyncio')
+        self.assertIs(asyncio.get_event_loop_policy(), policy)
+
+    def test_uvloop_policy_is_set(self):
+        self.assertEqual(set_event_loop_implementation('uvloop'), 'uvloop')
+        self.assertIsInstance(asyncio.get_event_loop_policy(), uvloop.EventLoopPolicy)
+
+        loop = asyncio.new_event_loop()
+        try:
+            self.assertIsInstance(loop, uvloop.Loop)
+            self.assertEqual(loop.run_until_complete(asyncio.sleep(0, 'done')), 'done')
+        finally:
+            loop.close()
+
+    def test_auto_prefers_uvloop(self):
+        self.assertEqual(set_event_loop_implementation('auto'), 'uvloop')
+
+    def test_asyncio_policy_is_restored(self):
+        set_event_loop_implementation('uvloop')
+
+        self.assertEqual(set_event_loop_implementation('asyncio'), 'asyncio')
+        self.assertNotIsInstance(asyncio.get_event_loop_policy(), uvloop.EventLoopPolicy)
+
+    def test_asyncio_is_used_when_uvloop_is_missing(self):
+        with mock.patch('checklisting.loop.has_module', return_value=False):
+            with self.assertLogs('checklisting.loop', 'WARNING'):
+                self.assertEqual(set_event_loop_implementation('uvloop'), 'asyncio')
+            self.assertEqual(set_event_loop_implementation('auto'), 'asyncio')
+        self.assertNotIsInstance(asyncio.get_event_loop_policy(), uvloop.EventLoopPolicy)
+
+    def test_unknown_implementation_raises_error(self):
+        with self.assertRaisesRegex(RuntimeError, r'Unknown event loop implementation \[tokio\]'):
+            set_event_loop_implementation('tokio')
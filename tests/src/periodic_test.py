@@ -0,0 +1,91 @@
+import asyncio
+
+import asynctest
+from helpers import CountingTask, FakeClock
+
+from checklisting.deadline import deadline_scope
+from checklisting.periodic import PeriodicTaskExecutor
+
+
+class PeriodicTaskExecutorTest(asynctest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.task = CountingTask()
+        self.executor = PeriodicTaskExecutor(self.task, 10, clock=self.clock)
+
+    async def tearDown(self):
+        await self.executor.stop()
+
+    async def test_has_no_snapshot_before_first_execution(self):
+        self.assertIsNone(self.executor.snapshot)
+        self.assertIsNone(self.executor.age)
+        self.assertTrue(self.executor.is_stale)
+
+    async def test_first_snapshot_is_awaited(self):
+        snapshot = await self.executor.get_snapshot()
+
+        self.assertEqual(snapshot.result.message, 'call 1')
+        self.assertEqual(snapshot.taken_at, 100.0)
+        self.assertEqual(self.executor.age, 0)
+
+    async def test_latest_snapshot_is_returned_without_executing_task(self):
+        await self.executor.refresh()
+        self.clock.now += 5
+
+        snapshot = await self.executor.get_snapshot()
+
+        self.assertEqual(self.task.calls, 1)
+        self.assertEqual(self.executor.age, 5)
+        self.assertFalse(self.executor.is_stale)
+        self.assertIs(snapshot, self.executor.snapshot)
+
+    async def test_snapshot_older_than_max_age_is_stale(self):
+        await self.executor.refresh()
+        self.clock.now += 21
+
+        self.assertTrue(self.executor.is_stale)
+
+    async def test_concurrent_refreshes_execute_task_once(self):
+        executor = PeriodicTaskExecutor(CountingTask(0.01), 10)
+
+        snapshots = await asyncio.gather(executor.refresh(), executor.refresh())
+
+        self.assertIs(snapshots[0], snapshots[1])
+
+    async def test_refresh_does_not_inherit_deadline_of_caller(self):
+        with deadline_scope(5):
+            await self.executor.refresh()
+
+        self.assertEqual(self.task.deadlines, [None])
+
+    async def test_refreshed_results_are_passed_on(self):
+        results = []
+        executor = PeriodicTaskExecutor(self.task, 10, on_refresh=results.append)
+
+        snapshot1 = await executor.refresh()
+        await executor.get_snapshot()
+        snapshot2 = await executor.refresh()
+
+        self.assertEqual(results, [snapshot1.result, snapshot2.result])
+
+    async def test_refreshes_snapshot_periodically_in_background(self):
+        executor = PeriodicTaskExecutor(self.task, 0.01)
+        executor.start()
+        await asyncio.sleep(0.05)
+        await executor.stop()
+
+        self.assertGreater(self.task.calls, 2)
+        self.assertFalse(executor.is_running)
+
+    async def test_start_is_idempotent(self):
+        self.executor.start()
+        self.executor.start()
+        await asyncio.sleep(0.01)
+
+        self.assertTrue(self.executor.is_running)
+        self.assertEqual(self.task.calls, 1)
+
+    def test_interval_must_be_positive(self):
+        with self.assertRaises(AssertionError):
+            PeriodicTaskExecutor(self.task, 0)
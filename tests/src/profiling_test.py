@@ -0,0 +1,112 @@
+import asyncio
+import os
+import pstats
+import tempfile
+import time
+
+import asynctest
+
+from checklisting.profiling import CProfileProfiler, SamplingProfiler, TaskStats, create_profiler
+from checklisting.result import TaskResult
+from checklisting.result.status import TaskResultStatus
+from checklisting.task import BaseTask, MultiTask
+
+
+def busy_loop(duration: float) -> None:
+    until = time.monotonic() + duration
+    while time.monotonic() < until:
+        pass
+
+
+class BusyTask(BaseTask):
+
+    async def _execute(self):
+        busy_loop(0.05)
+        return TaskResult(TaskResultStatus.SUCCESS, 'busy')
+
+
+class IdleTask(BaseTask):
+
+    async def _execute(self):
+        await asyncio.sleep(0.05)
+        return TaskResult(TaskResultStatus.SUCCESS, 'idle')
+
+
+class TaskStatsTest(asynctest.TestCase):
+
+    async def test_records_wall_and_cpu_time_per_task(self):
+        with CProfileProfiler() as profiler:
+            await MultiTask([BusyTask(), IdleTask(), IdleTask()]).execute()
+
+        entries = profiler.task_stats.entries
+        self.assertEqual(entries['IdleTask'].count, 2)
+        self.assertGreaterEqual(entries['IdleTask'].wall_time, 0.1)
+        self.assertLess(entries['IdleTask'].cpu_time, 0.02)
+        self.assertGreaterEqual(entries['BusyTask'].cpu_time, 0.04)
+        self.assertGreaterEqual(entries['MultiTask'].wall_time, 0.05)
+
+    async def test_nothing_is_recorded_without_active_profiler(self):
+        profiler = CProfileProfiler()
+
+        await BusyTask().execute()
+
+        self.assertEqual(profiler.task_stats.entries, {})
+
+    async def test_results_and_errors_are_passed_through(self):
+
+        class FailingTask(BaseTask):
+
+            async def _execute(self):
+                await asyncio.sleep(0)
+                raise RuntimeError('failed')
+
+        with CProfileProfiler():
+            results = await asyncio.gather(IdleTask().execute(), FailingTask().execute())
+
+        self.assertEqual([result.message for result in results], ['idle', 'failed'])
+
+    def test_lines_are_ordered_by_wall_time(self):
+        task_stats = TaskStats()
+        task_stats.record('Fast', 0.1, 0.1)
+        task_stats.record('Slow', 2, 0.5)
+
+        self.assertEqual([line.split()[0] for line in task_stats.get_lines()], ['Slow', 'Fast'])
+
+
+class ProfilerTest(asynctest.TestCase):
+
+    def _dump(self, profiler):
+        (fd, path) = tempfile.mkstemp()
+        os.close(fd)
+        self.addCleanup(os.remove, path)
+        profiler.dump(path)
+        return path
+
+    async def test_cprofile_reports_hot_functions_and_dumps_pstats(self):
+        with CProfileProfiler() as profiler:
+            await BusyTask().execute()
+
+        self.assertIn('busy_loop', ' '.join(function for (function, _) in profiler.get_hot_functions(5)))
+        self.assertIn('BusyTask', profiler.report())
+        self.assertTrue(any(key[2] == 'busy_loop' for key in pstats.Stats(self._dump(profiler)).stats))
+
+    async def test_sampling_reports_hot_functions_and_dumps_collapsed_stacks(self):
+        with SamplingProfiler(0.001) as profiler:
+            await BusyTask().execute()
+
+        self.assertGreater(profiler.samples, 0)
+        self.assertIn('busy_loop', profiler.get_hot_functions(1)[0][0])
+        with open(self._dump(profiler)) as stream:
+            lines = stream.read().splitlines()
+        self.assertTrue(any('busy_loop' in line for line in lines))
+        self.assertTrue(all(line.rsplit(' ', 1)[1].isdigit() for line in lines))
+
+    def test_only_one_profiling_may_be_in_progress(self):
+        with CProfileProfiler():
+            with self.assertRaises(RuntimeError):
+                SamplingProfiler().start()
+
+    def test_unknown_profiler(self):
+        self.assertIsInstance(create_profiler('sampling'), SamplingProfiler)
+        with self.assertRaises(RuntimeError):
+            create_profiler('unknown')
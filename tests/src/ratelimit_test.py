@@ -0,0 +1,114 @@
+import asyncio
+import unittest
+
+import asynctest
+from helpers import FakeClock
+
+from checklisting.ratelimit import (RateLimiterRegistry, TokenBucket, get_default_rate_limiters,
+                                    set_default_rate_limiters, set_process_rate_limiters, throttle)
+from checklisting.result import TaskResult
+from checklisting.result.status import TaskResultStatus
+from checklisting.task import BaseTask, MultiTask, WrapperTask
+
+
+class TokenBucketTest(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.bucket = TokenBucket(2, 2, self.clock)
+
+    def test_burst_is_available_right_away(self):
+        self.assertEqual([self.bucket.reserve() for _ in range(2)], [0.0, 0.0])
+
+    def test_callers_beyond_burst_wait_in_order_of_arrival(self):
+        self.bucket.reserve()
+        self.bucket.reserve()
+
+        self.assertEqual([self.bucket.reserve() for _ in range(3)], [0.5, 1.0, 1.5])
+
+    def test_tokens_are_refilled_with_given_rate(self):
+        self.bucket.reserve()
+        self.bucket.reserve()
+        self.clock.now += 0.5
+
+        self.assertEqual(self.bucket.reserve(), 0.0)
+        self.assertEqual(self.bucket.reserve(), 0.5)
+
+    def test_refill_is_capped_by_burst(self):
+        self.clock.now += 100
+
+        self.assertEqual([self.bucket.reserve() for _ in range(3)], [0.0, 0.0, 0.5])
+
+    def test_arguments_are_validated(self):
+        with self.assertRaises(AssertionError):
+            TokenBucket(0)
+
+        with self.assertRaises(AssertionError):
+            TokenBucket(1, 0)
+
+
+class RateLimiterRegistryTest(unittest.TestCase):
+
+    def test_destinations_are_not_limited_without_rate(self):
+        self.assertIsNone(RateLimiterRegistry().get('host:80'))
+
+    def test_default_rate_applies_to_each_destination_separately(self):
+        registry = RateLimiterRegistry(5, 2)
+
+        self.assertIsNot(registry.get('host:80'), registry.get('host:81'))
+        self.assertIs(registry.get('host:80'), registry.get('host:80'))
+        self.assertEqual(registry.get('host:80').rate, 5)
+
+    def test_destination_limits_override_default(self):
+        registry = RateLimiterRegistry.ofDict({
+            'rate': 5,
+            'destinations': {
+                'zk:2181': {'rate': 1, 'burst': 3},
+                'web': {'rate': 2},
+            }
+        })
+
+        self.assertEqual((registry.get('zk:2181').rate, registry.get('zk:2181').burst), (1, 3))
+        self.assertEqual((registry.get('web:8080').rate, registry.get('web:8080').burst), (2, 1))
+        self.assertEqual(registry.get('zk:2182').rate, 5)
+
+
+class ThrottledTask(BaseTask):
+
+    async def _execute(self):
+        await throttle('host:1')
+        return TaskResult(TaskResultStatus.SUCCESS, 'done')
+
+
+class ThrottleTest(asynctest.TestCase):
+
+    def setUp(self):
+        self._default_rate_limiters = get_default_rate_limiters()
+
+    def tearDown(self):
+        set_default_rate_limiters(self._default_rate_limiters)
+
+    async def test_throttling_is_reported_in_timing(self):
+        set_process_rate_limiters({'rate': 50})
+
+        results = [await ThrottledTask().execute() for _ in range(3)]
+
+        self.assertEqual(results[0].timing.throttled, 0.0)
+        self.assertAlmostEqual(results[1].timing.throttled, 0.02, delta=0.01)
+        self.assertGreaterEqual(results[1].timing.duration, results[1].timing.throttled)
+
+    async def test_throttling_of_subtasks_counts_towards_parents(self):
+        set_process_rate_limiters({'rate': 50})
+
+        result = await MultiTask([WrapperTask(ThrottledTask()), ThrottledTask()]).execute()
+
+        self.assertAlmostEqual(result.timing.throttled, 0.02, delta=0.01)
+        self.assertEqual(result.results[0].timing.throttled, 0.0)
+        self.assertAlmostEqual(result.results[1].timing.throttled, 0.02, delta=0.01)
+
+    async def test_there_are_no_rate_limiters_by_default(self):
+        set_process_rate_limiters(None)
+
+        results = await asyncio.gather(*[ThrottledTask().execute() for _ in range(3)])
+
+        self.assertEqual([result.timing.throttled for result in results], [0.0, 0.0, 0.0])
@@ -0,0 +1,71 @@
+import unittest
+
+import mock
+
+from checklisting.result import MultiTaskResult, TaskResult, TaskTiming, diff
+from checklisting.result.diff import ResultChange, ResultChangeKind, describe_change, diff_results
+from checklisting.result.status import TaskResultStatus
+
+
+def _tree(*statuses):
+    return MultiTaskResult(TaskResultStatus.SUCCESS, 'root', [
+        MultiTaskResult(TaskResultStatus.SUCCESS, 'group', [TaskResult(status, f'leaf {idx}')
+                                                            for (idx, status) in enumerate(statuses)]),
+        TaskResult(TaskResultStatus.INFO, 'info')
+    ])
+
+
+class DiffResultsTest(unittest.TestCase):
+
+    def test_equal_trees_have_no_changes(self):
+        self.assertEqual(list(diff_results(_tree(TaskResultStatus.SUCCESS), _tree(TaskResultStatus.SUCCESS))), [])
+
+    def test_timing_is_not_a_change(self):
+        timed = TaskResult(TaskResultStatus.SUCCESS, 'foo', TaskTiming(1.0, 2.0, 1.0, 0.0))
+
+        self.assertEqual(list(diff_results(TaskResult(TaskResultStatus.SUCCESS, 'foo'), timed)), [])
+
+    def test_reports_only_results_which_changed_with_their_paths(self):
+        old = _tree(TaskResultStatus.SUCCESS, TaskResultStatus.SUCCESS)
+        new = _tree(TaskResultStatus.SUCCESS, TaskResultStatus.FAILURE)
+
+        changes = list(diff_results(old, new))
+
+        self.assertEqual(changes, [ResultChange((0, 1), ResultChangeKind.CHANGED, old.results[0].results[1],
+                                                new.results[0].results[1])])
+
+    def test_reports_changed_message(self):
+        changes = list(diff_results(TaskResult(TaskResultStatus.SUCCESS, 'foo'),
+                                    TaskResult(TaskResultStatus.SUCCESS, 'bar')))
+
+        self.assertEqual([(change.path, change.kind) for change in changes], [((), ResultChangeKind.CHANGED)])
+
+    def test_reports_added_and_removed_results(self):
+        old = _tree(TaskResultStatus.SUCCESS, TaskResultStatus.SUCCESS)
+        new = _tree(TaskResultStatus.SUCCESS, TaskResultStatus.SUCCESS, TaskResultStatus.WARNING)
+
+        self.assertEqual([(change.path, change.kind) for change in diff_results(old, new)],
+                         [((0, 2), ResultChangeKind.ADDED)])
+        self.assertEqual([(change.path, change.kind) for change in diff_results(new, old)],
+                         [((0, 2), ResultChangeKind.REMOVED)])
+
+    def test_skips_identical_subtrees(self):
+        old = MultiTaskResult(TaskResultStatus.SUCCESS, 'root', [_tree(TaskResultStatus.SUCCESS), TaskResult(
+            TaskResultStatus.SUCCESS, 'foo')])
+        new = MultiTaskResult(TaskResultStatus.SUCCESS, 'root', [_tree(TaskResultStatus.SUCCESS), TaskResult(
+            TaskResultStatus.SUCCESS, 'bar')])
+
+        with mock.patch('checklisting.result.diff._get_results', wraps=diff._get_results) as spy:
+            changes = list(diff_results(old, new))
+
+        self.assertEqual([change.path for change in changes], [(1, )])
+        visited = [call[0][0] for call in spy.call_args_list]
+        self.assertFalse(any(result is old.results[0] or result is new.results[0] for result in visited))
+
+    def test_describes_changes(self):
+        (old, new) = (TaskResult(TaskResultStatus.SUCCESS, 'foo'), TaskResult(TaskResultStatus.FAILURE, 'bar'))
+
+        self.assertEqual(describe_change(ResultChange((0, 1), ResultChangeKind.CHANGED, old, new)),
+                         '/0/1 changed from [SUCCESS] foo to [FAILURE] bar')
+        self.assertEqual(describe_change(ResultChange((), ResultChangeKind.ADDED, None, new)),
+                         '/ added: [FAILURE] bar')
@@ -1,7 +1,12 @@
 # encoding: utf-8
+import copy
+import gc
 import mock
+import pickle
+import tracemalloc
 import unittest
-from checklisting.result import TaskResult, MultiTaskResult
+from checklisting.result import LazyMessage, TaskResult, MultiTaskResult, TaskTiming
+from checklisting.result.builder import MultiTaskResultBuilder
 from checklisting.result.status import TaskResultStatus
 
 
@@ -33,6 +38,23 @@ class TaskResultTest(unittest.TestCase):
         self.assertNotIn(long_message, r)
         self.assertIn(message, r)
 
+    def test_result_has_no_instance_dict(self):
+        self.assertFalse(hasattr(self.result, '__dict__'))
+
+    def test_equal_messages_are_stored_once(self):
+        result = TaskResult(self.status, ''.join(['f', 'oo']))
+
+        self.assertIs(result.message, self.result.message)
+
+    def test_copies_keep_timing_and_retries(self):
+        timing = TaskTiming(1.0, 2.0, 1.0, 0.0)
+
+        result = self.result.with_timing(timing).with_retries(2)
+
+        self.assertEqual((result.timing, result.retries), (timing, 2))
+        self.assertEqual((self.result.timing, self.result.retries), (None, 0))
+        self.assertEqual(copy.copy(result).timing, timing)
+
 
 class MultiTaskResultTest(unittest.TestCase):
 
@@ -57,3 +79,127 @@ class MultiTaskResultTest(unittest.TestCase):
 
     def test_results_are_returned_as_is(self):
         self.assertEqual(self.multi_result.results, self.multi_result.results)
+
+    def test_results_are_shared_with_copies(self):
+        copied = self.multi_result.with_timing(TaskTiming(1.0, 2.0, 1.0, 0.0))
+
+        self.assertIs(copied.results, self.multi_result.results)
+
+    def test_results_cannot_be_modified(self):
+        with self.assertRaises(AttributeError):
+            self.multi_result.results.append(self.result1)
+
+    def test_memory_of_large_tree(self):
+        # guards compactness of results; tree of results federated from 100 agents holding 100 results each
+        parts = ['Disk [/] is used in [42%] ', 'at acceptable level']
+        tracemalloc.start()
+        try:
+            tree = MultiTaskResult(TaskResultStatus.SUCCESS, 'fleet', [
+                MultiTaskResult(TaskResultStatus.SUCCESS, f'IP [{agent}] Task success.', [
+                    TaskResult(TaskResultStatus.SUCCESS, ''.join(parts)) for _ in range(100)
+                ]) for agent in range(100)
+            ])
+            (size, _) = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        self.assertEqual(len(tree.results), 100)
+        self.assertLess(size / 10100, 150)
+
+
+class ResultDigestTest(unittest.TestCase):
+
+    def _build(self, leaf_message='bar'):
+        return MultiTaskResult(TaskResultStatus.SUCCESS, 'root', [
+            TaskResult(TaskResultStatus.SUCCESS, 'foo'),
+            MultiTaskResult(TaskResultStatus.INFO, 'inner', [TaskResult(TaskResultStatus.INFO, leaf_message)])
+        ])
+
+    def test_equal_trees_have_equal_digests(self):
+        self.assertEqual(self._build().digest, self._build().digest)
+        self.assertEqual(hash(self._build()), hash(self._build()))
+
+    def test_change_of_leaf_changes_digest_of_root(self):
+        self.assertNotEqual(self._build().digest, self._build('baz').digest)
+
+    def test_status_message_and_results_are_told_apart(self):
+        digests = {
+            TaskResult(TaskResultStatus.SUCCESS, 'foo').digest,
+            TaskResult(TaskResultStatus.INFO, 'foo').digest,
+            MultiTaskResult(TaskResultStatus.SUCCESS, 'foo', [TaskResult(TaskResultStatus.SUCCESS, '')]).digest,
+            MultiTaskResult(TaskResultStatus.SUCCESS, 'foo', [TaskResult(TaskResultStatus.SUCCESS, 'x')]).digest,
+        }
+        self.assertEqual(len(digests), 4)
+
+    def test_timing_is_not_part_of_digest(self):
+        result = self._build()
+
+        self.assertEqual(result.with_timing(TaskTiming(1.0, 2.0, 1.0, 0.0)).digest, result.digest)
+
+    def test_digest_is_computed_once(self):
+        result = self._build()
+
+        self.assertIs(result.digest, result.digest)
+
+    def test_hashed_trees_are_compared_without_walking_them(self):
+        (first, second, changed) = (self._build(), self._build(), self._build('baz'))
+        self.assertEqual(len({first, second, changed}), 2)
+
+        with mock.patch.object(TaskResult, '__eq__', side_effect=AssertionError('subtree walked')):
+            self.assertEqual(first, second)
+            self.assertNotEqual(first, changed)
+
+    def test_trees_are_compared_by_content_before_hashing(self):
+        self.assertEqual(self._build(), self._build())
+        self.assertNotEqual(self._build(), self._build('baz'))
+        self.assertEqual(TaskResult(TaskResultStatus.SUCCESS, mock.ANY), TaskResult(TaskResultStatus.SUCCESS, 'foo'))
+
+
+class LazyMessageTest(unittest.TestCase):
+
+    def setUp(self):
+        self.message = LazyMessage('[{key}]=[{value}]', key='foo', value=1.5)
+        self.result = TaskResult(TaskResultStatus.INFO, self.message)
+
+    def test_message_is_rendered_once_when_asked_for(self):
+        formatted = []
+
+        class Value(object):
+
+            def __format__(self, format_spec):
+                formatted.append(format_spec)
+                return '1.5'
+
+        result = TaskResult(TaskResultStatus.INFO, LazyMessage('[{key}]=[{value}]', key='foo', value=Value()))
+
+        MultiTaskResultBuilder().of_results([result])
+        self.assertEqual(formatted, [])
+
+        self.assertEqual(result.message, '[foo]=[1.5]')
+        self.assertEqual(result.message, '[foo]=[1.5]')
+        self.assertEqual(formatted, [''])
+
+    def test_fields_are_named_by_template(self):
+        message = LazyMessage('{disk.total} of [{name}] ([{name!r}], {values[0]})', values=[1], disk=None, name='a')
+
+        self.assertEqual(self.message.fields, {'key': 'foo', 'value': 1.5})
+        self.assertEqual(message.fields, {'disk': None, 'name': 'a', 'values': [1]})
+        with self.assertRaises(KeyError):
+            LazyMessage('[{key}]=[{value}]', key='foo')
+
+    def test_rendered_text_replaces_template_and_fields(self):
+        self.assertIn(self.message, gc.get_referents(self.result))
+
+        self.result.message
+
+        self.assertNotIn(self.message, gc.get_referents(self.result))
+        self.assertIn('[foo]=[1.5]', gc.get_referents(self.result))
+
+    def test_lazy_and_rendered_messages_make_same_results(self):
+        rendered = TaskResult(TaskResultStatus.INFO, '[foo]=[1.5]')
+
+        self.assertEqual(self.result, rendered)
+        self.assertEqual(self.result.digest, rendered.digest)
+
+    def test_survives_pickling(self):
+        self.assertEqual(pickle.loads(pickle.dumps(self.result)).message, '[foo]=[1.5]')
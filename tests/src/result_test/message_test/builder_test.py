@@ -57,7 +57,9 @@ class PrefixedTaskResultMessageBuilderTest(unittest.TestCase):
         msg = 'test_message'
         result = TaskResult(TaskResultStatus.UNKNOWN, msg)
         self.assertEqual(self.builder.of_results(TaskResultStatus.INFO, [result]), f'{self.prefix}mocked_message')
-        self.inner_builder.build.assert_called_once_with(TaskResultStatus.INFO, [msg])
+        self.inner_builder.build.assert_called_once_with(TaskResultStatus.INFO, unittest.mock.ANY)
+        (_, messages) = self.inner_builder.build.call_args[0]
+        self.assertEqual(list(messages), [msg])
         self.assertEqual(self.inner_builder.of_results.call_count, 0)
 
     def test_defaults(self):
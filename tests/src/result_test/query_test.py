@@ -0,0 +1,58 @@
+import unittest
+
+from checklisting.result import MultiTaskResult, TaskResult
+from checklisting.result.query import IndexedResult, ResultIndex, parse_path
+from checklisting.result.status import TaskResultStatus
+
+
+class ResultIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        self.failure = TaskResult(TaskResultStatus.FAILURE, 'failure')
+        self.group = MultiTaskResult(TaskResultStatus.FAILURE, 'group', [
+            TaskResult(TaskResultStatus.SUCCESS, 'success'), self.failure])
+        self.foo = MultiTaskResult(TaskResultStatus.FAILURE, 'foo', [
+            self.group,
+            TaskResult(TaskResultStatus.FAILURE, 'other failure'),
+            TaskResult(TaskResultStatus.INFO, 'info')
+        ])
+        self.bar = TaskResult(TaskResultStatus.FAILURE, 'bar')
+        self.index = ResultIndex([('foo', self.foo), ('bar', self.bar)])
+
+    def test_gets_results_by_path(self):
+        self.assertIs(self.index.get('foo'), self.foo)
+        self.assertIs(self.index.get('foo', (0, 1)), self.failure)
+        self.assertIsNone(self.index.get('foo', (0, 2)))
+        self.assertIsNone(self.index.get('baz'))
+        self.assertEqual(len(self.index), 7)
+        self.assertEqual(self.index.checklists, ['foo', 'bar'])
+
+    def test_finds_results_by_status_in_tree_order(self):
+        self.assertEqual([(found.checklist, found.path) for found in self.index.find(status=TaskResultStatus.FAILURE)],
+                         [('foo', ()), ('foo', (0, )), ('foo', (0, 1)), ('foo', (1, )), ('bar', ())])
+
+    def test_finds_leaves_of_checklist_under_path(self):
+        self.assertEqual(list(self.index.find('foo', TaskResultStatus.FAILURE, (0, ), leaves_only=True)),
+                         [IndexedResult('foo', (0, 1), self.failure)])
+        self.assertEqual([found.path for found in self.index.find('foo', path=(0, ))], [(0, ), (0, 0), (0, 1)])
+        self.assertEqual([found.path for found in self.index.find('foo', leaves_only=True)],
+                         [(0, 0), (0, 1), (1, ), (2, )])
+
+    def test_finds_nothing_for_unknown_checklist_or_path(self):
+        self.assertEqual(list(self.index.find('baz')), [])
+        self.assertEqual(list(self.index.find('foo', path=(5, ))), [])
+
+    def test_checklists_with_same_name_are_told_apart(self):
+        index = ResultIndex([('foo', self.foo), ('foo', self.bar), ('foo~2', self.failure)])
+
+        self.assertEqual(index.checklists, ['foo', 'foo~2', 'foo~2~2'])
+        self.assertIs(index.get('foo'), self.foo)
+        self.assertIs(index.get('foo~2'), self.bar)
+        self.assertIs(index.get('foo~2~2'), self.failure)
+
+    def test_parses_paths(self):
+        self.assertEqual(parse_path('/0/12'), (0, 12))
+        self.assertEqual(parse_path('0/12'), (0, 12))
+        self.assertEqual(parse_path('/'), ())
+        with self.assertRaises(ValueError):
+            parse_path('/foo')
@@ -53,6 +53,11 @@ class FallbackTaskResultStatusValidatorTest(unittest.TestCase):
         self.fallback.assert_called_once_with()
         self.assertEqual(result, "foo")
 
+    def test_is_settled_when_inner_validator_is_settled(self):
+        for is_settled in [True, False]:
+            self.inner_validator.is_settled.return_value = is_settled
+            self.assertEqual(self.validator.is_settled([TaskResultStatus.INFO]), is_settled)
+
 
 class AllOfSameTypeTaskResultStatusValidatorTest(unittest.TestCase):
 
@@ -81,6 +86,13 @@ class AllOfSameTypeTaskResultStatusValidatorTest(unittest.TestCase):
         result = self.validator.validate([TaskResultStatus.SUCCESS, TaskResultStatus.FAILURE, TaskResultStatus.INFO])
         self.assertEqual(result, TaskResultStatus.UNKNOWN)
 
+    def test_is_not_settled_while_all_results_are_the_same(self):
+        self.assertFalse(self.validator.is_settled([]))
+        self.assertFalse(self.validator.is_settled([TaskResultStatus.SUCCESS] * 3))
+
+    def test_is_settled_once_results_differ(self):
+        self.assertTrue(self.validator.is_settled([TaskResultStatus.SUCCESS, TaskResultStatus.INFO]))
+
 
 class MostCommonTaskResultStatusValidatorTask(unittest.TestCase):
 
@@ -114,6 +126,9 @@ class MostCommonTaskResultStatusValidatorTask(unittest.TestCase):
         result = self.validator.validate([TaskResultStatus.SUCCESS, TaskResultStatus.FAILURE, TaskResultStatus.INFO])
         self.assertEqual(result, TaskResultStatus.UNKNOWN)
 
+    def test_is_never_settled(self):
+        self.assertFalse(self.validator.is_settled([TaskResultStatus.SUCCESS] * 10))
+
 
 class AvailableStatusTaskResultStatusValidatorTest(unittest.TestCase):
 
@@ -145,6 +160,10 @@ class AvailableStatusTaskResultStatusValidatorTest(unittest.TestCase):
         result = self.validator.validate([TaskResultStatus.SUCCESS, TaskResultStatus.FAILURE])
         self.assertEqual(result, TaskResultStatus.UNKNOWN)
 
+    def test_is_settled_once_expected_status_is_available(self):
+        self.assertFalse(self.validator.is_settled([TaskResultStatus.SUCCESS]))
+        self.assertTrue(self.validator.is_settled([TaskResultStatus.SUCCESS, TaskResultStatus.INFO]))
+
 
 class AggregatedTaskResultStatusValidatorTest(unittest.TestCase):
 
@@ -216,6 +235,29 @@ class AggregatedTaskResultStatusValidatorTest(unittest.TestCase):
         self.validator2.validate.assert_called_once_with([])
         self.assertEqual(result, TaskResultStatus.UNKNOWN)
 
+    def test_is_not_settled_when_first_validator_is_not_settled(self):
+        self.validator1.is_settled.return_value = False
+        self.validator2.is_settled.return_value = True
+        self.validator2.validate.return_value = TaskResultStatus.INFO
+
+        self.assertFalse(self.validator.is_settled([]))
+
+    def test_is_settled_when_first_validator_is_settled_with_known_status(self):
+        self.validator1.is_settled.return_value = True
+        self.validator1.validate.return_value = TaskResultStatus.INFO
+        self.validator2.is_settled.return_value = False
+
+        self.assertTrue(self.validator.is_settled([]))
+
+    def test_is_settled_depends_on_next_validator_when_first_is_settled_with_UNKNOWN_status(self):
+        self.validator1.is_settled.return_value = True
+        self.validator1.validate.return_value = TaskResultStatus.UNKNOWN
+        self.validator2.validate.return_value = TaskResultStatus.INFO
+
+        for is_settled in [True, False]:
+            self.validator2.is_settled.return_value = is_settled
+            self.assertEqual(self.validator.is_settled([]), is_settled)
+
 
 class PrioritizedTaskResultStatusValidatorTest(unittest.TestCase):
 
@@ -267,6 +309,12 @@ class PrioritizedTaskResultStatusValidatorTest(unittest.TestCase):
         result = self.validator.validate(statuses)
         self.assertEqual(result, TaskResultStatus.UNKNOWN)
 
+    def test_is_settled_by_FAILURE(self):
+        self.assertTrue(self.validator.is_settled([TaskResultStatus.SUCCESS, TaskResultStatus.FAILURE]))
+
+    def test_is_not_settled_without_FAILURE(self):
+        self.assertFalse(self.validator.is_settled([TaskResultStatus.WARNING, TaskResultStatus.SUCCESS]))
+
 
 class DefaultTaskResultStatusValidatorTest(unittest.TestCase):
 
@@ -325,3 +373,10 @@ class DefaultTaskResultStatusValidatorTest(unittest.TestCase):
         random.shuffle(statuses)
         result = self.validator.validate(statuses)
         self.assertEqual(result, TaskResultStatus.UNKNOWN)
+
+    def test_is_settled_by_single_FAILURE(self):
+        self.assertTrue(self.validator.is_settled([TaskResultStatus.FAILURE]))
+
+    def test_is_not_settled_without_FAILURE(self):
+        self.assertFalse(self.validator.is_settled([TaskResultStatus.WARNING]))
+        self.assertFalse(self.validator.is_settled([TaskResultStatus.WARNING, TaskResultStatus.SUCCESS]))
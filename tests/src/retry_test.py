@@ -0,0 +1,115 @@
+import asyncio
+
+import asynctest
+
+from checklisting.deadline import deadline_scope
+from checklisting.result import TaskResult
+from checklisting.result.status import TaskResultStatus
+from checklisting.retry import RetryPolicy, TransientError
+
+
+class FlakyAttempt(object):
+
+    def __init__(self, *errors: Exception) -> None:
+        self.calls = 0
+        self._errors = list(errors)
+
+    async def __call__(self):
+        self.calls += 1
+        if self._errors:
+            raise self._errors.pop(0)
+        return TaskResult(TaskResultStatus.SUCCESS, 'done')
+
+
+class RetryPolicyTest(asynctest.TestCase):
+
+    def _policy(self, **kwargs):
+        kwargs.setdefault('backoff', 0.001)
+        return RetryPolicy(**kwargs)
+
+    async def test_returns_first_successful_result_with_retries_count(self):
+        attempt = FlakyAttempt(ConnectionResetError('reset'), OSError('dns'))
+
+        result = await self._policy().execute(attempt)
+
+        self.assertEqual(result, TaskResult(TaskResultStatus.SUCCESS, 'done'))
+        self.assertEqual(result.retries, 2)
+        self.assertEqual(attempt.calls, 3)
+
+    async def test_success_without_retries_is_returned_as_is(self):
+        result = await self._policy().execute(FlakyAttempt())
+
+        self.assertEqual(result.retries, 0)
+
+    async def test_gives_up_after_configured_attempts(self):
+        attempt = FlakyAttempt(*[OSError(f'error {idx}') for idx in range(5)])
+
+        result = await self._policy(attempts=2).execute(attempt)
+
+        self.assertEqual(result.status, TaskResultStatus.FAILURE)
+        self.assertEqual(result.message, 'error 1')
+        self.assertEqual(result.retries, 1)
+        self.assertEqual(attempt.calls, 2)
+
+    async def test_non_retryable_errors_are_not_retried(self):
+        attempt = FlakyAttempt(ValueError('bad'))
+
+        result = await self._policy().execute(attempt)
+
+        self.assertEqual(result.message, 'bad')
+        self.assertEqual(attempt.calls, 1)
+
+    async def test_retryable_errors_are_configurable(self):
+        attempt = FlakyAttempt(ValueError('bad'))
+
+        result = await self._policy(retryable=(ValueError, )).execute(attempt)
+
+        self.assertEqual(result.status, TaskResultStatus.SUCCESS)
+
+    async def test_result_of_transient_error_is_reported_once_retries_run_out(self):
+        failure = TaskResult(TaskResultStatus.FAILURE, 'unavailable')
+        attempt = FlakyAttempt(TransientError('503', failure), TransientError('503', failure))
+
+        result = await self._policy(attempts=2).execute(attempt)
+
+        self.assertEqual(result, failure)
+        self.assertEqual(result.retries, 1)
+
+    async def test_does_not_retry_beyond_budget(self):
+        attempt = FlakyAttempt(OSError('error'), OSError('error'))
+
+        result = await self._policy(backoff=1, jitter=0, budget=0.5).execute(attempt)
+
+        self.assertEqual(result.status, TaskResultStatus.FAILURE)
+        self.assertEqual(attempt.calls, 1)
+
+    async def test_does_not_retry_beyond_deadline(self):
+        attempt = FlakyAttempt(OSError('error'), OSError('error'))
+
+        with deadline_scope(0.5):
+            result = await self._policy(backoff=1, jitter=0).execute(attempt)
+
+        self.assertEqual(result.message, 'error')
+        self.assertEqual(attempt.calls, 1)
+
+    async def test_cancellation_is_not_retried(self):
+        attempt = FlakyAttempt(asyncio.CancelledError())
+
+        with self.assertRaises(asyncio.CancelledError):
+            await self._policy().execute(attempt)
+
+    def test_backoff_grows_exponentially_up_to_limit(self):
+        policy = RetryPolicy(backoff=0.1, multiplier=2, max_backoff=0.3, jitter=0)
+
+        self.assertEqual([policy.get_backoff(retry) for retry in (1, 2, 3, 4)], [0.1, 0.2, 0.3, 0.3])
+
+    def test_jitter_shortens_backoff(self):
+        policy = RetryPolicy(backoff=1, jitter=0.5, rand=lambda: 1.0)
+
+        self.assertEqual(policy.get_backoff(1), 0.5)
+
+    def test_of_dict(self):
+        policy = RetryPolicy.ofDict({'attempts': 5, 'backoff': 0, 'jitter': 0})
+
+        self.assertEqual(policy.attempts, 5)
+        self.assertEqual(policy.get_backoff(3), 0)
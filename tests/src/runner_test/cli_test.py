@@ -0,0 +1,91 @@
+import os
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+
+import mock
+
+from checklisting.lag import LoopLagMonitor, get_default_loop_lag_monitor, set_default_loop_lag_monitor
+from checklisting.provider import StaticChecklistsProvider
+from checklisting.result import TaskResult
+from checklisting.result.status import TaskResultStatus
+from checklisting.runner.cli import CliRunner
+from checklisting.task import BaseTask, Checklist
+
+
+class PidTask(BaseTask):
+
+    async def _execute(self):
+        return TaskResult(TaskResultStatus.INFO, str(os.getpid()))
+
+
+def _checklists(count):
+    return [Checklist(f'checklist{idx}', [PidTask()]) for idx in range(count)]
+
+
+def _messages(count):
+    return [f'Checklist [checklist{idx}]: Task completed. See subtasks for details.' for idx in range(count)]
+
+
+def _pid(checklist_result):
+    (task_result, ) = checklist_result.results
+    return int(task_result.message)
+
+
+class CliRunnerShardingTest(unittest.TestCase):
+
+    def setUp(self):
+        self._default_loop_lag_monitor = get_default_loop_lag_monitor()
+        set_default_loop_lag_monitor(None)
+
+    def tearDown(self):
+        set_default_loop_lag_monitor(self._default_loop_lag_monitor)
+
+    def _run_sharded(self, checklists, workers):
+        return CliRunner(StaticChecklistsProvider(checklists), workers=workers)._run_sharded(checklists)
+
+    def test_results_are_merged_back_in_order_of_checklists(self):
+        results = self._run_sharded(_checklists(5), 3)
+
+        self.assertEqual([result.message for result in results], _messages(5))
+        pids = [_pid(result) for result in results]
+        self.assertEqual(pids[0::3], [pids[0]] * 2)
+        self.assertEqual(pids[1::3], [pids[1]] * 2)
+        self.assertNotIn(os.getpid(), pids)
+
+    def test_workers_execute_checklists_of_parent(self):
+
+        class ReversingChecklistsProvider(StaticChecklistsProvider):
+
+            def get_all(self):
+                checklists = list(super().get_all())
+                self._checklists = checklists[::-1]
+                return checklists
+
+        checklists = _checklists(4)
+        runner = CliRunner(ReversingChecklistsProvider(checklists), workers=2)
+
+        results = runner._run_sharded(list(runner._checklists_provider.get_all()))
+
+        self.assertEqual([result.message for result in results], _messages(4))
+
+    def test_uses_no_more_workers_than_checklists(self):
+        with mock.patch('checklisting.runner.cli.ProcessPoolExecutor', wraps=ProcessPoolExecutor) as pool:
+            results = self._run_sharded(_checklists(2), 4)
+
+        self.assertEqual([result.message for result in results], _messages(2))
+        self.assertEqual(pool.call_args[0][0], 2)
+
+    def test_self_checks_of_workers_come_after_checklists(self):
+        set_default_loop_lag_monitor(LoopLagMonitor())
+
+        results = self._run_sharded(_checklists(3), 2)
+
+        self.assertEqual([result.message.split(':')[0] for result in results], [
+            'Checklist [checklist0]', 'Checklist [checklist1]', 'Checklist [checklist2]', 'Checklist [self-check]',
+            'Checklist [self-check]'
+        ])
+
+    def test_requires_fork_start_method(self):
+        with mock.patch('multiprocessing.get_context', side_effect=ValueError('cannot find context for fork')):
+            with self.assertRaises(RuntimeError):
+                self._run_sharded(_checklists(2), 2)
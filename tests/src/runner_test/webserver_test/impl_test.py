@@ -0,0 +1,81 @@
+import asyncio
+import json
+
+import asynctest
+from aiohttp import web
+from aiohttp.test_utils import TestClient, TestServer
+
+from checklisting.provider import StaticChecklistsProvider
+from checklisting.result import TaskResult
+from checklisting.result.status import TaskResultStatus
+from checklisting.runner.webserver.impl import ChecklistHttpHandler, ResultQueryHttpHandler
+from checklisting.task import Checklist
+from checklisting.tasks.static import StaticResultTask
+
+
+class ChecklistHttpHandlerTest(asynctest.TestCase):
+
+    async def setUp(self):
+        self.checklists = [
+            Checklist('foo', [StaticResultTask(TaskResult(TaskResultStatus.FAILURE, 'failure'))]),
+            Checklist('foo', [StaticResultTask(TaskResult(TaskResultStatus.SUCCESS, 'success'))])
+        ]
+        self.handler = ChecklistHttpHandler(StaticChecklistsProvider(self.checklists))
+        app = web.Application()
+        app.router.add_route('GET', '/', self.handler)
+        app.router.add_route('GET', '/results', ResultQueryHttpHandler(self.handler.get_index))
+        self.client = TestClient(TestServer(app), loop=self.loop)
+        await self.client.start_server()
+
+    async def tearDown(self):
+        await self.client.close()
+
+    async def _get_json(self, url, **params):
+        async with self.client.get(url, params=params) as response:
+            self.assertEqual(response.status, 200, await response.text())
+            return await response.json()
+
+    async def test_results_and_query_share_execution(self):
+        (run, runs, released) = (self.handler._run, [], asyncio.Event())
+
+        async def gated_run(timeout):
+            runs.append(timeout)
+            await released.wait()
+            return await run(timeout)
+
+        async def release():
+            await asyncio.sleep(0.1)
+            released.set()
+
+        with asynctest.patch.object(self.handler, '_run', gated_run):
+            (results, found, _) = await asyncio.gather(
+                self._get_json('/'), self._get_json('/results', status='failure', leaves='1'), release())
+
+        self.assertEqual(runs, [None])
+        self.assertEqual([result['status'] for result in results], ['FAILURE', 'SUCCESS'])
+        self.assertEqual([(result['checklist'], result['path']) for result in found], [('foo', [0])])
+
+    async def test_checklists_with_same_name_are_queried_apart(self):
+        (found, ) = await self._get_json('/results', checklist='foo~2', path='/0')
+
+        self.assertEqual(found['result']['status'], 'SUCCESS')
+
+    async def test_stream_reports_checklist_failing_to_stream(self):
+
+        class BrokenChecklist(Checklist):
+
+            async def execute_stream(self):
+                raise RuntimeError('broken')
+                yield
+
+        handler = ChecklistHttpHandler(StaticChecklistsProvider([BrokenChecklist('broken', []), self.checklists[1]]))
+        app = web.Application()
+        app.router.add_route('GET', '/', handler)
+        async with TestClient(TestServer(app), loop=self.loop) as client:
+            with self.assertLogs('checklisting.runner.web', 'ERROR') as logs:
+                async with client.get('/', params={'stream': '1'}) as response:
+                    lines = [json.loads(line) for line in (await response.text()).splitlines()]
+
+        self.assertEqual([line['checklist'] for line in lines], ['foo', 'foo', 'broken'])
+        self.assertEqual(lines[-1], {'checklist': 'broken', 'error': 'broken'})
+        self.assertIn('Streaming results of checklist [broken] failed', logs.output[0])
@@ -0,0 +1,146 @@
+import asyncio
+
+import asynctest
+
+from checklisting.result import TaskResult
+from checklisting.result.status import TaskResultStatus
+from checklisting.scheduler import BoundedTaskScheduler, set_process_max_concurrency
+from checklisting.task import (BaseTask, BaseTaskScheduler, Checklist, ConcurrentTaskScheduler, MultiTask,
+                               get_default_scheduler, set_default_scheduler)
+
+
+class ConcurrencyCounter(object):
+
+    def __init__(self) -> None:
+        self.current = 0
+        self.max = 0
+
+
+class SlowTask(BaseTask):
+
+    def __init__(self, counter: ConcurrencyCounter, message: str, delay: float = 0.01) -> None:
+        super().__init__()
+        self._counter = counter
+        self._message = message
+        self._delay = delay
+
+    async def _execute(self):
+        self._counter.current += 1
+        self._counter.max = max(self._counter.max, self._counter.current)
+        await asyncio.sleep(self._delay)
+        self._counter.current -= 1
+        return TaskResult(TaskResultStatus.SUCCESS, self._message)
+
+
+class BoundedTaskSchedulerTest(asynctest.TestCase):
+
+    def setUp(self):
+        self._default_scheduler = get_default_scheduler()
+        self._counter = ConcurrencyCounter()
+
+    def tearDown(self):
+        set_default_scheduler(self._default_scheduler)
+
+    def _tasks(self, count: int):
+        return [SlowTask(self._counter, str(idx)) for idx in range(count)]
+
+    async def test_limits_number_of_concurrently_executed_tasks(self):
+        scheduler = BoundedTaskScheduler(3)
+
+        await scheduler.run(self._tasks(10))
+
+        self.assertEqual(self._counter.max, 3)
+
+    async def test_keeps_results_order(self):
+        scheduler = BoundedTaskScheduler(2)
+        tasks = [SlowTask(self._counter, str(idx), 0.01 * (5 - idx)) for idx in range(5)]
+
+        results = await scheduler.run(tasks)
+
+        self.assertEqual([result.message for result in results], ['0', '1', '2', '3', '4'])
+
+    async def test_time_spent_waiting_for_slot_is_reported_as_queueing(self):
+        scheduler = BoundedTaskScheduler(1)
+        tasks = [SlowTask(self._counter, str(idx), 0.02) for idx in range(3)]
+
+        results = await scheduler.run(tasks)
+
+        self.assertLess(results[0].timing.queued, 0.01)
+        self.assertGreaterEqual(results[1].timing.queued, 0.015)
+        self.assertGreaterEqual(results[2].timing.queued, 0.035)
+
+    async def test_subtasks_of_queued_multi_task_report_own_queueing(self):
+        checklist = Checklist('test', [MultiTask(self._tasks(2))], scheduler=BoundedTaskScheduler(2))
+
+        result = await checklist.execute()
+
+        self.assertEqual(result.results[0].timing.queued, 0.0)
+        self.assertTrue(all(inner.timing.queued < 0.01 for inner in result.results[0].results))
+
+    async def test_limit_covers_nested_multi_tasks(self):
+        checklist = Checklist('test', [MultiTask(self._tasks(5)), MultiTask(self._tasks(5))],
+                              scheduler=BoundedTaskScheduler(2))
+
+        result = await checklist.execute()
+
+        self.assertEqual(result.status, TaskResultStatus.SUCCESS)
+        self.assertEqual(self._counter.max, 2)
+
+    async def test_nested_multi_tasks_do_not_hold_slots(self):
+        inner = MultiTask([MultiTask(self._tasks(2)), MultiTask(self._tasks(2))])
+        checklist = Checklist('test', [inner, MultiTask(self._tasks(2))], scheduler=BoundedTaskScheduler(1))
+
+        result = await asyncio.wait_for(checklist.execute(), 1)
+
+        self.assertEqual(result.status, TaskResultStatus.SUCCESS)
+        self.assertEqual(self._counter.max, 1)
+
+    async def test_delegates_to_process_wide_scheduler(self):
+        set_process_max_concurrency(2)
+        checklist = Checklist('test', self._tasks(10), scheduler=BoundedTaskScheduler(5))
+
+        await checklist.execute()
+
+        self.assertEqual(self._counter.max, 2)
+
+    async def test_delegates_to_given_inner_scheduler(self):
+        inner_scheduler = asynctest.mock.Mock(BaseTaskScheduler)
+        inner_scheduler.schedule.return_value = TaskResult(TaskResultStatus.INFO, 'inner')
+        task = SlowTask(self._counter, 'outer')
+
+        result = await BoundedTaskScheduler(1, inner_scheduler).schedule(task)
+
+        inner_scheduler.schedule.assert_called_once_with(task)
+        self.assertEqual(result.message, 'inner')
+
+    async def test_may_be_used_as_default_scheduler(self):
+        set_default_scheduler(BoundedTaskScheduler(4))
+
+        await MultiTask(self._tasks(10)).execute()
+
+        self.assertEqual(self._counter.max, 4)
+
+    def test_max_concurrency_must_be_positive(self):
+        with self.assertRaises(AssertionError):
+            BoundedTaskScheduler(0)
+
+
+class SetProcessMaxConcurrencyTest(asynctest.TestCase):
+
+    def setUp(self):
+        self._default_scheduler = get_default_scheduler()
+
+    def tearDown(self):
+        set_default_scheduler(self._default_scheduler)
+
+    def test_sets_bounded_default_scheduler(self):
+        set_process_max_concurrency(5)
+
+        scheduler = get_default_scheduler()
+        self.assertIsInstance(scheduler, BoundedTaskScheduler)
+        self.assertEqual(scheduler.max_concurrency, 5)
+
+    def test_missing_limit_sets_unbounded_default_scheduler(self):
+        set_process_max_concurrency(None)
+
+        self.assertIsInstance(get_default_scheduler(), ConcurrentTaskScheduler)
@@ -1,5 +1,5 @@
 import unittest
-from checklisting.result import TaskResult, MultiTaskResult
+from checklisting.result import TaskResult, MultiTaskResult, TaskTiming
 from checklisting.result.status import TaskResultStatus
 from checklisting.serializer.human import HumanReadableSerializer
 
@@ -74,3 +74,23 @@ class HumanReadableSerializerTest(unittest.TestCase):
         result = TaskResult(TaskResultStatus.UNKNOWN, msg)
 
         self.assertEqual(self.serializer.dumps(result), f'[UNKNOWN ] {msg}')
+
+    def test_duration_is_appended_when_timing_known(self):
+        result = TaskResult(TaskResultStatus.SUCCESS, 'msg', TaskTiming(10.0, 10.1234, 0.1234, 0.0))
+
+        self.assertEqual(self.serializer.dumps(result), '[SUCCESS ] msg (took 0.123s)')
+
+    def test_queueing_is_appended_when_task_was_queued(self):
+        result = TaskResult(TaskResultStatus.SUCCESS, 'msg', TaskTiming(10.0, 10.5, 0.5, 0.25))
+
+        self.assertEqual(self.serializer.dumps(result), '[SUCCESS ] msg (took 0.500s, queued 0.250s)')
+
+    def test_retries_are_appended_when_task_was_retried(self):
+        result = TaskResult(TaskResultStatus.SUCCESS, 'msg', TaskTiming(10.0, 10.5, 0.5, 0.0)).with_retries(2)
+
+        self.assertEqual(self.serializer.dumps(result), '[SUCCESS ] msg (took 0.500s, retried 2x)')
+
+    def test_throttling_is_appended_when_task_was_throttled(self):
+        result = TaskResult(TaskResultStatus.SUCCESS, 'msg', TaskTiming(10.0, 10.5, 0.5, 0.0, 0.2))
+
+        self.assertEqual(self.serializer.dumps(result), '[SUCCESS ] msg (took 0.500s, throttled 0.200s)')
@@ -1,7 +1,7 @@
 import unittest
 from typing import Any, Iterable, Mapping, Union
 
-from checklisting.result import BaseTaskResult, MultiTaskResult, TaskResult
+from checklisting.result import BaseTaskResult, LazyMessage, MultiTaskResult, TaskResult, TaskTiming
 from checklisting.result.status import TaskResultStatus
 from checklisting.serializer.json import JsonDeserializer, JsonSerializer, task_result_decoder
 
@@ -56,6 +56,31 @@ class JsonSerializerTest(unittest.TestCase):
             self.serializer.dumps(multi), f'{{"status": "FAILURE", "message": "{msg_multi}", "results": [' +
             f'{{"status": "SUCCESS", "message": "{msg1}"}}, {{"status": "INFO", "message": "{msg2}"}}]}}')
 
+    def test_messages_may_be_left_out_without_rendering_them(self):
+
+        class Value(object):
+
+            def __format__(self, format_spec):
+                raise AssertionError('rendered')
+
+        result = MultiTaskResult(TaskResultStatus.FAILURE, 'multi message', [
+            TaskResult(TaskResultStatus.SUCCESS, LazyMessage('{value}', value=Value()))])
+
+        self.assertEqual(JsonSerializer(messages=False).dumps(result),
+                         '{"status": "FAILURE", "results": [{"status": "SUCCESS"}]}')
+
+    def test_timing_result(self):
+        result = TaskResult(TaskResultStatus.SUCCESS, 'msg', TaskTiming(10.0, 10.5, 0.5, 0.25))
+
+        self.assertEqual(
+            self.serializer.dumps(result), '{"status": "SUCCESS", "message": "msg", "timing": ' +
+            '{"started_at": 10.0, "finished_at": 10.5, "duration": 0.5, "queued": 0.25, "throttled": 0.0}}')
+
+    def test_retried_result(self):
+        result = TaskResult(TaskResultStatus.SUCCESS, 'msg').with_retries(2)
+
+        self.assertEqual(self.serializer.dumps(result), '{"status": "SUCCESS", "message": "msg", "retries": 2}')
+
     def test_unsupported_type_result_in_exception(self):
 
         class UnsupportedClass(object):
@@ -99,6 +124,38 @@ class JsonDeserializerTest(unittest.TestCase):
                 ])
             ]))
 
+    def test_timing_is_restored(self) -> None:
+        result = MultiTaskResult(TaskResultStatus.SUCCESS, "success message", [
+            TaskResult(TaskResultStatus.INFO, "test message", TaskTiming(1.0, 3.0, 2.0, 0.0)),
+        ], TaskTiming(1.0, 4.0, 3.0, 1.0))
+
+        deserialized_result = self.deserializer.loads(self.serializer.dumps(result))
+
+        self.assertEqual(deserialized_result.timing, TaskTiming(1.0, 4.0, 3.0, 1.0))
+        self.assertEqual(deserialized_result.results[0].timing, TaskTiming(1.0, 3.0, 2.0, 0.0))
+
+    def test_retries_are_restored(self) -> None:
+        result = TaskResult(TaskResultStatus.SUCCESS, "test message").with_retries(3)
+
+        self.assertEqual(self.deserializer.loads(self.serializer.dumps(result)).retries, 3)
+
+    def test_timing_without_fields_added_later_is_restored(self) -> None:
+        result = self.deserializer.loads('{"status": "INFO", "message": "m", "timing": ' +
+                                         '{"started_at": 1.0, "finished_at": 2.0, "duration": 1.0, "queued": 0.0}}')
+
+        self.assertEqual(result.timing, TaskTiming(1.0, 2.0, 1.0, 0.0, 0.0))
+
+    def test_status_only_result_is_restored(self) -> None:
+        result = MultiTaskResult(TaskResultStatus.FAILURE, "failure message", [
+            TaskResult(TaskResultStatus.INFO, "test message", TaskTiming(1.0, 3.0, 2.0, 0.0)).with_retries(2),
+        ])
+
+        deserialized_result = self.deserializer.loads(JsonSerializer(messages=False).dumps(result))
+
+        self.assertEqual(deserialized_result, MultiTaskResult(TaskResultStatus.FAILURE, "", [
+            TaskResult(TaskResultStatus.INFO, "", TaskTiming(1.0, 3.0, 2.0, 0.0)).with_retries(2),
+        ]))
+
     def test_missing_message(self) -> None:
         input_dict = dict(a=1, status='FAILURE')
         serialized = self.serializer.dumps(input_dict)
@@ -0,0 +1,59 @@
+import asyncio
+
+import asynctest
+
+from checklisting.singleflight import SingleFlight
+
+
+class SingleFlightTest(asynctest.TestCase):
+
+    def setUp(self):
+        self.single_flight = SingleFlight()
+        self.calls = 0
+
+    async def _call(self, result: str = 'result', delay: float = 0.01) -> str:
+        self.calls += 1
+        await asyncio.sleep(delay)
+        return result
+
+    async def test_concurrent_calls_share_single_execution(self):
+        results = await asyncio.gather(*[self.single_flight.run('key', self._call) for _ in range(5)])
+
+        self.assertEqual(results, ['result'] * 5)
+        self.assertEqual(self.calls, 1)
+
+    async def test_calls_with_different_keys_are_executed_separately(self):
+        results = await asyncio.gather(
+            self.single_flight.run('key1', lambda: self._call('result1')),
+            self.single_flight.run('key2', lambda: self._call('result2')))
+
+        self.assertEqual(results, ['result1', 'result2'])
+        self.assertEqual(self.calls, 2)
+
+    async def test_subsequent_calls_are_executed_again(self):
+        await self.single_flight.run('key', self._call)
+        await self.single_flight.run('key', self._call)
+
+        self.assertEqual(self.calls, 2)
+        self.assertEqual(len(self.single_flight), 0)
+
+    async def test_exceptions_are_shared(self):
+
+        async def _fail():
+            await asyncio.sleep(0.01)
+            raise RuntimeError('foo')
+
+        results = await asyncio.gather(
+            self.single_flight.run('key', _fail), self.single_flight.run('key', _fail), return_exceptions=True)
+
+        self.assertEqual([str(result) for result in results], ['foo', 'foo'])
+        self.assertEqual(len(self.single_flight), 0)
+
+    async def test_cancelled_caller_does_not_cancel_call_for_others(self):
+        first = asyncio.ensure_future(self.single_flight.run('key', self._call))
+        second = asyncio.ensure_future(self.single_flight.run('key', self._call))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        self.assertEqual(await second, 'result')
+        self.assertEqual(self.calls, 1)
@@ -1,6 +1,9 @@
+import asyncio
+
 import mock
 import asynctest
-from checklisting.task import BaseTask, MultiTask, Checklist
+from checklisting.deadline import deadline_scope
+from checklisting.task import BaseTask, BaseTaskScheduler, MultiTask, Checklist, ConcurrentTaskScheduler
 from checklisting.result import TaskResult
 from checklisting.result.builder import MultiTaskResultBuilder
 from checklisting.result.status import TaskResultStatus
@@ -22,6 +25,79 @@ class BaseTaskTest(asynctest.TestCase):
         self.assertEqual(result.status, TaskResultStatus.FAILURE)
         self.assertEqual(result.message, "foo")
 
+    async def test_returns_failure_when_deadline_is_exceeded(self):
+
+        class SleepingTask(BaseTask):
+
+            async def _execute(self):
+                await asyncio.sleep(10)
+
+        with deadline_scope(0.01):
+            result = await SleepingTask().execute()
+
+        self.assertEqual(result.status, TaskResultStatus.FAILURE)
+        self.assertRegex(result.message, r'^Task \[SleepingTask\] timed out after \[0\.0\d\d\] seconds$')
+
+    async def test_exceeded_deadline_cancels_task(self):
+        cancelled = asyncio.Event()
+
+        class SleepingTask(BaseTask):
+
+            async def _execute(self):
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.set()
+                    raise
+
+        with deadline_scope(0.01):
+            await SleepingTask().execute()
+
+        self.assertTrue(cancelled.is_set())
+
+    async def test_cancellation_is_not_transformed_to_failure(self):
+
+        class CancelledTask(BaseTask):
+
+            async def _execute(self):
+                raise asyncio.CancelledError()
+
+        with self.assertRaises(asyncio.CancelledError):
+            await CancelledTask().execute()
+
+    async def test_result_carries_execution_timing(self):
+
+        class SleepingTask(BaseTask):
+
+            async def _execute(self):
+                await asyncio.sleep(0.02)
+                return TaskResult(TaskResultStatus.SUCCESS, 'done')
+
+        result = await SleepingTask().execute()
+
+        self.assertGreaterEqual(result.timing.duration, 0.02)
+        self.assertAlmostEqual(result.timing.finished_at - result.timing.started_at, result.timing.duration, 3)
+        self.assertEqual(result.timing.queued, 0.0)
+
+    async def test_timing_is_set_on_copy_of_returned_result(self):
+        shared_result = TaskResult(TaskResultStatus.SUCCESS, 'shared')
+
+        class SharedResultTask(BaseTask):
+
+            async def _execute(self):
+                return shared_result
+
+        result = await SharedResultTask().execute()
+
+        self.assertEqual(result, shared_result)
+        self.assertIsNotNone(result.timing)
+        self.assertIsNone(shared_result.timing)
+
+    async def test_failures_carry_execution_timing(self):
+        result = await self.task.execute()
+
+        self.assertIsNotNone(result.timing)
+
 
 class MultiTaskTest(asynctest.TestCase):
 
@@ -53,6 +129,149 @@ class MultiTaskTest(asynctest.TestCase):
         self.assertEqual(result.status, TaskResultStatus.SUCCESS)
         self.assertEqual(result.message, 'Task success.')
 
+    async def test_inner_tasks_are_executed_using_given_scheduler(self):
+        scheduler = asynctest.mock.Mock(BaseTaskScheduler)
+        scheduler.run.return_value = [self._result2, self._result1]
+        multi_task = MultiTask([self._task1, self._task2], self._result_builder, scheduler)
+
+        await multi_task.execute()
+
+        scheduler.run.assert_called_once_with([self._task1, self._task2])
+        self._result_builder.of_results.assert_called_once_with([self._result2, self._result1])
+
+    async def test_deadline_keeps_results_of_subtasks_finished_in_time(self):
+
+        class SleepingTask(BaseTask):
+
+            async def _execute(self):
+                await asyncio.sleep(10)
+
+        multi_task = MultiTask([self._task1, SleepingTask()], self._result_builder)
+        with deadline_scope(0.01):
+            await multi_task.execute()
+
+        self._result_builder.of_results.assert_called_once_with([self._result1, mock.ANY])
+        (_, timed_out_result) = self._result_builder.of_results.call_args[0][0]
+        self.assertEqual(timed_out_result.status, TaskResultStatus.FAILURE)
+
+    async def test_fail_fast_skips_pending_tasks_once_result_is_settled(self):
+
+        class SleepingTask(BaseTask):
+
+            async def _execute(self):
+                await asyncio.sleep(10)
+
+        failure = TaskResult(TaskResultStatus.FAILURE, 'failure')
+        self._task1.execute.return_value = failure
+        multi_task = MultiTask([SleepingTask(), self._task1, SleepingTask()], fail_fast=True)
+
+        result = await asyncio.wait_for(multi_task.execute(), 1)
+
+        self.assertEqual(result.status, TaskResultStatus.FAILURE)
+        (skipped1, received, skipped2) = result.results
+        self.assertIs(received, failure)
+        for skipped in [skipped1, skipped2]:
+            self.assertEqual(skipped.status, TaskResultStatus.UNKNOWN)
+            self.assertEqual(skipped.message, 'Task [SleepingTask] skipped, as result of its parent is already known')
+
+    async def test_fail_fast_waits_for_all_tasks_until_result_is_settled(self):
+        multi_task = MultiTask([self._task1, self._task2], self._result_builder, fail_fast=True)
+        self._result_builder.is_settled.return_value = False
+
+        await multi_task.execute()
+
+        self._result_builder.of_results.assert_called_once_with([self._result1, self._result2])
+
+    async def test_fail_fast_transforms_exceptions_to_failures(self):
+        self._task1.execute.side_effect = RuntimeError("foo")
+        multi_task = MultiTask([self._task1, self._task2], fail_fast=True)
+
+        result = await multi_task.execute()
+
+        self.assertEqual(result.status, TaskResultStatus.FAILURE)
+        self.assertEqual(result.message, "foo")
+
+    async def test_stream_yields_results_as_they_complete_with_aggregate_last(self):
+
+        class SleepingTask(BaseTask):
+
+            def __init__(self, delay, message):
+                super().__init__()
+                self._delay = delay
+                self._message = message
+
+            async def _execute(self):
+                await asyncio.sleep(self._delay)
+                return TaskResult(TaskResultStatus.SUCCESS, self._message)
+
+        multi_task = MultiTask([SleepingTask(0.03, 'slow'), MultiTask([SleepingTask(0.01, 'fast')])])
+
+        streamed = [(path, result.message) async for (path, result) in multi_task.execute_stream()]
+
+        self.assertEqual(streamed, [((1, 0), 'fast'), ((1, ), 'Task success.'), ((0, ), 'slow'),
+                                    ((), 'Task success.')])
+
+    async def test_stream_yields_same_results_as_execute(self):
+        streamed = [streamed async for streamed in self._multi_task.execute_stream()]
+
+        self.assertEqual([path for (path, _) in streamed], [(0, ), (1, ), ()])
+        self._result_builder.of_results.assert_called_once_with([self._result1, self._result2])
+        self.assertEqual(streamed[-1].result, self._result_builder.of_results.return_value.with_timing.return_value)
+
+    async def test_stream_executes_inner_tasks_using_run_of_given_scheduler(self):
+
+        class RecordingTaskScheduler(ConcurrentTaskScheduler):
+
+            def __init__(self):
+                super().__init__()
+                self.runs = []
+
+            async def run(self, tasks, schedule=None):
+                self.runs.append(list(tasks))
+                return await super().run(tasks, schedule)
+
+        scheduler = RecordingTaskScheduler()
+        multi_task = MultiTask([self._task1, self._task2], self._result_builder, scheduler)
+
+        streamed = [streamed async for streamed in multi_task.execute_stream()]
+
+        self.assertEqual(scheduler.runs, [[self._task1, self._task2]])
+        self.assertEqual([path for (path, _) in streamed], [(0, ), (1, ), ()])
+        self._result_builder.of_results.assert_called_once_with([self._result1, self._result2])
+
+    async def test_stream_yields_skipped_results_of_fail_fast(self):
+
+        class SleepingTask(BaseTask):
+
+            async def _execute(self):
+                await asyncio.sleep(10)
+
+        self._task1.execute.return_value = TaskResult(TaskResultStatus.FAILURE, 'failure')
+        multi_task = MultiTask([SleepingTask(), self._task1], fail_fast=True)
+
+        streamed = [(path, result.status) async for (path, result) in multi_task.execute_stream()]
+
+        self.assertEqual(streamed, [((1, ), TaskResultStatus.FAILURE), ((0, ), TaskResultStatus.UNKNOWN),
+                                    ((), TaskResultStatus.FAILURE)])
+
+    async def test_stream_cancels_execution_when_abandoned(self):
+        cancelled = asyncio.Event()
+
+        class SleepingTask(BaseTask):
+
+            async def _execute(self):
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.set()
+                    raise
+
+        stream = MultiTask([self._task1, SleepingTask()]).execute_stream()
+        self.assertEqual((await stream.__anext__()).path, (0, ))
+        await stream.aclose()
+
+        await asyncio.wait_for(cancelled.wait(), 1)
+
 
 class ChecklistTest(asynctest.TestCase):
 
@@ -0,0 +1,131 @@
+import asyncio
+import unittest
+
+import asynctest
+from helpers import CountingTask, FakeClock
+
+from checklisting.deadline import deadline_scope
+from checklisting.result import TaskResult
+from checklisting.result.status import TaskResultStatus
+from checklisting.task import MultiTask
+from checklisting.tasks.cache import CachedTask, TaskResultCache, get_default_cache
+
+
+class TaskResultCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.cache = TaskResultCache(2, self.clock)
+        self.result = TaskResult(TaskResultStatus.INFO, 'test')
+
+    def test_returns_None_for_missing_entry(self):
+        self.assertIsNone(self.cache.get('key'))
+
+    def test_returns_stored_result_before_it_expires(self):
+        self.cache.put('key', self.result, 10)
+        self.clock.now += 9
+
+        self.assertIs(self.cache.get('key'), self.result)
+
+    def test_expired_entries_are_removed(self):
+        self.cache.put('key', self.result, 10)
+        self.clock.now += 10
+
+        self.assertIsNone(self.cache.get('key'))
+        self.assertEqual(len(self.cache), 0)
+
+    def test_evicts_least_recently_used_entry_when_full(self):
+        self.cache.put('key1', self.result, 10)
+        self.cache.put('key2', self.result, 10)
+        self.cache.get('key1')
+        self.cache.put('key3', self.result, 10)
+
+        self.assertEqual(len(self.cache), 2)
+        self.assertIsNone(self.cache.get('key2'))
+        self.assertIs(self.cache.get('key1'), self.result)
+        self.assertIs(self.cache.get('key3'), self.result)
+
+    def test_clear_removes_all_entries(self):
+        self.cache.put('key', self.result, 10)
+        self.cache.clear()
+
+        self.assertEqual(len(self.cache), 0)
+
+    def test_max_size_must_be_positive(self):
+        with self.assertRaises(AssertionError):
+            TaskResultCache(0)
+
+
+class CachedTaskTest(asynctest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.cache = TaskResultCache(clock=self.clock)
+        self.inner_task = CountingTask()
+        self.task = CachedTask(self.inner_task, 10, self.cache)
+
+    async def test_reuses_result_within_ttl(self):
+        result1 = await self.task.execute()
+        self.clock.now += 5
+        result2 = await self.task.execute()
+
+        self.assertEqual(result1, result2)
+        self.assertEqual(self.inner_task.calls, 1)
+
+    async def test_executes_task_again_once_ttl_passes(self):
+        await self.task.execute()
+        self.clock.now += 10
+        result = await self.task.execute()
+
+        self.assertEqual(result.message, 'call 2')
+
+    async def test_tasks_sharing_key_share_result(self):
+        other_inner_task = CountingTask()
+        await CachedTask(self.inner_task, 10, self.cache, 'key').execute()
+        await CachedTask(other_inner_task, 10, self.cache, 'key').execute()
+
+        self.assertEqual(other_inner_task.calls, 0)
+
+    async def test_uses_default_cache(self):
+        task = CachedTask(self.inner_task, 10)
+        try:
+            await task.execute()
+
+            self.assertIsNotNone(get_default_cache().get(task))
+        finally:
+            get_default_cache().clear()
+
+    async def test_concurrent_misses_share_execution(self):
+        slow_task = CountingTask(delay=0.01)
+        task = CachedTask(slow_task, 10, self.cache)
+
+        results = await asyncio.gather(*[task.execute() for _ in range(3)])
+
+        self.assertEqual(slow_task.calls, 1)
+        self.assertEqual([result.message for result in results], ['call 1'] * 3)
+
+    async def test_result_is_not_cut_short_by_deadline_of_caller(self):
+        task = CachedTask(CountingTask(delay=0.05), 10, self.cache)
+
+        with deadline_scope(0.01):
+            timed_out = await task.execute()
+        result = await task.execute()
+
+        self.assertRegex(timed_out.message, r'^Task \[CachedTask\] timed out')
+        self.assertEqual(result.status, TaskResultStatus.INFO)
+        self.assertEqual(result.message, 'call 1')
+
+    async def test_refresh_is_bounded_by_timeout(self):
+        task = CachedTask(CountingTask(delay=10), 10, self.cache, timeout=0.01)
+
+        result = await asyncio.wait_for(task.execute(), 1)
+
+        self.assertEqual(result.status, TaskResultStatus.FAILURE)
+
+    def test_is_composite_when_wrapped_task_is(self):
+        self.assertFalse(self.task.is_composite)
+        self.assertTrue(CachedTask(MultiTask([]), 10).is_composite)
+
+    def test_ttl_must_be_positive(self):
+        with self.assertRaises(AssertionError):
+            CachedTask(self.inner_task, 0)
@@ -1,10 +1,13 @@
+import os
 import pathlib
+import tempfile
 import unittest
 
 import asynctest
 import mock
 
-from checklisting.result import BaseTaskResult
+from checklisting.blocking import ProcessPoolTaskExecutor
+from checklisting.result import BaseTaskResult, TaskResult
 from checklisting.result.builder import MultiTaskResultBuilder
 from checklisting.result.status import TaskResultStatus
 from checklisting.tasks.file import (BaseFileContentValidator, BaseLineValidator, FileContentTask,
@@ -46,7 +49,44 @@ class FileContentTaskTest(asynctest.TestCase):
 
         self._path.exists.assert_called_once_with()
         mock_open.assert_called_once_with(self._path, 'r', 1)
-        self.assertIs(result, self._result)
+        self.assertIs(result, self._result.with_timing.return_value)
+
+
+class PidLineValidator(BaseLineValidator):
+
+    def validate(self, line):
+        return TaskResult(TaskResultStatus.INFO, f'{line}:{os.getpid()}')
+
+
+class FileContentTaskInProcessPoolTest(asynctest.TestCase):
+
+    def setUp(self):
+        self._file = tempfile.NamedTemporaryFile('w', suffix='.log')
+        self._file.write('line1\nline2\n')
+        self._file.flush()
+        self._executor = ProcessPoolTaskExecutor(1)
+
+    def tearDown(self):
+        self._executor.shutdown()
+        self._file.close()
+
+    async def test_file_is_validated_in_worker_process(self):
+        task = FileContentTask(pathlib.Path(self._file.name), PerLineFileContentValidator(PidLineValidator()),
+                               validation_executor=self._executor)
+        result = await task.execute()
+
+        messages = [sub_result.message for sub_result in result.results]
+        self.assertEqual([message.split(':')[0] for message in messages], ['line1', 'line2'])
+        self.assertNotIn(str(os.getpid()), [message.split(':')[1] for message in messages])
+
+    async def test_missing_file_is_reported_by_worker_process(self):
+        task = FileContentTask(pathlib.Path(self._file.name + '.missing'),
+                               PerLineFileContentValidator(PidLineValidator()),
+                               validation_executor=self._executor)
+        result = await task.execute()
+
+        self.assertEqual(result.status, TaskResultStatus.FAILURE)
+        self.assertEqual(result.message, f'File [{self._file.name}.missing] does not exist')
 
 
 class PerLineFileContentValidatorTest(unittest.TestCase):
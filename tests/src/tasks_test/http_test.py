@@ -6,6 +6,7 @@ import asynctest
 import mock
 
 from checklisting.result.status import TaskResultStatus
+from checklisting.retry import RetryPolicy
 from checklisting.tasks.http import (HttpMethod, HttpTask,
                                      SimpleHttpTaskResponseValidator)
 from checklisting.testing import setup_tcp_server
@@ -67,6 +68,33 @@ Connection: close
 
         self.assertEqual(result1, result2)
 
+    async def test_unavailable_service_is_retried_when_retry_policy_given(self):
+        responses = [b'HTTP/1.1 503 Service Unavailable\r\nContent-Length: 0\r\nConnection: close\r\n\r\n',
+                     b'HTTP/1.1 200 OK\r\nContent-Length: 0\r\nConnection: close\r\n\r\n']
+
+        async def _respond(reader: asyncio.StreamReader) -> bytes:
+            return responses.pop(0)
+
+        (host, port) = await setup_tcp_server(self.loop, _respond)
+        url = f'http://{host}:{port}/'
+
+        task = HttpTask(HttpMethod.GET, url, retry_policy=RetryPolicy(backoff=0.001))
+        result = await task.execute()
+
+        self.assertEqual(result.status, TaskResultStatus.SUCCESS)
+        self.assertEqual(result.retries, 1)
+
+    async def test_validator_result_is_returned_once_retries_run_out(self):
+        response = b'HTTP/1.1 503 Service Unavailable\r\nContent-Length: 0\r\nConnection: close\r\n\r\n'
+        (host, port) = await setup_tcp_server(self.loop, respond(response))
+        url = f'http://{host}:{port}/'
+
+        task = HttpTask(HttpMethod.GET, url, retry_policy=RetryPolicy(attempts=2, backoff=0.001))
+        result = await task.execute()
+
+        self.assertEqual(result.status, TaskResultStatus.FAILURE)
+        self.assertEqual(result.message, f'Request to [{url}] failed')
+        self.assertEqual(result.retries, 1)
 
 
 class SimpleHttpTaskResponseValidatorTest(asynctest.TestCase):
@@ -0,0 +1,75 @@
+import asyncio
+
+import asynctest
+from helpers import CountingTask
+
+from checklisting.task import Checklist
+from checklisting.tasks.periodic import PeriodicTask, set_default_background_execution
+
+
+class PeriodicTaskTest(asynctest.TestCase):
+
+    def setUp(self):
+        self.inner_task = CountingTask()
+        self.task = PeriodicTask(self.inner_task, 0.02, background=True)
+
+    async def tearDown(self):
+        await self.task._executor.stop()
+
+    async def test_returns_latest_result_of_background_execution(self):
+        result1 = await self.task.execute()
+        result2 = await self.task.execute()
+        await asyncio.sleep(0.05)
+        result3 = await self.task.execute()
+
+        self.assertEqual(result1.message, 'call 1')
+        self.assertEqual(result1, result2)
+        self.assertNotEqual(result3.message, 'call 1')
+
+    def test_is_composite(self):
+        self.assertTrue(self.task.is_composite)
+
+    async def test_background_execution_does_not_stream_into_request_that_started_it(self):
+        inner_task = CountingTask()
+        task = PeriodicTask(Checklist('inner', [inner_task]), 0.01, background=True)
+        streamed = []
+
+        await Checklist('outer', [task])._execute_streamed(streamed.append)
+        streamed_count = len(streamed)
+        await asyncio.sleep(0.05)
+        await task._executor.stop()
+
+        self.assertGreater(inner_task.calls, 2)
+        self.assertEqual(len(streamed), streamed_count)
+
+
+class OneShotPeriodicTaskTest(asynctest.TestCase):
+
+    def setUp(self):
+        self.inner_task = CountingTask()
+        self.task = PeriodicTask(self.inner_task, 0.02)
+
+    async def test_leaves_nothing_running_in_background_by_default(self):
+        result = await self.task.execute()
+
+        self.assertEqual(result.message, 'call 1')
+        self.assertFalse(self.task._executor.is_running)
+
+    async def test_executes_wrapped_task_once_result_is_older_than_interval(self):
+        result1 = await self.task.execute()
+        result2 = await self.task.execute()
+        await asyncio.sleep(0.03)
+        result3 = await self.task.execute()
+
+        self.assertEqual(result1, result2)
+        self.assertEqual(result3.message, 'call 2')
+        self.assertEqual(self.inner_task.calls, 2)
+
+    async def test_background_execution_can_be_enabled_by_default(self):
+        set_default_background_execution(True)
+        try:
+            await self.task.execute()
+            self.assertTrue(self.task._executor.is_running)
+        finally:
+            set_default_background_execution(False)
+            await self.task._executor.stop()
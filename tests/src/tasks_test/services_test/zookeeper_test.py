@@ -1,4 +1,5 @@
 import asyncio
+import socket
 import unittest
 from typing import Awaitable, Callable
 
@@ -225,3 +226,18 @@ class ZookeeperTaskTest(asynctest.TestCase):
                 )
             ]
         )
+
+    async def test_mntr_is_skipped_when_ruok_fails(self) -> None:
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+            (host, port) = sock.getsockname()
+
+        task = ZookeeperTask(host, port)
+        result = await task.execute()
+
+        self.assertEqual(result.status, TaskResultStatus.FAILURE)
+        (ruok_result, mntr_result) = result.results
+        self.assertEqual(ruok_result.status, TaskResultStatus.FAILURE)
+        self.assertEqual(mntr_result.status, TaskResultStatus.UNKNOWN)
+        self.assertEqual(mntr_result.message,
+                         'Task [SocketTask] skipped, as its prerequisite [SocketTask] was not satisfied')
@@ -1,10 +1,13 @@
+import socket
 import unittest
 from typing import Iterator, List, Optional, Tuple
 
 import asynctest
 
+from checklisting.blocking import ProcessPoolTaskExecutor
 from checklisting.result import BaseTaskResult, TaskResult
 from checklisting.result.status import TaskResultStatus
+from checklisting.retry import RetryPolicy
 from checklisting.tasks.socket import (BaseSocketTaskResponseValidator,
                                        SimpleSocketTaskResponseValidator,
                                        SocketTask)
@@ -70,7 +73,7 @@ class SocketTaskTest(asynctest.TestCase):
         self.assertEqual(result.status, TaskResultStatus.INFO)
         self.assertEqual(len(result.results), 1)
 
-        sub_result = result.results.pop()
+        sub_result = result.results[-1]
         self.assertEqual(sub_result.status, TaskResultStatus.INFO)
         self.assertEqual(sub_result.message, 'test_request')
 
@@ -82,3 +85,27 @@ class SocketTaskTest(asynctest.TestCase):
 
         self.assertEqual(result.status, TaskResultStatus.INFO)
         self.assertEqual(len(result.results), 3)
+
+    async def test_validation_in_process_pool(self) -> None:
+        (host, port) = await setup_tcp_server(self.loop)
+        executor = ProcessPoolTaskExecutor(1)
+
+        task = SocketTask(b'line1\nline2', host, port, validation_executor=executor)
+        try:
+            result = await task.execute()
+        finally:
+            executor.shutdown()
+
+        self.assertEqual(result.status, TaskResultStatus.INFO)
+        self.assertEqual([sub_result.message for sub_result in result.results], ['line1', 'line2'])
+
+    async def test_refused_connection_is_retried_when_retry_policy_given(self) -> None:
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+            port = sock.getsockname()[1]
+
+        task = SocketTask(b'test_request', '127.0.0.1', port, retry_policy=RetryPolicy(attempts=3, backoff=0.001))
+        result = await task.execute()
+
+        self.assertEqual(result.status, TaskResultStatus.FAILURE)
+        self.assertEqual(result.retries, 2)
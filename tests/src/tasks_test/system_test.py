@@ -164,7 +164,7 @@ class CPUInfoTaskTest(asynctest.TestCase):
 
     async def test_properly_calls_validator(self):  # type: ignore
         result = await self.task.execute()
-        self.assertIs(result, self.result)
+        self.assertIs(result, self.result.with_timing.return_value)
         self.validator.validate.assert_called_once_with(self.interval, CheckType(Iterable), CheckType(float),
                                                         CheckType(float), CheckType(float), CheckType(int),
                                                         CheckType(int))
@@ -244,7 +244,7 @@ class DiskInfoValidatorTest(unittest.TestCase):
         self.assertEqual(result.status, TaskResultStatus.FAILURE)
         self.assertEqual(len(result.results), 1)
 
-        inner_result = result.results.pop()
+        inner_result = result.results[-1]
 
         self.assertEqual(inner_result.status, TaskResultStatus.FAILURE)
         self.assertEqual(
@@ -260,7 +260,7 @@ class DiskInfoValidatorTest(unittest.TestCase):
         self.assertEqual(result.status, TaskResultStatus.SUCCESS)
         self.assertEqual(len(result.results), 1)
 
-        inner_result = result.results.pop()
+        inner_result = result.results[-1]
 
         self.assertEqual(inner_result.status, TaskResultStatus.SUCCESS)
         self.assertEqual(
@@ -276,7 +276,7 @@ class DiskInfoValidatorTest(unittest.TestCase):
         self.assertEqual(result.status, TaskResultStatus.WARNING)
         self.assertEqual(len(result.results), 1)
 
-        inner_result = result.results.pop()
+        inner_result = result.results[-1]
 
         self.assertEqual(inner_result.status, TaskResultStatus.WARNING)
         self.assertEqual(
@@ -0,0 +1,53 @@
+import asyncio
+
+import asynctest
+
+from checklisting.deadline import deadline_scope
+from checklisting.result import TaskResult
+from checklisting.result.status import TaskResultStatus
+from checklisting.task import BaseTask, MultiTask
+from checklisting.tasks.static import StaticResultTask
+from checklisting.tasks.timeout import TimeoutTask
+
+
+class SleepingTask(BaseTask):
+
+    def __init__(self, delay: float) -> None:
+        super().__init__()
+        self._delay = delay
+
+    async def _execute(self):
+        await asyncio.sleep(self._delay)
+        return TaskResult(TaskResultStatus.SUCCESS, 'done')
+
+
+class TimeoutTaskTest(asynctest.TestCase):
+
+    async def test_returns_inner_task_result_when_in_time(self):
+        result = TaskResult(TaskResultStatus.INFO, 'test')
+
+        self.assertEqual(await TimeoutTask(StaticResultTask(result), 1).execute(), result)
+
+    async def test_returns_failure_on_timeout(self):
+        result = await TimeoutTask(SleepingTask(10), 0.01).execute()
+
+        self.assertEqual(result.status, TaskResultStatus.FAILURE)
+        self.assertRegex(result.message, r'^Task \[SleepingTask\] timed out after \[0\.0\d\d\] seconds$')
+
+    async def test_does_not_extend_outer_deadline(self):
+        with deadline_scope(0.01):
+            result = await TimeoutTask(SleepingTask(10), 10).execute()
+
+        self.assertEqual(result.status, TaskResultStatus.FAILURE)
+
+    async def test_limits_whole_subtree(self):
+        task = TimeoutTask(MultiTask([SleepingTask(0), SleepingTask(10)]), 0.05)
+
+        result = await asyncio.wait_for(task.execute(), 1)
+
+        self.assertEqual(result.status, TaskResultStatus.FAILURE)
+        self.assertEqual([r.status for r in result.results], [TaskResultStatus.SUCCESS, TaskResultStatus.FAILURE])
+
+    def test_timeout_must_be_positive(self):
+        with self.assertRaises(AssertionError):
+            TimeoutTask(SleepingTask(0), 0)